@@ -0,0 +1,11 @@
+"""
+Latency and throughput benchmarks for clear_core and the gantry demo.
+
+Every benchmark runs against a local ClearCoreSimulator, so no hardware is
+needed. Run the whole suite and write the results to a JSON file with:
+
+    python -m benchmarks --output results.json
+
+Compare the JSON files of two runs to see whether a change made the
+command path or the control loop faster.
+"""
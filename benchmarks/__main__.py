@@ -0,0 +1,70 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from clear_core import ClearCoreController, LoopbackTransport, TcpTransport
+from clear_core.simulator import ClearCoreSimulator
+
+from . import commands, loops
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark clear_core commands and the gantry loop.")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write.")
+    parser.add_argument("--iterations", type=int, default=500, help="Samples per measurement.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated one-way response delay in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Simulated maximum extra delay in seconds.")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64],
+                        help="Pipeline depths for the throughput benchmark.")
+    parser.add_argument("--transport", choices=["tcp", "loopback"], default="tcp",
+                        help="Talk to the simulator over TCP, or call it in-process to measure "
+                             "the command layer alone (latency and jitter are then ignored).")
+    parser.add_argument("--skip-gantry", action="store_true",
+                        help="Skip the gantry control loop benchmark.")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "latency_s": args.latency,
+            "jitter_s": args.jitter,
+            "transport": args.transport,
+        },
+    }
+
+    with ClearCoreSimulator(latency=args.latency, jitter=args.jitter) as simulator:
+        if args.transport == "loopback":
+            transport = LoopbackTransport(simulator.handle)
+        else:
+            transport = TcpTransport(*simulator.address)
+        with ClearCoreController(transport=transport) as cc:
+            print("Measuring per-command latency...")
+            results["commands"] = commands.command_latency(cc, args.iterations)
+            print("Measuring pipelined throughput...")
+            results["pipeline"] = commands.pipeline_throughput(cc, args.depths, args.iterations * 4)
+            print("Measuring control loop ticks...")
+            results["ticks"] = {
+                "update_hatch": loops.update_hatch_tick(cc, args.iterations),
+                "hatch_controller": loops.hatch_controller_tick(cc, args.iterations),
+            }
+            if not args.skip_gantry:
+                results["ticks"]["gantry"] = loops.gantry_tick(cc, args.iterations)
+                results["ticks"]["gantry_telemetry"] = loops.gantry_tick(cc, args.iterations, telemetry_hz=60)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for name, summary in results["commands"].items():
+        print(f"{name:<18} p50 {summary['p50_us']:9.1f} us   p99 {summary['p99_us']:9.1f} us")
+    for depth, summary in results["pipeline"].items():
+        print(f"depth {depth:<12} {summary['commands_per_sec']:12.0f} commands/s")
+    for name, summary in results["ticks"].items():
+        print(f"{name:<18} p50 {summary['p50_us']:9.1f} us   p99 {summary['p99_us']:9.1f} us")
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
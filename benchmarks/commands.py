@@ -0,0 +1,60 @@
+from typing import Any, Callable, Dict, Iterable
+
+from clear_core import ClearCoreController
+
+from .stats import summarize, time_calls
+
+MOTOR_ID = 1
+PIN_ID = 0
+
+def _command_table(cc: ClearCoreController) -> Dict[str, Callable[[], Any]]:
+    """One representative call for every MotorControl and IOControl command."""
+    motors, io = cc.motors, cc.io
+    return {
+        "enable": lambda: motors.enable(MOTOR_ID),
+        "disable": lambda: motors.disable(MOTOR_ID),
+        "clear_alerts": lambda: motors.clear_alerts(MOTOR_ID),
+        "absolute_move": lambda: motors.absolute_move(MOTOR_ID, 0),
+        "relative_move": lambda: motors.relative_move(MOTOR_ID, 0),
+        "abrupt_stop": lambda: motors.abrupt_stop(MOTOR_ID),
+        "get_position": lambda: motors.get_position(MOTOR_ID),
+        "get_status": lambda: motors.get_status(MOTOR_ID),
+        "set_velocity": lambda: motors.set_velocity(MOTOR_ID, 10000),
+        "set_acceleration": lambda: motors.set_acceleration(MOTOR_ID, 100000),
+        "set_deceleration": lambda: motors.set_deceleration(MOTOR_ID, 100000),
+        "set_output_pin": lambda: io.set_output_pin(PIN_ID, False),
+        "read_input_pin": lambda: io.read_input_pin(PIN_ID),
+    }
+
+def command_latency(cc: ClearCoreController, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Measures the round-trip latency of every command, one command at a time."""
+    return {
+        name: summarize(time_calls(call, iterations))
+        for name, call in _command_table(cc).items()
+    }
+
+def pipeline_throughput(cc: ClearCoreController, depths: Iterable[int], commands: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measures commands per second when `depth` commands are sent per exchange.
+
+    Depth 1 is the plain blocking call; larger depths use CommandBatch.
+    """
+    results = {}
+    for depth in depths:
+        exchanges = max(commands // depth, 1)
+
+        def exchange():
+            if depth == 1:
+                cc.motors.get_position(MOTOR_ID)
+                return
+            with cc.batch() as batch:
+                for _ in range(depth):
+                    batch.motors.get_position(MOTOR_ID)
+
+        samples = time_calls(exchange, exchanges)
+        elapsed = sum(samples) / 1e9
+        results[str(depth)] = {
+            "commands_per_sec": exchanges * depth / elapsed,
+            "exchange": summarize(samples),
+        }
+    return results
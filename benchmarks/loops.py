@@ -0,0 +1,60 @@
+import itertools
+from typing import Dict, List, Optional, Sequence
+
+from clear_core import ClearCoreController
+from demo_gantry import hatch
+from demo_gantry.main import GANTRY_ID, LOOP_RATE_HZ, control_tick
+from gc_controller import GameCubeController
+
+from .stats import summarize, time_calls
+
+# Raw 8-byte controller packets: stick centred, nothing pressed; then A held
+# with the stick pushed left and right.
+IDLE_PACKET = [128, 128, 128, 128, 0, 0x08, 0x00, 0]
+A_LEFT_PACKET = [0, 128, 128, 128, 0, 0x48, 0x00, 0]
+A_RIGHT_PACKET = [255, 128, 128, 128, 0, 0x48, 0x00, 0]
+
+class ScriptedHidDevice:
+    """Stands in for an open hid.device, returning scripted packets in a loop."""
+    def __init__(self, packets: Sequence[List[int]]):
+        self._packets = itertools.cycle(packets)
+
+    def read(self, size: int, timeout_ms: int = 0) -> List[int]:
+        return next(self._packets)
+
+    def close(self) -> None:
+        pass
+
+def update_hatch_tick(cc: ClearCoreController, iterations: int) -> Dict[str, float]:
+    """Measures the duration of one `update_hatch` call."""
+    return summarize(time_calls(lambda: hatch.update_hatch(cc), iterations))
+
+def hatch_controller_tick(cc: ClearCoreController, iterations: int) -> Dict[str, float]:
+    """Measures the duration of one `HatchController.update` call."""
+    controller = hatch.HatchController(cc)
+    return summarize(time_calls(controller.update, iterations))
+
+def gantry_tick(cc: ClearCoreController, iterations: int, telemetry_hz: Optional[float] = None) -> Dict[str, float]:
+    """
+    Measures the duration of one `demo_gantry.main.control_tick` call with new
+    controller input on every tick.
+
+    Args:
+        cc: A connected controller.
+        iterations: Number of ticks to time.
+        telemetry_hz: If set, position and status are served by a telemetry
+                      poller running at this rate, as in the demo.
+    """
+    gc = GameCubeController()
+    gc._hid_device = ScriptedHidDevice([IDLE_PACKET, A_LEFT_PACKET, A_RIGHT_PACKET])
+
+    if telemetry_hz:
+        cc.start_telemetry(motors=[GANTRY_ID, hatch.HATCH_MOTOR_ID],
+                           pins=[hatch.PE_SENSOR_ID, hatch.OPEN_SENSOR_ID, hatch.CLOSE_SENSOR_ID],
+                           rate_hz=telemetry_hz)
+    hatch_controller = hatch.HatchController(cc)
+    try:
+        with cc.motors.stream(GANTRY_ID, rate_hz=LOOP_RATE_HZ) as jog:
+            return summarize(time_calls(lambda: control_tick(cc, gc, hatch_controller, jog), iterations))
+    finally:
+        cc.stop_telemetry()
@@ -0,0 +1,44 @@
+import time
+from typing import Callable, Dict, List
+
+def summarize(samples_ns: List[int]) -> Dict[str, float]:
+    """
+    Summarizes latency samples.
+
+    Args:
+        samples_ns: Durations in nanoseconds.
+
+    Returns:
+        Count, mean, min, max and p50/p90/p99 percentiles, in microseconds.
+    """
+    if not samples_ns:
+        return {"count": 0}
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+
+    def percentile(p: float) -> float:
+        # Nearest-rank percentile.
+        rank = max(int(round(p / 100 * count + 0.5)) - 1, 0)
+        return ordered[min(rank, count - 1)] / 1000
+
+    return {
+        "count": count,
+        "mean_us": sum(ordered) / count / 1000,
+        "min_us": ordered[0] / 1000,
+        "p50_us": percentile(50),
+        "p90_us": percentile(90),
+        "p99_us": percentile(99),
+        "max_us": ordered[-1] / 1000,
+    }
+
+def time_calls(function: Callable[[], object], iterations: int, warmup: int = 10) -> List[int]:
+    """Calls `function` repeatedly and returns the duration of each call in nanoseconds."""
+    for _ in range(warmup):
+        function()
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(iterations):
+        start = clock()
+        function()
+        samples.append(clock() - start)
+    return samples
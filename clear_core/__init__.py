@@ -1,5 +1,15 @@
 # clear_core/__init__.py
 from .controller import ClearCoreController
+from .batch import CommandBatch, PendingResponse
+from .aio import AsyncClearCoreController
+from .telemetry import TelemetryPoller
+from .fleet import ClearCoreFleet, FleetResult
+from .metrics import CommandMetrics, CommandTrace, LatencyHistogram
+from .io import InputPins
+from .motors import AxisMove, MultiAxisAck, Status
+from .transport import LoopbackTransport, TcpTransport, Transport, UnixTransport
+from .coalescing import CoalescingMotorControl
+from .streaming import MotionStream, Setpoint, StreamMode, StreamStats
 
 """
 ClearCore Controller Package
@@ -8,4 +18,28 @@ This package provides a client for interacting with a ClearCore motor controller
 The main entry point is the ClearCoreController class.
 """
 
-__all__ = ["ClearCoreController"]
+__all__ = [
+    "ClearCoreController",
+    "AsyncClearCoreController",
+    "CommandBatch",
+    "PendingResponse",
+    "TelemetryPoller",
+    "ClearCoreFleet",
+    "FleetResult",
+    "CommandMetrics",
+    "CommandTrace",
+    "LatencyHistogram",
+    "InputPins",
+    "AxisMove",
+    "MultiAxisAck",
+    "Status",
+    "Transport",
+    "TcpTransport",
+    "UnixTransport",
+    "LoopbackTransport",
+    "CoalescingMotorControl",
+    "MotionStream",
+    "Setpoint",
+    "StreamMode",
+    "StreamStats",
+]
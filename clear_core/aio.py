@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+from .motors import MotorControl
+from .io import IOControl
+from .protocol import Frame, FrameReader, decode_text, encode_command
+
+# Bytes the connection may buffer before a new command waits for them to be sent.
+_WRITE_HIGH_WATER = 64 * 1024
+
+class AsyncClearCoreController:
+    """
+    asyncio client for the ClearCore motor controller.
+
+    This is the event-loop counterpart of ClearCoreController and exposes the
+    same `motors` and `io` surface, except that every command method returns
+    an awaitable:
+
+        async with AsyncClearCoreController(host, port) as cc:
+            await cc.motors.enable(1)
+            position, status = await asyncio.gather(
+                cc.motors.get_position(1), cc.motors.get_status(1))
+
+    A command is written to the connection as soon as its method is called,
+    so any number of commands can be in flight at once. The controller answers
+    in order, and a single background task matches each response to the
+    oldest outstanding command.
+
+    If a response does not arrive within `read_timeout`, the connection is
+    closed and every outstanding command fails, since later responses could
+    no longer be matched to their commands. While the connection's send
+    buffer is full, new commands are still written but their awaitables
+    first wait for it to drain.
+    """
+    def __init__(self, host: str, port: int, read_timeout: Optional[float] = 2.0):
+        """
+        Initializes the AsyncClearCoreController class.
+
+        Args:
+            host: The controller's IP address or hostname.
+            port: The controller's TCP port.
+            read_timeout: Seconds to wait for a response, or None to wait forever.
+        """
+        self.host = host
+        self.port = port
+        self.read_timeout = read_timeout
+        self._stream_reader: Optional[asyncio.StreamReader] = None
+        self._stream_writer: Optional[asyncio.StreamWriter] = None
+        self._response_task: Optional[asyncio.Task] = None
+        self._frames = FrameReader()
+        # Outstanding commands, oldest first, with the parser for their response
+        # and the time.monotonic() by which it must arrive.
+        self._in_flight: Deque[Tuple[asyncio.Future, Optional[Callable[[Frame], Any]], float]] = deque()
+        # Checks the oldest outstanding command's deadline; armed while commands are outstanding.
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+
+        self.motors = MotorControl(self)
+        self.io = IOControl(self)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of commands sent that have not been answered yet."""
+        return len(self._in_flight)
+
+    async def connect(self):
+        """Establishes the connection to the controller."""
+        if self._stream_writer is not None:
+            # Avoid reconnecting if already connected
+            return
+        try:
+            self._stream_reader, self._stream_writer = await asyncio.open_connection(self.host, self.port)
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to {self.host}:{self.port}.") from e
+        self._stream_writer.transport.set_write_buffer_limits(high=_WRITE_HIGH_WATER)
+        self._response_task = asyncio.ensure_future(self._read_responses())
+
+    async def close(self):
+        """Closes the connection and fails any commands still waiting for a response."""
+        writer, self._stream_writer = self._stream_writer, None
+        task, self._response_task = self._response_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+        self._stream_reader = None
+        self._frames.clear()
+        self._fail_in_flight(ConnectionAbortedError("Connection closed before the controller responded."))
+
+    async def __aenter__(self):
+        """Async context manager entry: connects to the device."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit: closes the connection."""
+        await self.close()
+
+    def _request(self, command_body: str, parse: Optional[Callable[[Frame], Any]] = None) -> asyncio.Future:
+        """
+        Writes a command immediately and returns a future for its response.
+
+        If the send buffer is over its limit, the returned future also waits
+        for it to drain, so a caller that awaits its commands cannot queue
+        writes without bound.
+        """
+        writer = self._stream_writer
+        if writer is None:
+            raise ConnectionError("Controller is not connected. Call connect() or use an 'async with' statement.")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        deadline = time.monotonic() + self.read_timeout if self.read_timeout is not None else float("inf")
+        self._in_flight.append((future, parse, deadline))
+        writer.write(encode_command(command_body))
+        if self._timeout_handle is None and self.read_timeout is not None:
+            self._timeout_handle = loop.call_at(loop.time() + self.read_timeout, self._check_timeout)
+        if writer.transport.get_write_buffer_size() > _WRITE_HIGH_WATER:
+            return asyncio.ensure_future(self._drained(writer, future))
+        return future
+
+    @staticmethod
+    async def _drained(writer: asyncio.StreamWriter, future: asyncio.Future) -> Any:
+        try:
+            await writer.drain()
+        except OSError:
+            # The response task fails the future when the connection drops.
+            pass
+        return await future
+
+    def _check_timeout(self) -> None:
+        """Timer callback: aborts the connection if the oldest command is overdue."""
+        self._timeout_handle = None
+        if not self._in_flight:
+            return
+        remaining = self._in_flight[0][2] - time.monotonic()
+        if remaining <= 0:
+            self._abort(ConnectionAbortedError(
+                f"No response from the controller within {self.read_timeout} seconds."))
+            return
+        loop = asyncio.get_running_loop()
+        self._timeout_handle = loop.call_at(loop.time() + remaining, self._check_timeout)
+
+    def _request_group(self, command_bodies: Sequence[str],
+                       parsers: Sequence[Optional[Callable[[Frame], Any]]],
+                       combine: Callable[[List[Any]], Any]) -> asyncio.Future:
+        """Writes several commands immediately and returns a future for their combined responses."""
+        futures = [self._request(body, parse) for body, parse in zip(command_bodies, parsers)]
+
+        async def gather():
+            return combine(list(await asyncio.gather(*futures)))
+
+        return asyncio.ensure_future(gather())
+
+    async def _send_command(self, command_body: str) -> str:
+        return await self._request(command_body)
+
+    async def _read_responses(self):
+        """Background task: resolves outstanding commands as their responses arrive."""
+        assert self._stream_reader is not None
+        frames = self._frames
+        try:
+            while True:
+                data = await self._stream_reader.read(4096)
+                if not data:
+                    raise ConnectionError("Connection closed by controller.")
+                frames.feed(data)
+                frame = frames.next_frame()
+                while frame is not None:
+                    if self._in_flight:
+                        future, parse, _ = self._in_flight.popleft()
+                        # A cancelled caller still owns its slot in the response order.
+                        if not future.cancelled():
+                            try:
+                                future.set_result((parse or decode_text)(frame))
+                            except Exception as e:
+                                future.set_exception(e)
+                    frame = frames.next_frame()
+        except OSError as e:
+            self._abort(ConnectionAbortedError(f"Connection lost while waiting for a response. Error: {e}"))
+
+    def _abort(self, error: Exception) -> None:
+        """Closes a connection whose responses can no longer be trusted and fails every outstanding command."""
+        writer, self._stream_writer = self._stream_writer, None
+        if writer is not None:
+            writer.close()
+        task, self._response_task = self._response_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._stream_reader = None
+        self._frames.clear()
+        self._fail_in_flight(error)
+
+    def _fail_in_flight(self, error: Exception) -> None:
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+        while self._in_flight:
+            future, _, _ = self._in_flight.popleft()
+            if not future.done():
+                future.set_exception(error)
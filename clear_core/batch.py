@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from .motors import MotorControl
+from .io import IOControl
+from .protocol import Frame
+
+if TYPE_CHECKING:
+    from .controller import ClearCoreController
+
+T = TypeVar("T")
+
+class PendingResponse(Generic[T]):
+    """
+    Placeholder for the response to a command queued in a CommandBatch.
+
+    The value becomes available once the batch has been flushed. Commands
+    streamed with ClearCoreController._submit() return the same placeholder,
+    resolved when their response is read back.
+    """
+    __slots__ = ("command", "parse", "_value", "_error", "_done")
+
+    def __init__(self, command: str, parse: Optional[Callable[[Frame], T]] = None):
+        self.command = command
+        self.parse = parse
+        self._value: Any = None
+        self._error: Optional[BaseException] = None
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Returns True once the response has been received."""
+        return self._done
+
+    def result(self) -> T:
+        """
+        Returns the (parsed) response.
+
+        Raises:
+            RuntimeError: If the batch holding this command has not been flushed yet.
+            Exception: The error that prevented the response from being read or parsed.
+        """
+        if not self._done:
+            raise RuntimeError(f"Response for '{self.command}' is not available until the batch is flushed.")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _resolve(self, value: T) -> None:
+        self._value = value
+        self._done = True
+
+    def _fail(self, error: BaseException) -> None:
+        self._error = error
+        self._done = True
+
+    def __repr__(self) -> str:
+        if self._error is not None:
+            return f"PendingResponse({self.command!r}, error={self._error!r})"
+        state = repr(self._value) if self._done else "pending"
+        return f"PendingResponse({self.command!r}, {state})"
+
+class CommandBatch:
+    """
+    Queues commands and sends them to the controller in a single exchange.
+
+    A batch exposes the same `motors` and `io` surface as ClearCoreController,
+    but each call returns a PendingResponse instead of blocking on the network.
+    On flush every queued command is written with one `sendall` and all
+    responses are read back in order, so N commands cost about one round trip.
+
+    It is designed to be used as a context manager; the batch is flushed when
+    the 'with' block exits without an exception.
+    """
+    def __init__(self, controller: 'ClearCoreController'):
+        """
+        Initializes the CommandBatch class.
+
+        Args:
+            controller: The ClearCoreController the batch will be flushed through.
+        """
+        self._controller = controller
+        self._pending: List[PendingResponse] = []
+        # Placeholders whose value combines several queued responses.
+        self._groups: List[Tuple[PendingResponse, List[PendingResponse], Callable[[List[Any]], Any]]] = []
+
+        self.motors = MotorControl(self)
+        self.io = IOControl(self)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _request(self, command_body: str, parse: Optional[Callable[[Frame], Any]] = None) -> PendingResponse:
+        """Queues a command and returns the placeholder for its response."""
+        pending = PendingResponse(command_body, parse)
+        self._pending.append(pending)
+        return pending
+
+    def _request_group(self, command_bodies: Sequence[str],
+                       parsers: Sequence[Optional[Callable[[Frame], Any]]],
+                       combine: Callable[[List[Any]], Any]) -> PendingResponse:
+        """Queues several commands and returns one placeholder for their combined responses."""
+        parts = [self._request(body, parse) for body, parse in zip(command_bodies, parsers)]
+        group: PendingResponse = PendingResponse(",".join(command_bodies))
+        self._groups.append((group, parts, combine))
+        return group
+
+    def flush(self) -> List[Any]:
+        """
+        Sends every queued command and resolves their responses.
+
+        Every placeholder is settled, even if the flush fails: it holds either
+        its own parsed response or the error that prevented it, which its
+        `result()` raises. A group fails with the first error of its parts.
+
+        Returns:
+            The (parsed) responses, in the order the commands were queued.
+
+        Raises:
+            ConnectionError: If the exchange failed; every placeholder holds the same error.
+            ValueError: The first response that could not be parsed, after all
+                        placeholders have been settled.
+        """
+        pending, self._pending = self._pending, []
+        groups, self._groups = self._groups, []
+        if not pending:
+            return []
+        errors: List[Optional[Exception]] = []
+        try:
+            responses = self._controller._send_commands([p.command for p in pending],
+                                                        [p.parse for p in pending], errors)
+        except Exception as e:
+            for placeholder in pending:
+                placeholder._fail(e)
+            for group, _, _ in groups:
+                group._fail(e)
+            raise
+        for placeholder, response, error in zip(pending, responses, errors):
+            if error is None:
+                placeholder._resolve(response)
+            else:
+                placeholder._fail(error)
+        for group, parts, combine in groups:
+            error = next((p._error for p in parts if p._error is not None), None)
+            if error is None:
+                group._resolve(combine([p.result() for p in parts]))
+            else:
+                group._fail(error)
+        parse_error = next((e for e in errors if e is not None), None)
+        if parse_error is not None:
+            raise parse_error
+        return responses
+
+    def __enter__(self):
+        """Context manager entry: returns the empty batch."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: flushes the batch unless an exception occurred."""
+        if exc_type is None:
+            self.flush()
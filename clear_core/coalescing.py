@@ -0,0 +1,160 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, Set
+
+from .motors import MotorControl, Status
+from .metrics import CommandTrace, opcode_of
+from .protocol import is_rejected
+
+if TYPE_CHECKING:
+    from .controller import ClearCoreController
+
+# Settings opcodes whose last value stays in effect until it is changed.
+_SETTINGS = ("SV", "SA", "SD")
+# Opcodes after which a motor may be moving (or its state is unknown).
+_MOTION = ("AM", "RM", "EN", "DE", "CA")
+
+class CoalescingMotorControl(MotorControl):
+    """
+    MotorControl that skips commands which cannot change anything.
+
+    It keeps a model of what was last sent to each motor. The controller
+    reports every command as it is written, and the connection's trace hooks
+    report every command that was answered, so commands issued by other
+    senders (batches, streams, the telemetry poller) keep it up to date too.
+    A trace does not carry the response, so a setting sent by another sender
+    only makes the model forget that setting; a value is remembered only
+    after it was sent through this object and not rejected. Whether a motor
+    may be moving is updated when a command is written rather than when it
+    is answered, so a move still waiting for its response (e.g. one sent by
+    a MotionStream) is never mistaken for a stopped motor. From that model:
+
+    - `set_velocity`, `set_acceleration` and `set_deceleration` are skipped
+      when the same value was the last one sent for that motor.
+    - `abrupt_stop` is skipped when the motor was already stopped and has
+      not been told to move since, or was last reported as not moving.
+
+    A skipped call returns the response the controller gave the last time
+    the same command was sent. Every skippable method takes `force=True` to
+    send regardless. Counts of skipped commands per opcode are kept in
+    `suppressed`.
+
+    Enable it with ClearCoreController(..., coalesce=True). Batches are not
+    coalesced, since their commands are not sent until the batch is flushed.
+    """
+    def __init__(self, controller: 'ClearCoreController'):
+        """
+        Initializes the CoalescingMotorControl class.
+
+        Args:
+            controller: The main ClearCoreController instance to send commands through.
+        """
+        super().__init__(controller)
+        # Setting key (e.g. "M2SV") -> the last command body sent for it.
+        self._last: Dict[str, str] = {}
+        # Motors known to be standing still.
+        self._idle: Set[int] = set()
+        # Motor -> number of commands written that may have set it moving.
+        self._moves: Dict[int, int] = {}
+        # Command body -> the controller's last response to it.
+        self._responses: Dict[str, str] = {}
+        self.suppressed: Dict[str, int] = {}
+        controller.metrics.add_trace_hook(self._observe)
+
+    @property
+    def suppressed_total(self) -> int:
+        """The total number of commands that were not sent."""
+        return sum(self.suppressed.values())
+
+    def reset(self) -> None:
+        """Forgets everything known about the motors, e.g. after a reconnect."""
+        self._last.clear()
+        self._idle.clear()
+        self._responses.clear()
+
+    def set_velocity(self, motor: int, velo: int, force: bool = False) -> str:
+        return self._send_setting(f"M{motor}SV", velo, force)
+
+    def set_acceleration(self, motor: int, accel: int, force: bool = False) -> str:
+        return self._send_setting(f"M{motor}SA", accel, force)
+
+    def set_deceleration(self, motor: int, decel: int, force: bool = False) -> str:
+        return self._send_setting(f"M{motor}SD", decel, force)
+
+    def abrupt_stop(self, motor: int, force: bool = False) -> str:
+        """Stops a motor abruptly, unless it is known to be stopped already."""
+        command = f"M{motor}AS"
+        if not force and motor in self._idle:
+            cached = self._responses.get(command)
+            if cached is not None:
+                self._count("AS")
+                return cached
+        return self._send(command)
+
+    def get_status(self, motor: int) -> Status:
+        """Gets the status of a motor and remembers whether it is moving."""
+        moves = self._moves.get(motor, 0)
+        status = super().get_status(motor)
+        if status is Status.MOVING or self._moves.get(motor, 0) != moves:
+            # Moving, or told to move (e.g. by another thread) after the status was read.
+            self._idle.discard(motor)
+        else:
+            self._idle.add(motor)
+        return status
+
+    def _send_setting(self, key: str, value: int, force: bool) -> str:
+        command = f"{key}{value}"
+        if not force and self._last.get(key) == command:
+            cached = self._responses.get(command)
+            if cached is not None:
+                self._count(key[-2:])
+                return cached
+        response = self._send(command)
+        if not is_rejected(response):
+            self._last[key] = command
+        return response
+
+    def _send(self, command: str) -> str:
+        response = self._controller._request(command)
+        if is_rejected(response):
+            # A rejected command did not take effect, so it must not be skipped later.
+            self._responses.pop(command, None)
+        else:
+            self._responses[command] = response
+        return response
+
+    def _count(self, opcode: str) -> None:
+        self.suppressed[opcode] = self.suppressed.get(opcode, 0) + 1
+
+    def _written(self, command_bodies: Iterable[str]) -> None:
+        """
+        Called by the controller, with its lock held, just before commands are
+        written. The controller executes them in this order, so the last
+        motion command written for a motor decides whether it may be moving.
+        """
+        for command in command_bodies:
+            if command[:1] != "M":
+                continue
+            opcode = opcode_of(command)
+            if opcode == "AS":
+                self._idle.add(int(command[1:command.index(opcode, 1)]))
+            elif opcode in _MOTION:
+                motor = int(command[1:command.index(opcode, 1)])
+                self._idle.discard(motor)
+                self._moves[motor] = self._moves.get(motor, 0) + 1
+
+    def _observe(self, trace: CommandTrace) -> None:
+        """Trace hook: updates the model from every command answered on the connection."""
+        if trace.error is not None:
+            if isinstance(trace.error, OSError):
+                # The connection failed; the controller may have missed anything.
+                self.reset()
+            return
+        command = trace.command
+        if command[:1] != "M":
+            return
+        opcode = trace.opcode
+        if opcode in _SETTINGS:
+            # The trace does not say whether the setting was accepted, so its
+            # value is unknown until _send_setting() records its own response.
+            end = command.index(opcode, 1)
+            self._last.pop(command[:end + 2], None)
@@ -1,9 +1,23 @@
 import socket
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 # Use relative imports to bring in the other parts of our package
 from .motors import MotorControl
+from .coalescing import CoalescingMotorControl
 from .io import IOControl
+from .batch import CommandBatch, PendingResponse
+from .protocol import Frame, FrameReader, decode_text, encode_command
+from .telemetry import TelemetryPoller
+from .metrics import CommandMetrics, TraceHook, opcode_of
+from .transport import Connection, TcpTransport, Transport
+
+T = TypeVar("T")
+
+# Opcodes of commands that only read state: position, status and input pins.
+_IDEMPOTENT = frozenset(("GP", "GS", "I"))
 
 class ClearCoreController:
     """
@@ -15,33 +29,124 @@ class ClearCoreController:
 
     It is recommended to use this class as a context manager with 'with'.
     """
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None, coalesce: bool = False,
+                 connect_timeout: Optional[float] = 3.0, read_timeout: Optional[float] = 2.0,
+                 keepalive_idle: Optional[int] = 5, reconnect_attempts: int = 3,
+                 backoff: float = 0.05, max_backoff: float = 1.0,
+                 transport: Optional[Transport] = None):
+        """
+        Initializes the ClearCoreController class.
+
+        Args:
+            host: The controller's IP address or hostname.
+            port: The controller's TCP port.
+            coalesce: If True, `motors` skips commands that cannot change
+                      anything, e.g. repeated stops or unchanged settings.
+                      See CoalescingMotorControl.
+            connect_timeout: Seconds to wait for the connection to open, or None to wait forever.
+            read_timeout: Seconds to wait for a response, or None to wait forever.
+            keepalive_idle: Seconds of idle time before TCP keepalive probes are
+                            sent, or None to disable keepalive.
+            reconnect_attempts: How many times to try reopening a dropped
+                                connection before giving up. 0 disables
+                                reconnecting; the connection is then closed
+                                on the first error.
+            backoff: Delay in seconds after the first failed reconnect attempt.
+                     It doubles after every further failure.
+            max_backoff: Upper bound in seconds on the delay between attempts.
+            transport: Connects over something other than TCP, e.g. a
+                       UnixTransport or LoopbackTransport. Replaces host, port
+                       and the timeout and keepalive options.
+        """
+        if transport is None:
+            if host is None or port is None:
+                raise ValueError("Either host and port or a transport is required.")
+            transport = TcpTransport(host, port, connect_timeout, read_timeout, keepalive_idle)
         self.host = host
         self.port = port
-        self._sock: Optional[socket.socket] = None
+        self.transport = transport
+        self.reconnect_attempts = reconnect_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._connection: Optional[Connection] = None
+        # Persistent receive buffer that splits the byte stream into responses.
+        self._reader = FrameReader()
+        # Serializes request/response exchanges between threads, e.g. the telemetry poller.
+        self._lock = threading.Lock()
+        # Commands written by _submit() whose responses have not been read yet, oldest first.
+        self._in_flight: Deque[Tuple[PendingResponse, int]] = deque()
+        self.telemetry: Optional[TelemetryPoller] = None
+        # Latency histograms and traffic counters, updated on every exchange.
+        self.metrics = CommandMetrics()
+        self._has_connected = False
+        # True between connect() and close(); a dropped connection is only reopened while set.
+        self._keep_connected = False
 
         # The hybrid pattern: instantiate sub-controllers and pass self
-        self.motors = MotorControl(self)
+        # The coalescer is told about every command as it is written; see _written().
+        self._coalescer: Optional[CoalescingMotorControl] = CoalescingMotorControl(self) if coalesce else None
+        self.motors = self._coalescer or MotorControl(self)
         self.io = IOControl(self)
 
     def connect(self):
         """Establishes the connection to the controller."""
-        if self._sock is not None:
+        if self._connection is not None:
             # Avoid reconnecting if already connected
             return
         try:
-            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._sock.connect((self.host, self.port))
+            self._connection = self.transport.open()
         except socket.error as e:
-            self._sock = None # Ensure state is clean on failure
+            self._connection = None # Ensure state is clean on failure
+            self.metrics.errors += 1
             # Re-raise the exception for the caller to handle
-            raise ConnectionError(f"Failed to connect to {self.host}:{self.port}.") from e
+            raise ConnectionError(f"Failed to connect to {self.transport}.") from e
+        self._connected()
 
     def close(self):
         """Closes the connection to the controller if it is open."""
-        if self._sock:
-            self._sock.close()
-            self._sock = None
+        self._keep_connected = False
+        self.stop_telemetry()
+        self._drop_connection()
+
+    def _connected(self) -> None:
+        if self._has_connected:
+            self.metrics.reconnects += 1
+            if self._coalescer is not None:
+                # The controller may have been reset while the connection was down.
+                self._coalescer.reset()
+        self._has_connected = True
+        self._keep_connected = True
+
+    def _drop_connection(self) -> None:
+        """Closes the connection and fails every command still waiting for a response."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+        self._reader.clear()
+        self._fail_in_flight(ConnectionAbortedError("Connection closed before the response was received."))
+
+    def _reconnect(self) -> None:
+        """
+        Reopens a dropped connection, backing off exponentially between attempts.
+        The caller must hold the lock.
+
+        Raises:
+            ConnectionError: If every attempt failed.
+        """
+        delay = self.backoff
+        for attempt in range(self.reconnect_attempts):
+            if attempt:
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+            try:
+                self._connection = self.transport.open()
+            except socket.error:
+                self.metrics.errors += 1
+                continue
+            self._connected()
+            return
+        raise ConnectionError(f"Failed to reconnect to {self.transport} "
+                              f"after {self.reconnect_attempts} attempts.")
 
     def __enter__(self):
         """Context manager entry: connects to the device."""
@@ -52,19 +157,286 @@ class ClearCoreController:
         """Context manager exit: closes the connection."""
         self.close()
 
+    def batch(self) -> CommandBatch:
+        """
+        Returns a new command batch bound to this controller.
+
+        Commands issued through the batch's `motors` and `io` attributes are
+        queued instead of sent. When the batch is flushed (explicitly, or on
+        leaving its 'with' block) every queued command is written in a single
+        `sendall` and the responses are resolved in order, so the whole batch
+        costs about one network round trip.
+
+        Example:
+            with cc.batch() as batch:
+                status = batch.motors.get_status(1)
+                sensor = batch.io.read_input_pin(0)
+            print(status.result(), sensor.result())
+        """
+        return CommandBatch(self)
+
+    def start_telemetry(self, motors: Iterable[int] = (), pins: Iterable[int] = (),
+                        rate_hz: float = 50.0, max_staleness: Optional[float] = None) -> TelemetryPoller:
+        """
+        Starts polling motor and input state in the background.
+
+        Reads through the returned poller (also available as `telemetry`) are
+        served from its cache, so the control loop does not wait on the network
+        unless a value is older than the allowed staleness.
+
+        Args:
+            motors: Motors whose position and status are polled.
+            pins: Digital input pins that are polled.
+            rate_hz: How many polls to run per second.
+            max_staleness: Default maximum age in seconds of a cached value.
+                           Defaults to two poll periods.
+        """
+        self.stop_telemetry()
+        self.telemetry = TelemetryPoller(self, motors, pins, rate_hz, max_staleness)
+        self.telemetry.start()
+        return self.telemetry
+
+    def stop_telemetry(self):
+        """Stops the background telemetry poller, if one is running."""
+        if self.telemetry is not None:
+            self.telemetry.stop()
+            self.telemetry = None
+
+    def add_trace_hook(self, hook: TraceHook):
+        """
+        Registers a function that is called with a CommandTrace after every command.
+
+        See CommandMetrics.add_trace_hook.
+        """
+        self.metrics.add_trace_hook(hook)
+
+    def remove_trace_hook(self, hook: TraceHook):
+        """Unregisters a trace hook."""
+        self.metrics.remove_trace_hook(hook)
+
+    def _request(self, command_body: str, parse: Optional[Callable[[Frame], Any]] = None) -> Any:
+        """
+        Sends one command and returns its response.
+
+        Args:
+            command_body: The command without the protocol's framing bytes.
+            parse: Converts the raw response frame into the return value.
+                   Defaults to decoding it as text.
+        """
+        return self._send_commands([command_body], [parse])[0]
+
+    def _request_group(self, command_bodies: Sequence[str],
+                       parsers: Sequence[Optional[Callable[[Frame], Any]]],
+                       combine: Callable[[List[Any]], Any]) -> Any:
+        """Sends several commands in one exchange and combines their parsed responses."""
+        return combine(self._send_commands(command_bodies, parsers))
+
     def _send_command(self, command_body: str) -> str:
-        if not self._sock:
-            raise ConnectionError("Controller is not connected. Call connect() or use a 'with' statement.")
+        return self._send_commands([command_body])[0]
+
+    def _send_commands(self, command_bodies: Sequence[str],
+                       parsers: Optional[Sequence[Optional[Callable[[Frame], Any]]]] = None,
+                       errors: Optional[List[Optional[Exception]]] = None) -> List[Any]:
+        """
+        Writes all commands in one `sendall` and reads one response per command.
+
+        The controller answers commands in the order it receives them, so the
+        n-th response read back belongs to the n-th command written. Each raw
+        frame is handed to the matching parser before the next one is read;
+        responses without a parser are decoded as text. Responses to commands
+        still in flight from `_submit` arrive first and resolve their placeholders.
+
+        Args:
+            command_bodies: The commands without the protocol's framing bytes.
+            parsers: One parser per command; None decodes the response as text.
+            errors: If given, it is filled with one entry per command: None,
+                    or the error its response failed to parse with. Parse
+                    errors are then not raised, and the failed responses are
+                    None in the returned list.
+        """
+        if parsers is None:
+            parsers = [None] * len(command_bodies)
 
         # Protocol: command is wrapped with Start of Text and End of Text chars
-        full_command = f"\x02{command_body}\x13"
+        payload = b"".join(map(encode_command, command_bodies))
 
-        try:
-            self._sock.sendall(full_command.encode('ascii'))
-            response = self._sock.recv(1024).decode('ascii')
-            # It's good practice to strip whitespace/control characters from the response
-            return response.strip()
-        except socket.error as e:
-            # If the connection drops during communication, clean up and raise
-            self.close()
-            raise ConnectionAbortedError(f"Connection lost while sending command. Error: {e}")
+        def exchange(connection: Connection) -> List[Any]:
+            start_ns = time.perf_counter_ns()
+            if self._coalescer is not None:
+                self._coalescer._written(command_bodies)
+            connection.sendall(payload)
+            self.metrics.bytes_sent += len(payload)
+            self.metrics.exchanges += 1
+            self._drain_in_flight(connection)
+            return self._read_responses(connection, command_bodies, parsers, start_ns, errors)
+
+        # Reads have no side effects, so they are safe to send again after a reconnect.
+        replayable = all(opcode_of(body) in _IDEMPOTENT for body in command_bodies)
+        return self._locked_exchange(exchange, replayable)
+
+    def _submit(self, command_bodies: Sequence[str],
+                parsers: Optional[Sequence[Optional[Callable[[Frame], Any]]]] = None) -> List[PendingResponse]:
+        """
+        Writes commands without waiting for their responses.
+
+        The responses are read later, in order, by `_collect` or by the next
+        exchange on this connection, whichever comes first. This lets a caller
+        keep several commands in flight to hide the network round trip.
+
+        Returns:
+            One placeholder per command, resolved when its response is read.
+        """
+        if parsers is None:
+            parsers = [None] * len(command_bodies)
+        pending = [PendingResponse(body, parse) for body, parse in zip(command_bodies, parsers)]
+        payload = b"".join(map(encode_command, command_bodies))
+
+        def submit(connection: Connection) -> List[PendingResponse]:
+            start_ns = time.perf_counter_ns()
+            if self._coalescer is not None:
+                self._coalescer._written(command_bodies)
+            connection.sendall(payload)
+            self.metrics.bytes_sent += len(payload)
+            self.metrics.exchanges += 1
+            self._in_flight.extend((placeholder, start_ns) for placeholder in pending)
+            return pending
+
+        return self._locked_exchange(submit)
+
+    def _collect(self, pending: PendingResponse) -> None:
+        """Reads responses of in-flight commands until `pending` is resolved."""
+        if not pending.done:
+            self._locked_exchange(lambda connection: self._drain_in_flight(connection, pending))
+
+    @property
+    def is_connected(self) -> bool:
+        """Returns True while a connection is open."""
+        return self._connection is not None
+
+    @property
+    def in_flight(self) -> int:
+        """The number of submitted commands whose response has not been read yet."""
+        return len(self._in_flight)
+
+    def _locked_exchange(self, exchange: Callable[[Connection], T], replayable: bool = False) -> T:
+        """
+        Runs `exchange` with the connection while holding the lock.
+
+        If the connection drops, it is reopened (see `reconnect_attempts`).
+        A `replayable` exchange, i.e. one that only reads state, is then run
+        again on the new connection. Anything else raises
+        ConnectionAbortedError, since the controller may already have acted
+        on the commands.
+        """
+        replays = 0
+        with self._lock:
+            while True:
+                if not self._connection:
+                    if not (self._keep_connected and self.reconnect_attempts):
+                        raise ConnectionError("Controller is not connected. Call connect() or use a 'with' statement.")
+                    self._reconnect()
+                received = self._reader.bytes_received
+                try:
+                    return exchange(self._connection)
+                except socket.error as e:
+                    error = e
+                finally:
+                    self.metrics.bytes_received += self._reader.bytes_received - received
+
+                # Responses already in the buffer no longer line up with any command.
+                self._drop_connection()
+                if not self.reconnect_attempts:
+                    break
+                if replayable and replays < self.reconnect_attempts:
+                    replays += 1
+                    self.metrics.replays += 1
+                    continue
+                try:
+                    # Reconnect now so the next call finds a working connection.
+                    self._reconnect()
+                except ConnectionError:
+                    pass
+                raise ConnectionAbortedError(f"Connection lost while sending command. Error: {error}")
+
+        # Without reconnecting, the connection is closed for good. This happens
+        # outside the lock because close() waits for the telemetry thread.
+        self.close()
+        raise ConnectionAbortedError(f"Connection lost while sending command. Error: {error}")
+
+    def _drain_in_flight(self, connection: Connection, until: Optional[PendingResponse] = None) -> None:
+        """
+        Reads responses of submitted commands, resolving their placeholders, until
+        `until` is resolved or nothing is in flight. The caller must hold the lock.
+
+        Parse errors are stored in the placeholder rather than raised, since
+        they belong to whoever submitted the command.
+        """
+        in_flight = self._in_flight
+        recv_into = connection.recv_into
+        read_frame = self._reader.read_frame
+        clock = time.perf_counter_ns
+        record = self.metrics.record
+        while in_flight and (until is None or not until.done):
+            try:
+                frame = read_frame(recv_into)
+            except socket.error as e:
+                self._fail_in_flight(e)
+                raise
+            pending, start_ns = in_flight.popleft()
+            try:
+                pending._resolve((pending.parse or decode_text)(frame))
+                record(pending.command, start_ns, clock() - start_ns)
+            except (ValueError, IndexError) as e:
+                pending._fail(e)
+                record(pending.command, start_ns, clock() - start_ns, e)
+
+    def _fail_in_flight(self, error: BaseException) -> None:
+        """Fails every command still waiting for a response."""
+        failed_at = time.perf_counter_ns()
+        while self._in_flight:
+            pending, start_ns = self._in_flight.popleft()
+            self.metrics.record(pending.command, start_ns, failed_at - start_ns, error)
+            pending._fail(error)
+
+    def _read_responses(self, connection: Connection, command_bodies: Sequence[str],
+                        parsers: Sequence[Optional[Callable[[Frame], Any]]], start_ns: int,
+                        errors: Optional[List[Optional[Exception]]] = None) -> List[Any]:
+        """
+        Reads and parses one response per command, recording its latency.
+        The caller must hold the lock.
+
+        The first parse error is raised once every response has been read,
+        unless `errors` is given; see `_send_commands`.
+        """
+        recv_into = connection.recv_into
+        read_frame = self._reader.read_frame
+        clock = time.perf_counter_ns
+        record = self.metrics.record
+        responses: List[Any] = []
+        failures: List[Optional[Exception]] = []
+        for index, (command_body, parse) in enumerate(zip(command_bodies, parsers)):
+            try:
+                frame = read_frame(recv_into)
+            except socket.error as e:
+                # Every command still waiting for a response failed with the connection.
+                failed_at = clock()
+                for unanswered in command_bodies[index:]:
+                    record(unanswered, start_ns, failed_at - start_ns, e)
+                raise
+            try:
+                responses.append((parse or decode_text)(frame))
+                failures.append(None)
+                record(command_body, start_ns, clock() - start_ns)
+            except (ValueError, IndexError) as e:
+                # Keep reading so the remaining responses stay matched to their commands.
+                responses.append(None)
+                failures.append(e)
+                record(command_body, start_ns, clock() - start_ns, e)
+        if errors is not None:
+            # Assigned in place: a replayed exchange replaces an earlier attempt's entries.
+            errors[:] = failures
+        else:
+            parse_error = next((e for e in failures if e is not None), None)
+            if parse_error is not None:
+                raise parse_error
+        return responses
@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from .controller import ClearCoreController
+
+@dataclass(frozen=True)
+class FleetResult:
+    """The outcome of running one operation on one controller of a fleet."""
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if the operation completed without raising."""
+        return self.error is None
+
+    def result(self) -> Any:
+        """Returns the value, re-raising the controller's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+class ClearCoreFleet:
+    """
+    Holds connections to several ClearCore controllers and drives them concurrently.
+
+    Operations are fanned out over a thread pool with one worker per
+    controller, so running a function across N controllers takes about as
+    long as the slowest single controller rather than the sum of all of them.
+    Every operation returns a FleetResult per controller; a failure on one
+    controller is reported in its result and does not affect the others.
+    Controllers that could not be connected to are listed in `connect_errors`.
+
+    It is designed to be used as a context manager with a 'with' statement.
+    """
+    def __init__(self, endpoints: Mapping[str, Tuple[str, int]], max_workers: Optional[int] = None):
+        """
+        Initializes the ClearCoreFleet class.
+
+        Args:
+            endpoints: Maps a name for each controller to its (host, port).
+            max_workers: Size of the thread pool. Defaults to one thread per controller.
+        """
+        self._controllers: Dict[str, ClearCoreController] = {
+            name: ClearCoreController(host, port) for name, (host, port) in endpoints.items()
+        }
+        self._max_workers = max_workers or max(len(self._controllers), 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Name -> the error that stopped the last connect() from reaching the controller.
+        self.connect_errors: Dict[str, BaseException] = {}
+
+    def __getitem__(self, name: str) -> ClearCoreController:
+        return self._controllers[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._controllers)
+
+    def __len__(self) -> int:
+        return len(self._controllers)
+
+    def connect(self) -> Dict[str, FleetResult]:
+        """
+        Connects to every controller concurrently.
+
+        Controllers that fail are recorded in `connect_errors` (and dropped
+        from it once they connect), so a partly reachable fleet is noticed
+        right away rather than on the next run().
+        """
+        results = self.run(ClearCoreController.connect)
+        self.connect_errors = {name: result.error for name, result in results.items()
+                               if result.error is not None}
+        return results
+
+    def close(self) -> None:
+        """Closes every connection and shuts down the thread pool."""
+        for controller in self._controllers.values():
+            controller.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Dict[str, FleetResult]:
+        """
+        Calls `function(controller, *args, **kwargs)` on every controller at once.
+
+        Example:
+            results = fleet.run(update_hatch)
+            positions = fleet.run(lambda cc: cc.motors.get_position(1))
+
+        Returns:
+            A FleetResult for each controller, keyed by its name.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix="clear-core-fleet")
+        futures = {
+            name: self._executor.submit(function, controller, *args, **kwargs)
+            for name, controller in self._controllers.items()
+        }
+        results = {}
+        for name, future in futures.items():
+            error = future.exception()
+            results[name] = FleetResult(name, None if error else future.result(), error)
+        return results
+
+    def __enter__(self):
+        """Context manager entry: connects to every controller; see `connect_errors`."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: closes every connection."""
+        self.close()
@@ -1,11 +1,60 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from .protocol import Frame
 
 
 if TYPE_CHECKING:
     from .controller import ClearCoreController
 
+def _parse_input(response: Frame) -> bool:
+    # Assuming the controller responds with "1" for high and "0" for low.
+    return response[3] == 0x31
+
+# ClearCore inputs: IO-0 to IO-5, DI-6 to DI-8 and A-9 to A-12.
+INPUT_PORT_PINS = tuple(range(13))
+
+class InputPins:
+    """
+    The states of a set of digital input pins read in one exchange.
+
+    States are packed into the `mask` integer (bit n is pin n), so looking
+    up a pin with `pins[n]` is a single bit test.
+    """
+    __slots__ = ("mask", "pins")
+
+    def __init__(self, pins: Sequence[int], states: Sequence[bool]):
+        self.pins: Tuple[int, ...] = tuple(pins)
+        mask = 0
+        for pin, state in zip(self.pins, states):
+            if state:
+                mask |= 1 << pin
+        self.mask = mask
+
+    def __getitem__(self, pin: int) -> bool:
+        """Returns True if the pin is high. Raises KeyError if it was not read."""
+        if pin not in self.pins:
+            raise KeyError(f"Pin {pin} was not read.")
+        return bool(self.mask >> pin & 1)
+
+    def __iter__(self) -> Iterator[Tuple[int, bool]]:
+        """Yields (pin, state) pairs in the order the pins were read."""
+        for pin in self.pins:
+            yield pin, bool(self.mask >> pin & 1)
+
+    def __len__(self) -> int:
+        return len(self.pins)
+
+    def __repr__(self) -> str:
+        high = [str(pin) for pin in self.pins if self.mask >> pin & 1]
+        return f"InputPins(high={{{', '.join(high)}}}, mask=0b{self.mask:b})"
+
 class IOControl:
-    """Handles all digital and analog I/O commands."""
+    """
+    Handles all digital and analog I/O commands.
+
+    Like MotorControl, calls are executed by the object passed in as
+    `controller`, so the same methods work on a CommandBatch.
+    """
     def __init__(self, controller: 'ClearCoreController'):
         """
         Initializes the IOControl class.
@@ -17,13 +66,41 @@ class IOControl:
 
     def set_output_pin(self, pin: int, value: bool) -> str:
         state = "1" if value else "0"
-        return self._controller._send_command(f"O{pin}S{state}")
+        return self._controller._request(f"O{pin}S{state}")
 
     def read_input_pin(self, pin: int) -> bool:
         """
         Reads the state of a digital input pin. Returns True for high, False for low.
         (Note: Command string is hypothetical and may need to be adjusted.)
         """
-        response = self._controller._send_command(f"I{pin}")[3]
-        # Assuming the controller responds with "1" for high and "0" for low.
-        return response == "1"
+        return self._controller._request(f"I{pin}", _parse_input)
+
+    def read_input_pins(self, pins: Iterable[int]) -> InputPins:
+        """
+        Reads several digital input pins in one exchange.
+
+        The firmware has no multi-pin read command, so the single-pin reads
+        are pipelined: all of them are written at once and answered in one
+        round trip.
+        """
+        pins = tuple(pins)
+        return self._controller._request_group(
+            [f"I{pin}" for pin in pins], [_parse_input] * len(pins),
+            lambda states: InputPins(pins, states))
+
+    def read_input_port(self) -> InputPins:
+        """Reads every digital input on the controller in one exchange."""
+        return self.read_input_pins(INPUT_PORT_PINS)
+
+    def set_output_pins(self, values: Mapping[int, bool]) -> List[str]:
+        """
+        Sets several digital output pins in one exchange.
+
+        Args:
+            values: Maps each output pin to its new state.
+
+        Returns:
+            The controller's response to each write, in the mapping's order.
+        """
+        commands = [f"O{pin}S{'1' if value else '0'}" for pin, value in values.items()]
+        return self._controller._request_group(commands, [None] * len(commands), list)
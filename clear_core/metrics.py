@@ -0,0 +1,201 @@
+import json
+import time
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Each power of two from 2**_MIN_BITS ns (~1 us) up to 2**_MAX_BITS ns (~17 s) is
+# split into _SUB_BUCKETS linear buckets, giving a resolution of 25%. Shorter
+# latencies land in bucket 0 and longer ones in the last bucket.
+_MIN_BITS = 10
+_MAX_BITS = 34
+_SUB_BUCKETS = 4
+_BUCKETS = (_MAX_BITS - _MIN_BITS + 1) * _SUB_BUCKETS
+
+def _bucket_index(duration_ns: int) -> int:
+    bits = duration_ns.bit_length()
+    if bits <= _MIN_BITS:
+        return 0
+    if bits > _MAX_BITS:
+        return _BUCKETS - 1
+    # The two bits below the leading one select the linear sub-bucket.
+    return (bits - _MIN_BITS) * _SUB_BUCKETS + ((duration_ns >> (bits - 3)) & 3)
+
+def _bucket_bounds(index: int):
+    """Returns the [lower, upper) bounds in ns of a bucket."""
+    octave, sub = divmod(index, _SUB_BUCKETS)
+    if octave == 0:
+        return 0, 1 << _MIN_BITS
+    shift = octave + _MIN_BITS - 3
+    return (_SUB_BUCKETS + sub) << shift, (_SUB_BUCKETS + sub + 1) << shift
+
+def opcode_of(command_body: str) -> str:
+    """
+    Returns the opcode of a command, e.g. "GP" for "M1GP" or "I" for "I3".
+
+    Motor commands are identified by the two letters after the motor number;
+    I/O commands by their first letter.
+    """
+    if command_body[:1] != "M":
+        return command_body[:1]
+    i = 1
+    while i < len(command_body) and command_body[i].isdigit():
+        i += 1
+    return command_body[i:i + 2]
+
+class CommandTrace(NamedTuple):
+    """Describes one completed (or failed) command, as passed to trace hooks."""
+    command: str
+    opcode: str
+    start_ns: int
+    duration_ns: int
+    error: Optional[BaseException]
+
+TraceHook = Callable[[CommandTrace], None]
+
+class LatencyHistogram:
+    """
+    Fixed-memory histogram of latencies with power-of-two buckets.
+
+    Recording is O(1) and the memory use does not grow with the number of
+    samples. Percentiles are interpolated within a bucket, so they are
+    accurate to within about 25%.
+    """
+    __slots__ = ("_counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self._counts = array("Q", bytes(8 * _BUCKETS))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        self._counts[_bucket_index(duration_ns)] += 1
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+
+    def percentile(self, p: float) -> float:
+        """Returns an estimate in ns of the p-th percentile latency."""
+        if self.count == 0:
+            return 0.0
+        threshold = p / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count and seen + bucket_count >= threshold:
+                lower, upper = _bucket_bounds(index)
+                estimate = lower + (upper - lower) * (threshold - seen) / bucket_count
+                return float(min(max(estimate, self.min_ns), self.max_ns))
+            seen += bucket_count
+        return float(self.max_ns)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Returns the summary statistics in microseconds."""
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "min_us": self.min_ns / 1000,
+            "p50_us": self.percentile(50) / 1000,
+            "p90_us": self.percentile(90) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+class CommandMetrics:
+    """
+    Counters and per-opcode latency histograms for a controller connection.
+
+    ClearCoreController keeps one of these as `metrics` and updates it on
+    every exchange. The latency of a command runs from the moment its batch
+    was written to the moment its response was read, so pipelined commands
+    include the time spent queued behind earlier ones.
+    """
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.commands = 0
+        self.exchanges = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.errors = 0
+        self.reconnects = 0
+        # Read-only exchanges sent again after the connection was reopened.
+        self.replays = 0
+        # Exceptions raised by trace hooks, which are caught so they cannot break an exchange.
+        self.hook_errors = 0
+        self.last_hook_error: Optional[Exception] = None
+        self._hooks: List[TraceHook] = []
+        self._started = time.monotonic()
+
+    @property
+    def tracing(self) -> bool:
+        """Returns True if any trace hooks are registered."""
+        return bool(self._hooks)
+
+    def add_trace_hook(self, hook: TraceHook) -> None:
+        """
+        Registers a function that is called with a CommandTrace for every command.
+
+        Hooks run on the thread that sent the command while the connection is
+        held, so they should return quickly. An exception raised by a hook is
+        caught and counted in `hook_errors`, since the responses of the
+        exchange still have to be read; the latest one is kept in
+        `last_hook_error`.
+        """
+        self._hooks.append(hook)
+
+    def remove_trace_hook(self, hook: TraceHook) -> None:
+        """Unregisters a trace hook."""
+        self._hooks.remove(hook)
+
+    def record(self, command_body: str, start_ns: int, duration_ns: int,
+               error: Optional[BaseException] = None) -> None:
+        """Records the outcome of one command."""
+        opcode = opcode_of(command_body)
+        histogram = self.histograms.get(opcode)
+        if histogram is None:
+            histogram = self.histograms[opcode] = LatencyHistogram()
+        histogram.record(duration_ns)
+        self.commands += 1
+        if error is not None:
+            self.errors += 1
+        if self._hooks:
+            trace = CommandTrace(command_body, opcode, start_ns, duration_ns, error)
+            for hook in self._hooks:
+                try:
+                    hook(trace)
+                except Exception as e:
+                    # Raising here would abandon the exchange with responses still unread.
+                    self.hook_errors += 1
+                    self.last_hook_error = e
+
+    def reset(self) -> None:
+        """Clears all counters and histograms. Trace hooks stay registered."""
+        self.histograms.clear()
+        self.commands = self.exchanges = 0
+        self.bytes_sent = self.bytes_received = 0
+        self.errors = self.reconnects = self.replays = self.hook_errors = 0
+        self.last_hook_error = None
+        self._started = time.monotonic()
+
+    def snapshot(self) -> Dict[str, object]:
+        """Returns a JSON-serializable copy of the current metrics."""
+        return {
+            "uptime_s": time.monotonic() - self._started,
+            "commands": self.commands,
+            "exchanges": self.exchanges,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "errors": self.errors,
+            "reconnects": self.reconnects,
+            "replays": self.replays,
+            "hook_errors": self.hook_errors,
+            "latency": {opcode: h.snapshot() for opcode, h in sorted(self.histograms.items())},
+        }
+
+    def export(self, path: str) -> None:
+        """Writes a snapshot of the metrics to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
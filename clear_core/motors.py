@@ -1,11 +1,15 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 from enum import IntEnum
 
+from .protocol import Frame, is_rejected, parse_int
+
 # This block is only processed by type checkers, not at runtime.
 # It prevents a circular import error because controller.py will import this file.
 if TYPE_CHECKING:
     from .controller import ClearCoreController
+    from .streaming import MotionStream, StreamMode
 
 
 
@@ -16,8 +20,48 @@ class Status(IntEnum):
     READY = 3
     MOVING = 4
 
+@dataclass(frozen=True)
+class AxisMove:
+    """One axis of a coordinated multi-axis move."""
+    motor: int
+    steps: int
+    relative: bool = False
+    velocity: Optional[int] = None
+    acceleration: Optional[int] = None
+    deceleration: Optional[int] = None
+
+@dataclass(frozen=True)
+class MultiAxisAck:
+    """The combined acknowledgement of a multi-axis move."""
+    commands: Tuple[str, ...]
+    responses: Tuple[str, ...]
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if no command was rejected by the controller.
+
+        Rejections are recognised by protocol.is_rejected(), which assumes the
+        firmware's "ERR" reply; see there.
+        """
+        return not any(is_rejected(response) for response in self.responses)
+
+# Responses echo a 3-byte header (e.g. "M1 ") before the value.
+def _parse_position(response: Frame) -> int:
+    return parse_int(response, 3)
+
+def _parse_status(response: Frame) -> Status:
+    return Status(parse_int(response, 3))
+
 class MotorControl:
-    """Handles all motor-related commands."""
+    """
+    Handles all motor-related commands.
+
+    Commands are executed by the object passed in as `controller`. On a
+    ClearCoreController each call blocks and returns the response; on a
+    CommandBatch it returns a PendingResponse that resolves when the batch
+    is flushed.
+    """
     def __init__(self, controller: 'ClearCoreController'):
         """
         Initializes the MotorControl class.
@@ -29,43 +73,97 @@ class MotorControl:
 
     def enable(self, motor: int) -> str:
         """Enables a specific motor."""
-        return self._controller._send_command(f"M{motor}EN")
+        return self._controller._request(f"M{motor}EN")
 
     def disable(self, motor: int) -> str:
         """Disables a specific motor."""
-        return self._controller._send_command(f"M{motor}DE")
+        return self._controller._request(f"M{motor}DE")
 
     def absolute_move(self, motor: int, steps: int) -> str:
         """Moves a motor to an absolute position specified by steps."""
-        return self._controller._send_command(f"M{motor}AM{steps}")
+        return self._controller._request(f"M{motor}AM{steps}")
 
     def relative_move(self, motor: int, steps: int) -> str:
         """Moves a motor by a relative number of steps."""
-        return self._controller._send_command(f"M{motor}RM{steps}")
+        return self._controller._request(f"M{motor}RM{steps}")
 
     def clear_alerts(self, motor: int) -> str:
         """Clears any alerts associated with a specific motor."""
-        return self._controller._send_command(f"M{motor}CA")
+        return self._controller._request(f"M{motor}CA")
 
     def get_position(self, motor: int) -> int:
         """Gets the current position of a motor."""
-        response = self._controller._send_command(f"M{motor}GP")[3:]
-        return int(response.strip())
+        return self._controller._request(f"M{motor}GP", _parse_position)
 
     def set_velocity(self, motor:int, velo: int) -> str:
-        return self._controller._send_command(f"M{motor}SV{velo}")
+        return self._controller._request(f"M{motor}SV{velo}")
     
     def set_acceleration(self, motor:int, accel: int) -> str:
-        return self._controller._send_command(f"M{motor}SA{accel}")
+        return self._controller._request(f"M{motor}SA{accel}")
 
     def set_deceleration(self, motor:int, decel: int) ->str:
-        return self._controller._send_command(f"M{motor}SD{decel}")
+        return self._controller._request(f"M{motor}SD{decel}")
 
     def get_status(self, motor: int) -> Status:
         """Gets the status of a motor."""
-        response = int(self._controller._send_command(f"M{motor}GS")[3:])
-        return Status(response)
+        return self._controller._request(f"M{motor}GS", _parse_status)
 
     def abrupt_stop(self, motor: int) -> str:
         """Stops a motor abruptly."""
-        return self._controller._send_command(f"M{motor}AS")
+        return self._controller._request(f"M{motor}AS")
+
+    def move_axes(self, moves: Iterable[AxisMove]) -> MultiAxisAck:
+        """
+        Moves several motors together in a single exchange.
+
+        Velocity, acceleration and deceleration settings for every axis are
+        sent first, followed by all of the move commands back to back, in one
+        write. The controller receives the moves in the same packet, so the
+        axes start within the time it takes to parse them instead of one
+        round trip apart. (The firmware has no dedicated synchronized-start
+        command, so this is as close as the protocol allows.)
+
+        Returns:
+            One acknowledgement covering every command that was sent.
+        """
+        settings: List[str] = []
+        starts: List[str] = []
+        for move in moves:
+            motor = move.motor
+            if move.velocity is not None:
+                settings.append(f"M{motor}SV{move.velocity}")
+            if move.acceleration is not None:
+                settings.append(f"M{motor}SA{move.acceleration}")
+            if move.deceleration is not None:
+                settings.append(f"M{motor}SD{move.deceleration}")
+            starts.append(f"M{motor}{'RM' if move.relative else 'AM'}{move.steps}")
+
+        commands = settings + starts
+        return self._controller._request_group(
+            commands, [None] * len(commands),
+            lambda responses: MultiAxisAck(tuple(commands), tuple(responses)))
+
+    def stream(self, motor: int, mode: Optional['StreamMode'] = None, rate_hz: float = 50.0,
+               max_in_flight: int = 2, **options) -> 'MotionStream':
+        """
+        Returns a MotionStream that sends setpoints to a motor at a fixed rate.
+
+        Run it over an iterable of setpoints with `run()`, or call `step()`
+        once per iteration of an existing control loop. Only available on a
+        ClearCoreController, since streaming keeps commands in flight.
+
+        Args:
+            motor: The motor that follows the setpoints.
+            mode: StreamMode.VELOCITY (the default) or StreamMode.POSITION.
+            rate_hz: How many setpoints to send per second.
+            max_in_flight: The most ticks whose responses may be outstanding.
+            **options: Passed on to MotionStream (max_age, horizon, limits).
+
+        Example:
+            jog = cc.motors.stream(2, limits=(-80000, 0))
+            jog.run(Setpoint.now(v) for v in joystick_velocities())
+        """
+        # Imported here because streaming.py builds on this module.
+        from .streaming import MotionStream, StreamMode
+        return MotionStream(self._controller, motor, mode or StreamMode.VELOCITY,
+                            rate_hz, max_in_flight, **options)
@@ -0,0 +1,190 @@
+"""
+Wire-level framing for the ClearCore command protocol.
+
+A command is sent as STX (0x02), the ASCII command body, then DC3 (0x13).
+The controller answers each command with one response frame, terminated by
+DC3 or a newline and optionally preceded by STX. Responses arrive in the order
+the commands were sent, but TCP is free to split a frame across several reads
+or merge several frames into one, so they have to be reassembled here.
+"""
+from typing import Callable, Optional, Union
+
+STX = 0x02
+ETX = 0x13  # The ClearCore firmware ends frames with DC3 rather than ETX (0x03).
+LF = 0x0A
+
+# Bytes that are not part of a response payload when they appear at its edges.
+_PADDING = frozenset(b"\x02\r\n\t ")
+
+Frame = Union[bytes, bytearray, memoryview]
+
+def encode_command(command_body: str) -> bytes:
+    """Wraps a command body in the protocol's start and end bytes."""
+    return b"\x02" + command_body.encode('ascii') + b"\x13"
+
+def decode_text(frame: Frame) -> str:
+    """Returns a response frame as a string."""
+    return str(frame, 'ascii')
+
+# Reply to a command the controller refused, as given by ClearCoreSimulator.
+REJECTED = "ERR"
+
+def is_rejected(response: str) -> bool:
+    """
+    Returns True if a text response reports that the command was rejected.
+
+    This assumes the firmware ends the reply to a refused command with "ERR",
+    as the simulator does. Like the command strings themselves, that reply is
+    not confirmed against the real firmware; if it differs, only this
+    function needs to change.
+    """
+    return response.endswith(REJECTED)
+
+def parse_int(frame: Frame, offset: int = 0) -> int:
+    """
+    Parses a signed decimal integer from a response frame without building
+    intermediate bytes or str objects.
+
+    Args:
+        frame: The raw response frame.
+        offset: Index of the first byte of the number, skipping the response header.
+
+    Raises:
+        ValueError: If the bytes from `offset` onwards are not a valid integer.
+    """
+    end = len(frame)
+    i = offset
+    while i < end and frame[i] == 0x20:
+        i += 1
+    negative = i < end and frame[i] == 0x2D  # '-'
+    if negative or (i < end and frame[i] == 0x2B):  # '+'
+        i += 1
+    if i >= end:
+        raise ValueError(f"No integer in response {bytes(frame)!r}.")
+
+    value = 0
+    while i < end:
+        digit = frame[i] - 0x30
+        if not 0 <= digit <= 9:
+            if frame[i] == 0x20:
+                break
+            raise ValueError(f"Invalid integer in response {bytes(frame)!r}.")
+        value = value * 10 + digit
+        i += 1
+    return -value if negative else value
+
+class FrameReader:
+    """
+    Reassembles response frames from a byte stream.
+
+    Received bytes land in one persistent buffer through `recv_into`, and
+    frames are handed out as memoryview slices of that buffer, so reading a
+    response does not allocate new bytes or str objects. A returned frame is
+    only valid until the next call to `read_frame`; parse it (or copy it)
+    before reading again.
+    """
+    def __init__(self, size: int = 4096):
+        """
+        Initializes the FrameReader class.
+
+        Args:
+            size: Initial capacity of the receive buffer in bytes. The buffer
+                  grows if a single frame does not fit.
+        """
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First unconsumed byte.
+        self._end = 0    # One past the last received byte.
+        self.bytes_received = 0
+
+    @property
+    def buffered(self) -> int:
+        """Number of received bytes not yet returned as frames."""
+        return self._end - self._start
+
+    def clear(self) -> None:
+        """Discards any partially received data, e.g. after a reconnect."""
+        self._start = self._end = 0
+
+    def read_frame(self, recv_into: Callable[[memoryview], int]) -> memoryview:
+        """
+        Returns the next non-empty response frame with its delimiters stripped.
+
+        Args:
+            recv_into: Called with a writable view of the free buffer space
+                       whenever more data is needed, e.g. `sock.recv_into`.
+                       It must return the number of bytes written.
+
+        Raises:
+            ConnectionError: If `recv_into` reports end of stream.
+        """
+        while True:
+            frame = self.next_frame()
+            if frame is not None:
+                return frame
+            self._fill(recv_into)
+
+    def feed(self, data: Frame) -> None:
+        """
+        Appends received bytes to the buffer.
+
+        This is the push-style counterpart of `read_frame` for callers that
+        receive data themselves, such as asyncio stream readers.
+        """
+        size = len(data)
+        if self._start == self._end:
+            self._start = self._end = 0
+        while len(self._buffer) - self._end < size:
+            self._compact()
+        self._view[self._end:self._end + size] = data
+        self._end += size
+        self.bytes_received += size
+
+    def next_frame(self) -> Optional[memoryview]:
+        """Returns the next complete frame already in the buffer, or None."""
+        buffer = self._buffer
+        while self._start < self._end:
+            end = buffer.find(ETX, self._start, self._end)
+            newline = buffer.find(LF, self._start, end if end >= 0 else self._end)
+            if newline >= 0:
+                end = newline
+            if end < 0:
+                return None
+
+            first, last = self._start, end
+            self._start = end + 1
+            while first < last and buffer[first] in _PADDING:
+                first += 1
+            while last > first and buffer[last - 1] in _PADDING:
+                last -= 1
+            if first < last:
+                return self._view[first:last]
+            # Empty frame, e.g. the "\n" of a "\x13\r\n" terminated response.
+        return None
+
+    def _fill(self, recv_into: Callable[[memoryview], int]) -> None:
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buffer):
+            self._compact()
+
+        received = recv_into(self._view[self._end:])
+        if not received:
+            raise ConnectionError("Connection closed by controller.")
+        self._end += received
+        self.bytes_received += received
+
+    def _compact(self) -> None:
+        """Moves unconsumed bytes to the front, growing the buffer if it is full."""
+        pending = self._end - self._start
+        if self._start == 0:
+            # A single frame fills the whole buffer: double the capacity. Frames
+            # handed out earlier may still hold views of the old buffer, which
+            # therefore cannot be resized; copy into a new one instead.
+            buffer = bytearray(2 * len(self._buffer))
+            buffer[:pending] = self._view[:pending]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+            return
+        self._view[:pending] = self._view[self._start:self._end]
+        self._start, self._end = 0, pending
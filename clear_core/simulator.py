@@ -0,0 +1,398 @@
+"""
+Local stand-in for a ClearCore controller.
+
+ClearCoreSimulator is a TCP server that speaks the same protocol as the
+clear_core client and simulates the motors and I/O behind it, so the client,
+the demos and benchmarks can run without hardware. Network behaviour can be
+degraded with a fixed latency, random jitter and fragmentation of response
+frames into small TCP segments.
+
+Run it standalone with:
+
+    python -m clear_core.simulator --port 8888 --latency 0.002
+"""
+import os
+import queue
+import random
+import re
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .motors import Status
+from .protocol import ETX, REJECTED, FrameReader, decode_text
+
+_MOTOR_COMMAND = re.compile(r"M(\d+)(EN|DE|AM|RM|GP|GS|SV|SA|SD|AS|CA)(-?\d+)?$")
+_OUTPUT_COMMAND = re.compile(r"O(\d+)S([01])$")
+_INPUT_COMMAND = re.compile(r"I(\d+)$")
+
+# Integration step used when advancing motor kinematics, in seconds.
+_TIME_STEP = 0.001
+
+InputSource = Union[bool, Callable[["ClearCoreSimulator"], bool]]
+
+class SimulatedMotor:
+    """
+    Kinematic model of one motor axis.
+
+    Moves follow a trapezoidal velocity profile limited by the configured
+    velocity, acceleration and deceleration. Positions are in steps, rates in
+    steps per second (squared).
+    """
+    def __init__(self, velocity: float = 10000, acceleration: float = 100000,
+                 deceleration: float = 100000, enable_time: float = 0.05):
+        """
+        Initializes the SimulatedMotor class.
+
+        Args:
+            velocity: Initial velocity limit.
+            acceleration: Initial acceleration limit.
+            deceleration: Initial deceleration limit.
+            enable_time: How long the motor stays ENABLING after an enable command.
+        """
+        self.status = Status.DISABLED
+        self.position = 0.0
+        self.velocity = 0.0
+        self.target = 0.0
+        self.max_velocity = float(velocity)
+        self.acceleration = float(acceleration)
+        self.deceleration = float(deceleration)
+        self.enable_time = enable_time
+        self._enabled_at = 0.0
+
+    def enable(self, now: float) -> None:
+        if self.status == Status.DISABLED:
+            self.status = Status.ENABLING
+            self._enabled_at = now
+
+    def disable(self) -> None:
+        self.status = Status.DISABLED
+        self.velocity = 0.0
+        self.target = self.position
+
+    def fault(self) -> None:
+        """Puts the motor into the FAULTED state, stopping it immediately."""
+        self.status = Status.FAULTED
+        self.velocity = 0.0
+        self.target = self.position
+
+    def clear_alerts(self) -> None:
+        if self.status == Status.FAULTED:
+            self.status = Status.DISABLED
+
+    def move_to(self, target: float) -> bool:
+        """Starts a move. Returns False if the motor cannot move in its current state."""
+        if self.status not in (Status.READY, Status.MOVING):
+            return False
+        self.target = float(target)
+        self.status = Status.MOVING
+        return True
+
+    def stop(self) -> None:
+        self.velocity = 0.0
+        self.target = self.position
+        if self.status == Status.MOVING:
+            self.status = Status.READY
+
+    def advance(self, now: float, dt: float) -> None:
+        """Advances the motor state by `dt` seconds ending at time `now`."""
+        if self.status == Status.ENABLING and now - self._enabled_at >= self.enable_time:
+            self.status = Status.READY
+        if self.status != Status.MOVING:
+            return
+
+        while dt > 0:
+            step = min(dt, _TIME_STEP)
+            dt -= step
+            remaining = self.target - self.position
+            direction = 1.0 if remaining > 0 else -1.0
+            speed = self.velocity * direction  # Speed towards the target.
+            stopping_distance = speed * speed / (2 * self.deceleration) if speed > 0 else 0.0
+
+            if abs(remaining) <= stopping_distance:
+                speed = max(speed - self.deceleration * step, 0.0)
+            else:
+                speed = min(speed + self.acceleration * step, self.max_velocity)
+
+            travel = speed * step
+            if travel >= abs(remaining) or (speed == 0.0 and abs(remaining) < 1.0):
+                self.position = self.target
+                self.velocity = 0.0
+                self.status = Status.READY
+                return
+            self.position += travel * direction
+            self.velocity = speed * direction
+
+class ClearCoreSimulator:
+    """
+    TCP server that emulates a ClearCore controller.
+
+    Responses carry a 3-character header (the first two characters of the
+    command and a space) followed by the value, e.g. "M1 -1500" for
+    "M1GP" or "I0 1" for "I0". Commands that only change state are answered
+    with "OK", rejected ones with "ERR".
+
+    It is designed to be used as a context manager with a 'with' statement,
+    which starts the server on a background thread.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, motors: int = 4,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 fragment_size: Optional[int] = None, seed: Optional[int] = None,
+                 unix_path: Optional[str] = None):
+        """
+        Initializes the ClearCoreSimulator class.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on. 0 picks a free port; see `address`.
+            motors: Number of motor connectors (M0 to M{motors-1}).
+            latency: Fixed delay in seconds added before each response is sent.
+            jitter: Upper bound in seconds of a random delay added to the latency.
+            fragment_size: If set, responses are sent in random chunks of at most
+                           this many bytes to exercise the client's framing.
+            seed: Seed for the jitter and fragmentation random generator.
+            unix_path: If set, listen on a Unix-domain socket at this path
+                       instead of TCP; host and port are then ignored.
+        """
+        self.motors: List[SimulatedMotor] = [SimulatedMotor() for _ in range(motors)]
+        self.outputs: Dict[int, bool] = {}
+        self.latency = latency
+        self.jitter = jitter
+        self.fragment_size = fragment_size
+        self.commands_handled = 0
+
+        self._inputs: Dict[int, InputSource] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._last_update = time.monotonic()
+        self._server: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._connections: List[socket.socket] = []
+        self._running = threading.Event()
+        self._bind = (host, port)
+        self.unix_path = unix_path
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The (host, port) the server is listening on."""
+        if self._server is None:
+            raise RuntimeError("Simulator is not running.")
+        if self.unix_path is not None:
+            raise RuntimeError(f"Simulator is listening on the Unix socket {self.unix_path}.")
+        return self._server.getsockname()[:2]
+
+    def set_input(self, pin: int, value: InputSource) -> None:
+        """
+        Sets a digital input pin.
+
+        Args:
+            pin: The input pin number.
+            value: A fixed state, or a callable that receives the simulator and
+                   returns the state each time the pin is read, e.g. to model
+                   an end-of-travel sensor from a motor's position.
+        """
+        with self._lock:
+            self._inputs[pin] = value
+
+    def read_input(self, pin: int) -> bool:
+        source = self._inputs.get(pin, False)
+        return bool(source(self) if callable(source) else source)
+
+    def update(self) -> None:
+        """Advances every motor to the current time."""
+        now = time.monotonic()
+        dt, self._last_update = now - self._last_update, now
+        for motor in self.motors:
+            motor.advance(now, dt)
+
+    def handle(self, command_body: str) -> str:
+        """Executes one command and returns the response payload."""
+        with self._lock:
+            self.update()
+            self.commands_handled += 1
+            header = command_body[:2] + " "
+            return header + self._execute(command_body)
+
+    def start(self) -> None:
+        """Starts listening and serving connections on background threads."""
+        if self._server is not None:
+            return
+        if self.unix_path is not None:
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(self.unix_path)
+            self._server.listen()
+        else:
+            self._server = socket.create_server(self._bind)
+        self._running.set()
+        self._spawn(self._accept_loop, "accept")
+
+    def stop(self) -> None:
+        """Stops the server and closes every client connection."""
+        self._running.clear()
+        server, self._server = self._server, None
+        # Shutting down (not just closing) wakes threads blocked in accept() and recv().
+        with self._lock:
+            sockets = ([server] if server is not None else []) + self._connections
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads.clear()
+        self._connections.clear()
+        if self.unix_path is not None and server is not None and os.path.exists(self.unix_path):
+            os.unlink(self.unix_path)
+
+    def __enter__(self):
+        """Context manager entry: starts the server."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: stops the server."""
+        self.stop()
+
+    def _execute(self, command_body: str) -> str:
+        match = _MOTOR_COMMAND.match(command_body)
+        if match:
+            index, opcode, argument = int(match.group(1)), match.group(2), match.group(3)
+            if index >= len(self.motors):
+                return REJECTED
+            return self._execute_motor(self.motors[index], opcode, argument)
+
+        match = _OUTPUT_COMMAND.match(command_body)
+        if match:
+            self.outputs[int(match.group(1))] = match.group(2) == "1"
+            return "OK"
+
+        match = _INPUT_COMMAND.match(command_body)
+        if match:
+            return "1" if self.read_input(int(match.group(1))) else "0"
+
+        return REJECTED
+
+    def _execute_motor(self, motor: SimulatedMotor, opcode: str, argument: Optional[str]) -> str:
+        if opcode == "GP":
+            return str(int(round(motor.position)))
+        if opcode == "GS":
+            return str(int(motor.status))
+
+        value = int(argument) if argument is not None else None
+        if opcode in ("AM", "RM", "SV", "SA", "SD") and value is None:
+            return REJECTED
+
+        if opcode == "EN":
+            motor.enable(time.monotonic())
+        elif opcode == "DE":
+            motor.disable()
+        elif opcode == "CA":
+            motor.clear_alerts()
+        elif opcode == "AS":
+            motor.stop()
+        elif opcode == "AM":
+            if not motor.move_to(value):
+                return REJECTED
+        elif opcode == "RM":
+            if not motor.move_to(motor.target + value if motor.status == Status.MOVING else motor.position + value):
+                return REJECTED
+        elif opcode == "SV":
+            motor.max_velocity = float(value)
+        elif opcode == "SA":
+            motor.acceleration = float(value)
+        elif opcode == "SD":
+            motor.deceleration = float(value)
+        return "OK"
+
+    def _spawn(self, target: Callable, name: str, *args) -> None:
+        thread = threading.Thread(target=target, args=args, name=f"clear-core-sim-{name}", daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept_loop(self) -> None:
+        assert self._server is not None
+        server = self._server
+        while self._running.is_set():
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                return
+            if connection.family != socket.AF_UNIX:
+                # Send each fragment as its own segment instead of letting Nagle merge them.
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._connections.append(connection)
+            outbox: "queue.Queue[Optional[Tuple[float, bytes]]]" = queue.Queue()
+            self._spawn(self._receive_loop, "recv", connection, outbox)
+            self._spawn(self._send_loop, "send", connection, outbox)
+
+    def _receive_loop(self, connection: socket.socket, outbox: queue.Queue) -> None:
+        """Reads commands, executes them on arrival and schedules their responses."""
+        frames = FrameReader()
+        last_due = 0.0
+        try:
+            while self._running.is_set():
+                frame = frames.read_frame(connection.recv_into)
+                response = self.handle(decode_text(frame))
+                delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+                # Responses keep their order even when jitter would reorder them.
+                last_due = max(last_due, time.monotonic() + delay)
+                outbox.put((last_due, b"\x02" + response.encode('ascii') + bytes((ETX,))))
+        except OSError:
+            pass
+        finally:
+            outbox.put(None)
+
+    def _send_loop(self, connection: socket.socket, outbox: queue.Queue) -> None:
+        try:
+            while True:
+                item = outbox.get()
+                if item is None:
+                    return
+                due, data = item
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if self.fragment_size:
+                    while data:
+                        size = self._random.randint(1, self.fragment_size)
+                        connection.sendall(data[:size])
+                        data = data[size:]
+                else:
+                    connection.sendall(data)
+        except OSError:
+            pass
+        finally:
+            connection.close()
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+
+def _main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a simulated ClearCore controller.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--latency", type=float, default=0.0, help="Response delay in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum extra random delay in seconds.")
+    parser.add_argument("--fragment-size", type=int, default=None,
+                        help="Split responses into segments of at most this many bytes.")
+    args = parser.parse_args()
+
+    with ClearCoreSimulator(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                            fragment_size=args.fragment_size) as simulator:
+        host, port = simulator.address
+        print(f"Simulated ClearCore listening on {host}:{port}. Press Ctrl+C to exit.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\nExiting.")
+
+if __name__ == "__main__":
+    _main()
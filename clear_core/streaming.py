@@ -0,0 +1,271 @@
+from __future__ import annotations
+import time
+from collections import deque
+from enum import Enum
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .batch import PendingResponse
+from .motors import Status, _parse_position, _parse_status
+
+if TYPE_CHECKING:
+    from .controller import ClearCoreController
+
+class StreamMode(Enum):
+    """How the values of a setpoint stream are interpreted."""
+    POSITION = "position"  # Absolute target positions, in steps.
+    VELOCITY = "velocity"  # Signed velocities, in steps per second.
+
+class Setpoint(NamedTuple):
+    """One target of a motion stream."""
+    value: int
+    timestamp: float  # time.monotonic() when the setpoint was produced.
+
+    @classmethod
+    def now(cls, value: int) -> "Setpoint":
+        """Returns a setpoint stamped with the current time."""
+        return cls(value, time.monotonic())
+
+# A motor in one of these states cannot follow setpoints, so none are sent.
+_NOT_READY = (Status.DISABLED, Status.ENABLING, Status.FAULTED)
+
+class StreamStats:
+    """Counters for a MotionStream."""
+    def __init__(self):
+        self.ticks = 0
+        self.sent = 0
+        # Setpoints older than max_age when their tick came around.
+        self.dropped = 0
+        # Position setpoints equal to the target already sent.
+        self.skipped = 0
+        # Setpoints not sent because the motor reported it was not ready.
+        self.blocked = 0
+        # Ticks that had to wait for a response because the window was full.
+        self.waits = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Returns a JSON-serializable copy of the counters."""
+        return dict(vars(self))
+
+class MotionStream:
+    """
+    Streams position or velocity setpoints to one motor at a fixed command rate.
+
+    Each tick writes the motion command for the newest setpoint together with
+    a status and position query, without waiting for the responses. At most
+    `max_in_flight` ticks are unanswered at a time; when the window is full
+    the stream waits for the oldest one, so a slow link lowers the effective
+    rate instead of building up a queue of outdated commands.
+
+    Velocity setpoints are turned into a rolling absolute move: the motor is
+    sent to `horizon` seconds of travel past its last reported position. If
+    the setpoints stop arriving, the motor runs out of target and stops on
+    its own, and after `max_age` seconds without a fresh setpoint it is
+    stopped explicitly.
+
+    Create streams with MotorControl.stream().
+    """
+    def __init__(self, controller: 'ClearCoreController', motor: int,
+                 mode: StreamMode = StreamMode.VELOCITY, rate_hz: float = 50.0,
+                 max_in_flight: int = 2, max_age: Optional[float] = None,
+                 horizon: Optional[float] = None, limits: Optional[Tuple[int, int]] = None):
+        """
+        Initializes the MotionStream class.
+
+        Args:
+            controller: The ClearCoreController to stream through.
+            motor: The motor that follows the setpoints.
+            mode: Whether setpoints are positions or velocities.
+            rate_hz: How many ticks to run per second.
+            max_in_flight: The most ticks whose responses may be outstanding.
+            max_age: Setpoints older than this many seconds are dropped.
+                     Defaults to two tick periods.
+            horizon: In velocity mode, how many seconds of travel ahead the
+                     motor is targeted. Defaults to enough to cover the window.
+            limits: Optional (lowest, highest) positions that targets are clamped to.
+        """
+        if not hasattr(controller, "_submit"):
+            raise TypeError("Streaming needs a connected ClearCoreController.")
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive.")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self._controller = controller
+        self.motor = motor
+        self.mode = mode
+        self.period = 1.0 / rate_hz
+        self.max_in_flight = max_in_flight
+        self.max_age = max_age if max_age is not None else 2 * self.period
+        self.horizon = horizon if horizon is not None else (max_in_flight + 2) * self.period
+        self.limits = limits
+        self.stats = StreamStats()
+
+        # Latest feedback from the motor, None until the first response arrives.
+        self.position: Optional[int] = None
+        self.status: Optional[Status] = None
+
+        # (status, position) placeholders of each tick still in flight, oldest first.
+        self._ticks: Deque[Tuple[PendingResponse, PendingResponse]] = deque()
+        self._target: Optional[int] = None
+        self._speed = 0
+        self._velocity = 0
+        self._last_fresh = time.monotonic()
+        self._running = False
+
+    def step(self, setpoint: Optional[Setpoint]) -> None:
+        """
+        Runs one tick of the stream.
+
+        Args:
+            setpoint: The newest setpoint, or None if there is no new one.
+                      The previous target is kept until a fresh setpoint arrives.
+        """
+        stats = self.stats
+        stats.ticks += 1
+        self._update_feedback()
+
+        now = time.monotonic()
+        if setpoint is not None and now - setpoint.timestamp > self.max_age:
+            stats.dropped += 1
+            setpoint = None
+        if setpoint is not None:
+            self._last_fresh = now
+
+        commands: List[str] = []
+        if self.status in _NOT_READY:
+            if setpoint is not None:
+                stats.blocked += 1
+            # The motor drops its move when it stops being ready; start over once it is.
+            self._target = None
+            self._velocity = 0
+        elif self.mode is StreamMode.POSITION:
+            if setpoint is not None:
+                commands = self._position_commands(setpoint.value)
+        elif setpoint is not None:
+            commands = self._velocity_commands(setpoint.value)
+        elif self._velocity and now - self._last_fresh > self.max_age:
+            # The setpoint source went quiet while the motor was moving.
+            commands = self._velocity_commands(0)
+        elif self._velocity:
+            # Keep the rolling target ahead of the motor until the setpoint expires.
+            commands = self._velocity_commands(self._velocity)
+
+        self._send(commands)
+
+    def run(self, setpoints: Iterable[Optional[Setpoint]], max_ticks: Optional[int] = None) -> StreamStats:
+        """
+        Pulls one setpoint per tick from `setpoints` and streams it on fixed deadlines.
+
+        Runs until the iterable is exhausted, stop() is called or `max_ticks`
+        ticks have run. A velocity stream leaves the motor stopped.
+        """
+        period = self.period
+        iterator = iter(setpoints)
+        self._running = True
+        deadline = time.monotonic()
+        try:
+            while self._running and (max_ticks is None or self.stats.ticks < max_ticks):
+                try:
+                    setpoint = next(iterator)
+                except StopIteration:
+                    break
+                self.step(setpoint)
+                deadline += period
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind; restart the schedule instead of bursting.
+                    deadline = time.monotonic()
+        finally:
+            self._running = False
+            self._wind_down()
+        return self.stats
+
+    def stop(self) -> None:
+        """Makes run() return after the current tick."""
+        self._running = False
+
+    def halt(self) -> None:
+        """Stops the motor right away and forgets the current target."""
+        self._send([f"M{self.motor}AS"])
+        self._target = None
+        self._velocity = 0
+
+    def flush(self) -> None:
+        """Waits for every response still in flight and updates the feedback."""
+        while self._ticks:
+            self._controller._collect(self._ticks[-1][1])
+            self._update_feedback()
+
+    def _position_commands(self, position: int) -> List[str]:
+        target = self._clamp(position)
+        if target == self._target:
+            self.stats.skipped += 1
+            return []
+        self._target = target
+        return [f"M{self.motor}AM{target}"]
+
+    def _velocity_commands(self, velocity: int) -> List[str]:
+        motor = self.motor
+        if velocity == 0:
+            if not self._velocity:
+                return []
+            self._velocity = 0
+            self._target = None
+            return [f"M{motor}AS"]
+        if self.position is None:
+            # No position feedback yet to aim from; it arrives with this tick.
+            return []
+        commands = []
+        speed = abs(velocity)
+        if speed != self._speed:
+            commands.append(f"M{motor}SV{speed}")
+            self._speed = speed
+        self._velocity = velocity
+        self._target = self._clamp(self.position + int(velocity * self.horizon))
+        commands.append(f"M{motor}AM{self._target}")
+        return commands
+
+    def _clamp(self, position: int) -> int:
+        if self.limits is None:
+            return position
+        low, high = self.limits
+        return min(max(position, low), high)
+
+    def _send(self, commands: List[str]) -> None:
+        if len(self._ticks) >= self.max_in_flight:
+            # The window is full: wait for the oldest tick before adding another.
+            self.stats.waits += 1
+            self._controller._collect(self._ticks[0][1])
+            self._update_feedback()
+        motor = self.motor
+        pending = self._controller._submit(
+            commands + [f"M{motor}GS", f"M{motor}GP"],
+            [None] * len(commands) + [_parse_status, _parse_position])
+        self.stats.sent += len(commands)
+        self._ticks.append((pending[-2], pending[-1]))
+
+    def _update_feedback(self) -> None:
+        """Takes the feedback of every tick whose responses have been read."""
+        ticks = self._ticks
+        while ticks and ticks[0][1].done:
+            status, position = ticks.popleft()
+            self.status = status.result()
+            self.position = position.result()
+
+    def __enter__(self):
+        """Context manager entry: returns the stream."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: stops a velocity stream and waits for outstanding responses."""
+        self._wind_down()
+
+    def _wind_down(self) -> None:
+        if not self._controller.is_connected:
+            # The connection is gone; there is nothing left to stop or wait for.
+            self._ticks.clear()
+            return
+        if self.mode is StreamMode.VELOCITY:
+            self.halt()
+        self.flush()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .motors import Status, _parse_position, _parse_status
+from .io import _parse_input
+from .protocol import Frame
+
+if TYPE_CHECKING:
+    from .controller import ClearCoreController
+
+class TelemetryPoller:
+    """
+    Polls motor and input state in the background and serves reads from a cache.
+
+    Every poll refreshes all selected motors and pins with a single batched
+    exchange. Reads return the cached value as long as it is younger than the
+    allowed staleness; an older (or never polled) value is refreshed
+    synchronously before it is returned, so a read never serves data older
+    than the caller asked for.
+
+    Use ClearCoreController.start_telemetry() rather than creating this directly.
+    """
+    def __init__(self, controller: 'ClearCoreController', motors: Iterable[int] = (),
+                 pins: Iterable[int] = (), rate_hz: float = 50.0,
+                 max_staleness: Optional[float] = None):
+        """
+        Initializes the TelemetryPoller class.
+
+        Args:
+            controller: The ClearCoreController to poll through.
+            motors: Motors whose position and status are polled.
+            pins: Digital input pins that are polled.
+            rate_hz: How many polls to run per second.
+            max_staleness: Default maximum age in seconds of a cached value.
+                           Defaults to two poll periods.
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive.")
+        self._controller = controller
+        self._period = 1.0 / rate_hz
+        self.max_staleness = max_staleness if max_staleness is not None else 2 * self._period
+
+        self._polled: Dict[str, Callable[[Frame], Any]] = {}
+        for motor in motors:
+            self._polled[f"M{motor}GP"] = _parse_position
+            self._polled[f"M{motor}GS"] = _parse_status
+        for pin in pins:
+            self._polled[f"I{pin}"] = _parse_input
+
+        # Command body -> (value, time.monotonic() when it was received).
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.poll_count = 0
+        self.refresh_count = 0
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True while the background thread is polling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the background polling thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="clear-core-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background polling thread and waits for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def poll(self) -> None:
+        """
+        Refreshes every polled value in a single round trip.
+
+        Raises:
+            ConnectionError: If the exchange failed.
+            ValueError: The first response that could not be parsed. Every
+                        other value is still refreshed.
+        """
+        if not self._polled:
+            return
+        commands = list(self._polled)
+        errors: List[Optional[Exception]] = []
+        values = self._controller._send_commands(commands, [self._polled[c] for c in commands], errors)
+        now = time.monotonic()
+        for command, value, error in zip(commands, values, errors):
+            if error is None:
+                self._cache[command] = (value, now)
+        self.poll_count += 1
+        parse_error = next((e for e in errors if e is not None), None)
+        if parse_error is not None:
+            raise parse_error
+
+    def get_position(self, motor: int, max_staleness: Optional[float] = None) -> int:
+        """Returns the position of a motor, at most `max_staleness` seconds old."""
+        return self._read(f"M{motor}GP", _parse_position, max_staleness)
+
+    def get_status(self, motor: int, max_staleness: Optional[float] = None) -> Status:
+        """Returns the status of a motor, at most `max_staleness` seconds old."""
+        return self._read(f"M{motor}GS", _parse_status, max_staleness)
+
+    def read_input_pin(self, pin: int, max_staleness: Optional[float] = None) -> bool:
+        """Returns the state of a digital input pin, at most `max_staleness` seconds old."""
+        return self._read(f"I{pin}", _parse_input, max_staleness)
+
+    def age(self, command_body: str) -> float:
+        """Returns the age in seconds of a cached value, or infinity if it was never read."""
+        entry = self._cache.get(command_body)
+        return time.monotonic() - entry[1] if entry else float("inf")
+
+    def _read(self, command_body: str, parse: Callable[[Frame], Any], max_staleness: Optional[float]) -> Any:
+        limit = self.max_staleness if max_staleness is None else max_staleness
+        entry = self._cache.get(command_body)
+        if entry is not None and time.monotonic() - entry[1] <= limit:
+            return entry[0]
+
+        # Too old or never polled: go to the wire for this value only.
+        value = self._controller._request(command_body, parse)
+        self._cache[command_body] = (value, time.monotonic())
+        self.refresh_count += 1
+        return value
+
+    def _run(self) -> None:
+        next_poll = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+                self.last_error = None
+            except (ConnectionError, ValueError, IndexError) as e:
+                # Keep the last good values; reads will refresh or raise on their own.
+                # A malformed response only spoils this poll, so keep polling.
+                self.last_error = e
+            next_poll += self._period
+            delay = next_poll - time.monotonic()
+            if delay < 0:
+                # Polling fell behind; restart the schedule instead of bursting.
+                next_poll = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def __enter__(self):
+        """Context manager entry: starts polling."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: stops polling."""
+        self.stop()
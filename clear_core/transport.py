@@ -0,0 +1,173 @@
+"""
+Byte-stream transports that ClearCoreController sends commands over.
+
+A transport only knows how to open a connection. The connection it returns
+needs three methods, matching those of a connected socket: `sendall(data)`,
+`recv_into(buffer) -> int` and `close()`. The socket-based transports return
+the socket itself, so they add no per-call overhead. Errors are reported as
+OSError (socket.error), like a socket would.
+"""
+import socket
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Protocol
+
+from .protocol import ETX, Frame, FrameReader, decode_text
+
+class Connection(Protocol):
+    """An open byte stream to a controller."""
+    def sendall(self, data: bytes) -> None: ...
+    def recv_into(self, buffer: memoryview) -> int: ...
+    def close(self) -> None: ...
+
+class Transport(ABC):
+    """Opens connections to one controller. Subclasses implement `open`."""
+    @abstractmethod
+    def open(self) -> Connection:
+        """
+        Opens a new connection.
+
+        Raises:
+            OSError: If the connection could not be opened.
+        """
+
+class TcpTransport(Transport):
+    """TCP connection tuned for small, latency-sensitive command frames."""
+    def __init__(self, host: str, port: int, connect_timeout: Optional[float] = 3.0,
+                 read_timeout: Optional[float] = 2.0, keepalive_idle: Optional[int] = 5):
+        """
+        Initializes the TcpTransport class.
+
+        Args:
+            host: The controller's IP address or hostname.
+            port: The controller's TCP port.
+            connect_timeout: Seconds to wait for the connection to open, or None to wait forever.
+            read_timeout: Seconds to wait for a response, or None to wait forever.
+            keepalive_idle: Seconds of idle time before TCP keepalive probes are
+                            sent, or None to disable keepalive.
+        """
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keepalive_idle = keepalive_idle
+
+    def open(self) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+        try:
+            # Send each command frame right away instead of letting Nagle's algorithm hold it back.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.keepalive_idle is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # Probe timing options are not available on every platform.
+                if hasattr(socket, "TCP_KEEPIDLE"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle)
+                if hasattr(socket, "TCP_KEEPINTVL"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+                if hasattr(socket, "TCP_KEEPCNT"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            sock.settimeout(self.read_timeout)
+        except socket.error:
+            sock.close()
+            raise
+        return sock
+
+    def __str__(self) -> str:
+        return f"{self.host}:{self.port}"
+
+class UnixTransport(Transport):
+    """Unix-domain socket connection, e.g. to a local gateway or the simulator."""
+    def __init__(self, path: str, connect_timeout: Optional[float] = 3.0,
+                 read_timeout: Optional[float] = 2.0):
+        """
+        Initializes the UnixTransport class.
+
+        Args:
+            path: Filesystem path of the socket.
+            connect_timeout: Seconds to wait for the connection to open, or None to wait forever.
+            read_timeout: Seconds to wait for a response, or None to wait forever.
+        """
+        self.path = path
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    def open(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self.path)
+            sock.settimeout(self.read_timeout)
+        except socket.error:
+            sock.close()
+            raise
+        return sock
+
+    def __str__(self) -> str:
+        return self.path
+
+class LoopbackConnection:
+    """
+    In-process connection that hands each command straight to a handler.
+
+    Commands are executed while they are written, and their framed responses
+    wait in a buffer until they are read, so the client sees the same byte
+    stream a socket would deliver without any system calls.
+    """
+    def __init__(self, handler: Callable[[str], str]):
+        self._handler = handler
+        self._commands = FrameReader()
+        self._responses = bytearray()
+        self._read = 0  # Offset of the first response byte not yet read.
+        self._closed = False
+
+    def sendall(self, data: Frame) -> None:
+        if self._closed:
+            raise ConnectionResetError("Loopback connection is closed.")
+        commands = self._commands
+        commands.feed(data)
+        frame = commands.next_frame()
+        while frame is not None:
+            self._responses += self._handler(decode_text(frame)).encode('ascii')
+            self._responses.append(ETX)
+            frame = commands.next_frame()
+
+    def recv_into(self, buffer: memoryview) -> int:
+        if self._closed:
+            raise ConnectionResetError("Loopback connection is closed.")
+        available = len(self._responses) - self._read
+        if not available:
+            # Every response is produced by sendall(), so nothing more will arrive.
+            raise socket.timeout("No response pending on the loopback connection.")
+        size = min(len(buffer), available)
+        buffer[:size] = memoryview(self._responses)[self._read:self._read + size]
+        self._read += size
+        if self._read == len(self._responses):
+            del self._responses[:]
+            self._read = 0
+        return size
+
+    def close(self) -> None:
+        self._closed = True
+
+class LoopbackTransport(Transport):
+    """
+    Connects to a protocol handler in the same process.
+
+    The handler receives each command body and returns the response payload,
+    e.g. `ClearCoreSimulator().handle` (the simulator does not need to be
+    started). Useful for testing and benchmarking the command layer without
+    kernel networking in the measurements.
+    """
+    def __init__(self, handler: Callable[[str], str]):
+        """
+        Initializes the LoopbackTransport class.
+
+        Args:
+            handler: Called with each command body; returns the response payload.
+        """
+        self.handler = handler
+
+    def open(self) -> LoopbackConnection:
+        return LoopbackConnection(self.handler)
+
+    def __str__(self) -> str:
+        return "loopback"
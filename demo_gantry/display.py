@@ -0,0 +1,103 @@
+import sys
+import threading
+from typing import List, Optional, Sequence, TextIO
+
+class TerminalRenderer:
+    """
+    Redraws a block of status lines on the terminal from a background thread.
+
+    The control loop hands over each new frame with `submit()`, which only
+    stores a reference and never touches stdout. A separate thread redraws at
+    most `refresh_hz` times per second, and only rewrites the lines that
+    changed since the last redraw, using ANSI cursor positioning.
+
+    It is designed to be used as a context manager with a 'with' statement.
+    """
+    def __init__(self, refresh_hz: float = 20.0, stream: TextIO = sys.stdout):
+        """
+        Initializes the TerminalRenderer class.
+
+        Args:
+            refresh_hz: Maximum number of redraws per second.
+            stream: The terminal to draw on.
+        """
+        if refresh_hz <= 0:
+            raise ValueError("refresh_hz must be positive.")
+        self._interval = 1.0 / refresh_hz
+        self._stream = stream
+        self._frame: Optional[Sequence[str]] = None
+        self._shown: List[str] = []
+        self._cleared = False
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.redraws = 0
+
+    def submit(self, lines: Sequence[str]) -> None:
+        """Sets the frame to display. Never blocks; only the newest frame is drawn."""
+        self._frame = lines
+        self._wake.set()
+
+    def start(self) -> None:
+        """Starts the redraw thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="gantry-display", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Draws the last submitted frame, stops the thread and leaves the cursor below the frame."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        if self._cleared:
+            self._stream.write(f"\033[{len(self._shown) + 1};1H")
+            self._stream.flush()
+
+    def render(self) -> None:
+        """Redraws the changed lines of the current frame immediately."""
+        frame = self._frame
+        if frame is None:
+            return
+        shown = self._shown
+        parts = []
+        if not self._cleared:
+            # \033[2J clears the entire screen, \033[H moves the cursor to the top-left corner.
+            parts.append("\033[2J\033[H")
+            self._cleared = True
+            shown = []
+
+        for row, line in enumerate(frame):
+            if row >= len(shown) or shown[row] != line:
+                # Move to the row, write the line and clear whatever was left of the old one.
+                parts.append(f"\033[{row + 1};1H{line}\033[K")
+        for row in range(len(frame), len(shown)):
+            parts.append(f"\033[{row + 1};1H\033[K")
+
+        self._shown = list(frame)
+        if parts:
+            self._stream.write("".join(parts))
+            self._stream.flush()
+            self.redraws += 1
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            self.render()
+            # Cap the refresh rate; frames submitted meanwhile are coalesced.
+            self._stop_event.wait(self._interval)
+        self.render()
+
+    def __enter__(self):
+        """Context manager entry: starts the redraw thread."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: stops the redraw thread."""
+        self.stop()
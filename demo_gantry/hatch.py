@@ -1,8 +1,12 @@
-from enum import IntFlag
+import time
+from collections import deque
+from enum import Enum, IntFlag
 from dataclasses import dataclass
+from typing import Deque, NamedTuple, Optional, Tuple
 
 
 from clear_core.controller import ClearCoreController
+from clear_core.motors import Status
 
 
 HATCH_MOTOR_ID = 1
@@ -30,10 +34,144 @@ def select_params(action: Action):
         return MoveParameters(CLOSE_STROKE, CLOSE_SENSOR_ID)
 
 def update_hatch(controller: ClearCoreController):
-    hatch_ready = controller.motors.get_status(HATCH_MOTOR_ID) == 3
-    params = select_params(Action(controller.io.read_input_pin(PE_SENSOR_ID)))
-    in_position_res = controller.io.read_input_pin(params.sensor_id)
+    # Read everything the decision depends on in one round trip. Both end
+    # sensors are fetched because which one matters depends on the PE sensor.
+    with controller.batch() as batch:
+        status = batch.motors.get_status(HATCH_MOTOR_ID)
+        pe_sensor = batch.io.read_input_pin(PE_SENSOR_ID)
+        sensors = {
+            OPEN_SENSOR_ID: batch.io.read_input_pin(OPEN_SENSOR_ID),
+            CLOSE_SENSOR_ID: batch.io.read_input_pin(CLOSE_SENSOR_ID),
+        }
+
+    hatch_ready = status.result() == 3
+    params = select_params(Action(pe_sensor.result()))
+    in_position_res = sensors[params.sensor_id].result()
     if in_position_res:
         controller.motors.abrupt_stop(HATCH_MOTOR_ID)
     elif hatch_ready:
         controller.motors.relative_move(HATCH_MOTOR_ID, params.stroke)
+
+
+class HatchState(Enum):
+    UNKNOWN = "Unknown"
+    OPENING = "Opening"
+    OPEN = "Open"
+    CLOSING = "Closing"
+    CLOSED = "Closed"
+    STOPPING = "Stopping"  # Reversing: waiting for the motor to stop before moving the other way.
+    FAULTED = "Faulted"    # The motor is disabled or faulted; no commands are sent.
+
+class HatchTransition(NamedTuple):
+    previous: HatchState
+    state: HatchState
+    timestamp: float  # time.monotonic() of the transition.
+    duration: float   # Seconds spent in the previous state.
+
+class HatchController:
+    """
+    Event-driven replacement for update_hatch.
+
+    The hatch is opened while the PE sensor is active and closed otherwise.
+    Unlike update_hatch, which may resend a move or a stop on every tick,
+    this keeps track of the last known sensor and motor state and only sends
+    a command when that state changes: one move when travel has to start,
+    one stop when the end sensor trips. While nothing changes, a tick sends
+    no commands at all.
+
+    Sensors and motor status are read through the controller's telemetry
+    poller when one is running (so ticks usually stay off the network),
+    and with one batched exchange otherwise.
+    """
+    def __init__(self, controller: ClearCoreController, motion_timeout: float = 0.5, history: int = 32):
+        """
+        Initializes the HatchController class.
+
+        Args:
+            controller: The ClearCoreController the hatch motor and sensors are on.
+            motion_timeout: How long to wait for the motor to report MOVING after
+                            a move before the move may be sent again.
+            history: Number of recent transitions kept in `transitions`.
+        """
+        self._controller = controller
+        self._motion_timeout = motion_timeout
+        self.state = HatchState.UNKNOWN
+        self.commands_sent = 0
+        self.transitions: Deque[HatchTransition] = deque(maxlen=history)
+        self._entered = time.monotonic()
+        self._target: Optional[Action] = None
+        # Monotonic time of the last move command, while the motor has not yet reported MOVING.
+        self._move_sent_at: Optional[float] = None
+
+    @property
+    def time_in_state(self) -> float:
+        """Seconds since the last transition."""
+        return time.monotonic() - self._entered
+
+    def update(self) -> HatchState:
+        """Reads the hatch's inputs, sends any command a state change calls for, and returns the state."""
+        status, pe_sensor, open_sensor, close_sensor = self._read_inputs()
+        target = Action(pe_sensor)
+        params = select_params(target)
+        in_position = open_sensor if target == Action.OPEN else close_sensor
+        at_rest = HatchState.OPEN if target == Action.OPEN else HatchState.CLOSED
+        travelling = HatchState.OPENING if target == Action.OPEN else HatchState.CLOSING
+
+        if status == Status.MOVING:
+            self._move_sent_at = None
+
+        if status in (Status.DISABLED, Status.FAULTED):
+            self._move_sent_at = None
+            self._enter(HatchState.FAULTED)
+        elif in_position:
+            if self.state in (HatchState.OPENING, HatchState.CLOSING, HatchState.STOPPING, HatchState.UNKNOWN) \
+                    or status == Status.MOVING:
+                self._stop()
+            self._move_sent_at = None
+            self._enter(at_rest)
+        elif self.state in (HatchState.OPENING, HatchState.CLOSING) and self._target != target:
+            # The PE sensor flipped mid-travel: stop first, reverse once the motor is ready.
+            self._stop()
+            self._move_sent_at = None
+            self._enter(HatchState.STOPPING)
+        elif status == Status.READY and not self._move_pending():
+            # Start travel, or restart it if the last stroke ended short of the sensor.
+            self._move(params.stroke)
+            self._enter(travelling)
+
+        self._target = target
+        return self.state
+
+    def _move_pending(self) -> bool:
+        """True while a move was sent but the motor has not been seen MOVING yet."""
+        return self._move_sent_at is not None and time.monotonic() - self._move_sent_at < self._motion_timeout
+
+    def _read_inputs(self) -> Tuple[Status, bool, bool, bool]:
+        telemetry = self._controller.telemetry
+        if telemetry is not None:
+            return (telemetry.get_status(HATCH_MOTOR_ID),
+                    telemetry.read_input_pin(PE_SENSOR_ID),
+                    telemetry.read_input_pin(OPEN_SENSOR_ID),
+                    telemetry.read_input_pin(CLOSE_SENSOR_ID))
+        with self._controller.batch() as batch:
+            status = batch.motors.get_status(HATCH_MOTOR_ID)
+            sensors = batch.io.read_input_pins((PE_SENSOR_ID, OPEN_SENSOR_ID, CLOSE_SENSOR_ID))
+        pins = sensors.result()
+        return status.result(), pins[PE_SENSOR_ID], pins[OPEN_SENSOR_ID], pins[CLOSE_SENSOR_ID]
+
+    def _stop(self) -> None:
+        self._controller.motors.abrupt_stop(HATCH_MOTOR_ID)
+        self.commands_sent += 1
+
+    def _move(self, stroke: int) -> None:
+        self._controller.motors.relative_move(HATCH_MOTOR_ID, stroke)
+        self._move_sent_at = time.monotonic()
+        self.commands_sent += 1
+
+    def _enter(self, state: HatchState) -> None:
+        if state is self.state:
+            return
+        now = time.monotonic()
+        self.transitions.append(HatchTransition(self.state, state, now, now - self._entered))
+        self.state = state
+        self._entered = now
@@ -1,8 +1,12 @@
-import sys
+import contextlib
 import time
+from typing import List, Optional
 from . import hatch
-from clear_core import ClearCoreController
-from gc_controller import GameCubeController
+from .scheduler import FixedRateScheduler
+from .display import TerminalRenderer
+from .recorder import TelemetryRecorder
+from clear_core import ClearCoreController, MotionStream, Setpoint
+from gc_controller import Button, EventKind, GameCubeController
 
 # --- Constants ---
 HOST = "192.168.1.12"
@@ -10,18 +14,85 @@ PORT = 8888
 GANTRY_ID = 2
 MAX_DISPLACEMENT = -80000  # steps
 MIN_DISPLACEMENT = 0      # steps
+JOG_VELOCITY = 10000      # steps/s
+LOOP_RATE_HZ = 60
+DISPLAY_RATE_HZ = 15
+# Set to e.g. "runs/gantry" to record every tick to runs/gantry-0000.gctl, ...
+TELEMETRY_PATH: Optional[str] = None
 
-# --- Helper Function ---
-def clear_terminal():
+# --- Main Application Logic ---
+def control_tick(cc: ClearCoreController, gc: GameCubeController,
+                 hatch_controller: hatch.HatchController, jog: MotionStream) -> Optional[List[str]]:
     """
-    Clears the terminal screen using ANSI escape codes for a flicker-free update.
+    Runs one iteration of the gantry control loop.
+
+    The gantry jog is streamed: every tick sends the current jog velocity
+    through `jog`, which keeps the motor's target a short distance ahead of
+    it while 'A' is held and stops it as soon as the input goes away.
+
+    Returns:
+        The lines of the status frame to display if new controller input
+        was processed, or None if there was no new input.
     """
-    # \033[2J clears the entire screen
-    # \033[H moves the cursor to the top-left corner
-    sys.stdout.write("\033[2J\033[H")
-    sys.stdout.flush()
+    hatch_state = hatch_controller.update()
+
+    # gc.read() returns True only when there's new data from the controller.
+    if not gc.read():
+        # No new input: the jog keeps its last velocity until it goes stale.
+        jog.step(None)
+        return None
+
+    # Serve position/status from the telemetry cache when it is running.
+    motor_state = cc.telemetry or cc.motors
+
+    # Get all current states at once.
+    current_pos = motor_state.get_position(GANTRY_ID)
+    joystick_dir = gc.main_stick.direction.name
+    buttons_state = gc.buttons.state
+    motor_status = motor_state.get_status(GANTRY_ID)
+
+    # One-shot actions run on button edges rather than on every frame the button is held.
+    for event in gc.events:
+        if event.kind is EventKind.PRESSED and event.button is Button.START:
+            cc.motors.disable(GANTRY_ID)
+            cc.motors.clear_alerts(GANTRY_ID)
+            time.sleep(0.25)
+            cc.motors.enable(GANTRY_ID)
+            time.sleep(0.25)
+
+    if buttons_state.Z:
+        if buttons_state.L:
+            cc.motors.relative_move(GANTRY_ID, 10)
+        if buttons_state.R:
+            cc.motors.relative_move(GANTRY_ID,-10)
+
+    # --- Handle Controller Input ---
+    # Move motor based on 'A' button and joystick direction.
+    # A zero velocity (e.g. 'A' released) stops the gantry once.
+    velocity = 0
+    if buttons_state.A:
+        if joystick_dir == "LEFT":
+            velocity = -JOG_VELOCITY
+        elif joystick_dir == "RIGHT":
+            velocity = JOG_VELOCITY
+    jog.step(Setpoint.now(velocity))
+
+    # Build the output for the current frame.
+    return [
+        "--- Gantry Control Demo ---",
+        f"Motor Status:      {motor_status}",
+        f"Gantry Position:   {current_pos}",
+        f"Hatch:             {hatch_state.value}",
+        "",
+        "--- Controller Input ---",
+        f"Joystick:          {joystick_dir}",
+        f"A Button Held:     {buttons_state.A}",
+        f"Start Button Held: {buttons_state.Start}",
+        "",
+        "Hold 'A' and move Joystick Left/Right to move the gantry.",
+        "Press Ctrl+C to exit."
+    ]
 
-# --- Main Application Logic ---
 def main():
     """Main function to run the gantry control demo."""
     try:
@@ -46,69 +117,36 @@ def main():
             print(f"Res: {res}")
 
             print("Initialization complete. Ready for input.")
+            # Poll the gantry and hatch in the background so the loop reads them from a cache.
+            cc.start_telemetry(motors=[GANTRY_ID, hatch.HATCH_MOTOR_ID],
+                               pins=[hatch.PE_SENSOR_ID, hatch.OPEN_SENSOR_ID, hatch.CLOSE_SENSOR_ID],
+                               rate_hz=60)
+            hatch_controller = hatch.HatchController(cc)
+            # Capture controller packets as they arrive so gc.read() never waits on the device.
+            gc.start_reader()
             time.sleep(1)  # Pause before starting the control loop
 
             # --- Main Control Loop ---
-            while True:
-                # gc.read() returns True only when there's new data from the controller.
-                hatch.update_hatch(cc)
-
-
-                if gc.read():
-                    # Get all current states at once.
-                    current_pos = cc.motors.get_position(GANTRY_ID)
-                    joystick_dir = gc.main_stick.direction.name
-                    buttons_state = gc.buttons.state
-                    motor_status = cc.motors.get_status(GANTRY_ID)
-
-                    if buttons_state.Start:
-                        cc.motors.disable(GANTRY_ID)
-                        cc.motors.clear_alerts(GANTRY_ID)
-                        time.sleep(0.25)
-                        cc.motors.enable(GANTRY_ID)
-                        time.sleep(0.25)
-
-                    if buttons_state.Z:
-                        if buttons_state.L:
-                            cc.motors.relative_move(GANTRY_ID, 10)
-                        if buttons_state.R:
-                            cc.motors.relative_move(GANTRY_ID,-10)
-
-
-
-                    # --- Handle Controller Input ---
-                    # Move motor based on 'A' button and joystick direction.
-                    if buttons_state.A:
-                        if joystick_dir == "LEFT" and current_pos > MAX_DISPLACEMENT+1500:
-                            cc.motors.relative_move(GANTRY_ID, -1000)
-                        elif joystick_dir == "RIGHT" and current_pos < MIN_DISPLACEMENT-1500:
-                            cc.motors.relative_move(GANTRY_ID, 1000)
-                    else:
-                        # Stop the motor if the 'A' button is not being held.
-                        cc.motors.abrupt_stop(GANTRY_ID)
-
-                    # --- Display Current Frame Data ---
-                    # Clear the terminal at the beginning of each frame update.
-                    clear_terminal()
-
-                    # Build and print the output for the current frame.
-                    output_lines = [
-                        "--- Gantry Control Demo ---",
-                        f"Motor Status:      {motor_status}",
-                        f"Gantry Position:   {current_pos}",
-                        "",
-                        "--- Controller Input ---",
-                        f"Joystick:          {joystick_dir}",
-                        f"A Button Held:     {buttons_state.A}",
-			            f"Start Button Held: {buttons_state.Start}",
-                        "",
-                        "Hold 'A' and move Joystick Left/Right to move the gantry.",
-                        "Press Ctrl+C to exit."
-                    ]
-                    print("\n".join(output_lines))
-
-                # A short sleep to be CPU-friendly and set the loop's refresh rate.
-                time.sleep(1 / 60)  # Aim for ~60Hz
+            # The display redraws on its own thread, so ticks never wait on stdout.
+            # The jog stream stops the gantry when the loop exits.
+            jog = cc.motors.stream(GANTRY_ID, rate_hz=LOOP_RATE_HZ,
+                                   limits=(MAX_DISPLACEMENT + 1500, MIN_DISPLACEMENT - 1500))
+            # Ticks are recorded on a writer thread, so recording never waits on disk.
+            recorder = (TelemetryRecorder(TELEMETRY_PATH, motors=[GANTRY_ID, hatch.HATCH_MOTOR_ID],
+                                          pins=[hatch.PE_SENSOR_ID, hatch.OPEN_SENSOR_ID, hatch.CLOSE_SENSOR_ID])
+                        if TELEMETRY_PATH else None)
+            with TerminalRenderer(refresh_hz=DISPLAY_RATE_HZ) as renderer, jog, \
+                    (recorder or contextlib.nullcontext()):
+                def tick():
+                    output_lines = control_tick(cc, gc, hatch_controller, jog)
+                    if recorder is not None:
+                        recorder.capture(cc, gc)
+                    if output_lines is not None:
+                        # --- Display Current Frame Data ---
+                        renderer.submit(output_lines)
+
+                # Run on fixed ~60Hz deadlines so network latency does not slow the loop down.
+                FixedRateScheduler(LOOP_RATE_HZ).run(tick)
 
     except ConnectionError as e:
         print(f"\n[ERROR] A connection error occurred: {e}")
@@ -0,0 +1,335 @@
+"""
+Columnar recording of gantry control-loop telemetry.
+
+Every tick appends one row to in-memory columns: the timestamp, the position
+and status of each recorded motor, the recorded input pins as a bit mask and
+the decoded controller input. Full blocks of rows are handed to a writer
+thread through a bounded queue, so the control loop never waits on disk; if
+the writer falls behind, whole blocks are dropped and counted instead.
+
+File format (all integers little-endian):
+
+    header   MAGIC (6 bytes), VERSION (uint16), schema length (uint32),
+             schema as UTF-8 JSON: {"columns": [[name, type], ...], ...}
+    blocks   b"BLCK", row count (uint32), then each column's values for
+             those rows back to back, in schema order
+
+Column types are `struct` format characters at their standard sizes
+(b/B: 1 byte, h/H: 2, i/I: 4, q/Q: 8), so the layout does not depend on the
+platform; in memory each column is an `array` of the typecode with the same
+item size. Storing each block column by column keeps a column's values
+contiguous, so read_telemetry() (or numpy.frombuffer) loads a column without
+touching the others. Files are rotated when they reach `max_file_bytes`.
+"""
+import array
+import glob
+import json
+import queue
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from clear_core import ClearCoreController
+from gc_controller import GameCubeController
+from gc_controller.bulk import DPAD_DIRECTIONS, JOYSTICK_DIRECTIONS
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+MAGIC = b"GCTLM1"
+VERSION = 1
+FILE_SUFFIX = ".gctl"
+
+_HEADER = struct.Struct("<6sHI")  # magic, version, schema length
+_BLOCK = struct.Struct("<4sI")  # b"BLCK", row count
+_BLOCK_MAGIC = b"BLCK"
+
+# Stored for a motor whose status has not been read yet.
+UNKNOWN_STATUS = 255
+
+# Column types the file format allows; see _array_typecode().
+_COLUMN_TYPES = "bBhHiIqQ"
+
+_JOYSTICK_CODES = {direction: code for code, direction in enumerate(JOYSTICK_DIRECTIONS)}
+_DPAD_CODES = {direction: code for code, direction in enumerate(DPAD_DIRECTIONS)}
+
+# Decoded controller input, named like the columns of gc_controller.bulk.
+_INPUT_COLUMNS = (
+    ("buttons", "H"),
+    ("main_x", "B"),
+    ("main_y", "B"),
+    ("c_x", "B"),
+    ("c_y", "B"),
+    ("l_trigger", "B"),
+    ("r_trigger", "B"),
+    ("dpad", "B"),
+    ("main_direction", "B"),
+    ("c_direction", "B"),
+)
+
+class TelemetryRecorder:
+    """
+    Records one row of gantry telemetry per control tick to rotating files.
+
+    It is designed to be used as a context manager with a 'with' statement.
+    """
+    def __init__(self, path_prefix: str, motors: Iterable[int] = (), pins: Iterable[int] = (),
+                 block_rows: int = 256, max_file_bytes: int = 64 << 20, max_pending_blocks: int = 64):
+        """
+        Initializes the TelemetryRecorder class and starts its writer thread.
+
+        Args:
+            path_prefix: Files are written as "<path_prefix>-0000.gctl",
+                         "<path_prefix>-0001.gctl" and so on, continuing after
+                         the highest existing number.
+            motors: Motors whose position and status are recorded.
+            pins: Digital input pins that are recorded (0 to 31).
+            block_rows: Rows buffered in memory before they are queued for writing.
+            max_file_bytes: A new file is started once the current one reaches this size.
+            max_pending_blocks: Blocks the queue holds before new ones are dropped.
+        """
+        self.motors: Tuple[int, ...] = tuple(motors)
+        self.pins: Tuple[int, ...] = tuple(pins)
+        if any(not 0 <= pin < 32 for pin in self.pins):
+            raise ValueError("Recorded pins must be between 0 and 31.")
+        self.path_prefix = path_prefix
+        self.block_rows = block_rows
+        self.max_file_bytes = max_file_bytes
+
+        self.columns: List[Tuple[str, str]] = [("timestamp_ns", "Q")]
+        for motor in self.motors:
+            self.columns += [(f"m{motor}_position", "q"), (f"m{motor}_status", "B")]
+        self.columns.append(("pins", "I"))
+        self.columns += _INPUT_COLUMNS
+        self._typecodes = [_array_typecode(column_type) for _, column_type in self.columns]
+        self._schema = json.dumps({
+            "columns": self.columns, "motors": self.motors, "pins": self.pins,
+        }).encode("utf-8")
+
+        self._block = self._new_block()
+        self._queue: "queue.Queue[Optional[List[array.array]]]" = queue.Queue(max_pending_blocks)
+        self._file: Optional["BinaryIO"] = None
+        self._next_index = _next_file_index(path_prefix)
+        self.files: List[str] = []
+        self.rows_recorded = 0
+        self.rows_dropped = 0
+        self.error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name="gantry-telemetry-recorder", daemon=True)
+        self._thread.start()
+
+    def capture(self, cc: ClearCoreController, gc: Optional[GameCubeController] = None,
+                timestamp_ns: Optional[int] = None) -> None:
+        """
+        Records the current state of the controllers.
+
+        With telemetry running on `cc`, motor and pin values are taken from
+        its cache however old they are, so capturing does not touch the
+        network. Without it, they are read in one batched exchange.
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        telemetry = cc.telemetry
+        if telemetry is not None:
+            latest = float("inf")
+            positions = [telemetry.get_position(motor, latest) for motor in self.motors]
+            statuses = [telemetry.get_status(motor, latest) for motor in self.motors]
+            mask = 0
+            for pin in self.pins:
+                if telemetry.read_input_pin(pin, latest):
+                    mask |= 1 << pin
+        else:
+            with cc.batch() as batch:
+                pending_positions = [batch.motors.get_position(motor) for motor in self.motors]
+                pending_statuses = [batch.motors.get_status(motor) for motor in self.motors]
+                pending_pins = batch.io.read_input_pins(self.pins) if self.pins else None
+            positions = [p.result() for p in pending_positions]
+            statuses = [p.result() for p in pending_statuses]
+            mask = pending_pins.result().mask if pending_pins is not None else 0
+        self.append(timestamp_ns, positions, statuses, mask, gc)
+
+    def append(self, timestamp_ns: int, positions: Sequence[int], statuses: Sequence[Optional[int]],
+               pins_mask: int, gc: Optional[GameCubeController] = None) -> None:
+        """
+        Records one row from values the caller already has.
+
+        Args:
+            timestamp_ns: time.monotonic_ns() of the tick.
+            positions: One position per recorded motor, in `motors` order.
+            statuses: One status per recorded motor; None if unknown.
+            pins_mask: Recorded pin states, bit n being pin n.
+            gc: The controller whose decoded input is recorded, if any.
+        """
+        columns = self._block
+        columns[0].append(timestamp_ns)
+        column = 1
+        for position, status in zip(positions, statuses):
+            columns[column].append(position)
+            columns[column + 1].append(UNKNOWN_STATUS if status is None else int(status))
+            column += 2
+        columns[column].append(pins_mask)
+        column += 1
+        if gc is not None:
+            values = (gc.buttons.value, gc.main_stick.x, gc.main_stick.y, gc.c_stick.x, gc.c_stick.y,
+                      gc.l_trigger_analog, gc.r_trigger_analog, _DPAD_CODES[gc.dpad.direction],
+                      _JOYSTICK_CODES[gc.main_stick.direction], _JOYSTICK_CODES[gc.c_stick.direction])
+        else:
+            values = (0,) * len(_INPUT_COLUMNS)
+        for value in values:
+            columns[column].append(value)
+            column += 1
+
+        if len(columns[0]) >= self.block_rows:
+            self._submit_block(block=False)
+
+    def flush(self) -> None:
+        """Queues the rows buffered so far, waiting for room in the queue if needed."""
+        self._submit_block(block=True)
+
+    def close(self) -> None:
+        """Writes every buffered row and closes the current file."""
+        if self._thread.is_alive():
+            self.flush()
+            self._queue.put(None)
+            self._thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _new_block(self) -> List[array.array]:
+        return [array.array(typecode) for typecode in self._typecodes]
+
+    def _submit_block(self, block: bool) -> None:
+        columns = self._block
+        rows = len(columns[0])
+        if not rows:
+            return
+        self._block = self._new_block()
+        try:
+            self._queue.put(columns, block=block)
+        except queue.Full:
+            # The writer is behind; losing rows is better than stalling the control loop.
+            self.rows_dropped += rows
+
+    def _run(self) -> None:
+        while True:
+            columns = self._queue.get()
+            if columns is None:
+                return
+            if self.error is not None:
+                self.rows_dropped += len(columns[0])
+                continue
+            try:
+                self._write_block(columns)
+            except OSError as e:
+                self.error = e
+                self.rows_dropped += len(columns[0])
+
+    def _write_block(self, columns: List[array.array]) -> None:
+        rows = len(columns[0])
+        size = _BLOCK.size + sum(column.itemsize * rows for column in columns)
+        f = self._file
+        if f is None or (f.tell() + size > self.max_file_bytes and f.tell() > self._header_size):
+            f = self._rotate()
+        f.write(_BLOCK.pack(_BLOCK_MAGIC, rows))
+        for column in columns:
+            if sys.byteorder == "big":
+                column.byteswap()
+            f.write(column)
+        f.flush()
+        self.rows_recorded += rows
+
+    @property
+    def _header_size(self) -> int:
+        return _HEADER.size + len(self._schema)
+
+    def _rotate(self) -> "BinaryIO":
+        if self._file is not None:
+            self._file.close()
+        path = f"{self.path_prefix}-{self._next_index:04d}{FILE_SUFFIX}"
+        self._next_index += 1
+        self._file = open(path, "xb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(self._schema)))
+        self._file.write(self._schema)
+        self.files.append(path)
+        return self._file
+
+    def __enter__(self):
+        """Context manager entry: returns the recorder."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: writes every buffered row and closes the current file."""
+        self.close()
+
+def _array_typecode(column_type: str) -> str:
+    """
+    Returns the `array` typecode whose items have the standard size of a
+    column type, since the C types behind array typecodes vary in size.
+
+    Raises:
+        ValueError: If the column type is not supported or no array type matches it.
+    """
+    if len(column_type) != 1 or column_type not in _COLUMN_TYPES:
+        raise ValueError(f"Unsupported column type {column_type!r}.")
+    size = struct.calcsize("<" + column_type)
+    for typecode in ("bhilq" if column_type.islower() else "BHILQ"):
+        if array.array(typecode).itemsize == size:
+            return typecode
+    raise ValueError(f"No array typecode holds {size}-byte values on this platform.")
+
+def _next_file_index(path_prefix: str) -> int:
+    """Returns one past the highest file number already used for the prefix."""
+    highest = -1
+    for path in glob.glob(glob.escape(path_prefix) + "-*" + FILE_SUFFIX):
+        number = path[len(path_prefix) + 1:-len(FILE_SUFFIX)]
+        if number.isdigit():
+            highest = max(highest, int(number))
+    return highest + 1
+
+def read_telemetry(paths: Sequence[str]) -> Dict[str, array.array]:
+    """
+    Loads recorded telemetry files, in the given order, into one array per column.
+
+    A block cut short at the end of a file (e.g. by a crash) is ignored.
+
+    Raises:
+        ValueError: If a file is not a telemetry recording or the files have different columns.
+    """
+    result: Dict[str, array.array] = {}
+    schema_columns: Optional[List[List[str]]] = None
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is too short to be a telemetry recording.")
+        magic, version, schema_size = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} telemetry recording.")
+        columns = json.loads(data[_HEADER.size:_HEADER.size + schema_size])["columns"]
+        if schema_columns is None:
+            schema_columns = columns
+            typecodes = [_array_typecode(column_type) for _, column_type in columns]
+            result = {name: array.array(typecode) for (name, _), typecode in zip(columns, typecodes)}
+            row_size = sum(array.array(typecode).itemsize for typecode in typecodes)
+        elif columns != schema_columns:
+            raise ValueError(f"{path} does not have the same columns as {paths[0]}.")
+
+        offset = _HEADER.size + schema_size
+        while offset + _BLOCK.size <= len(data):
+            block_magic, rows = _BLOCK.unpack_from(data, offset)
+            if block_magic != _BLOCK_MAGIC:
+                raise ValueError(f"{path} has a corrupt block at byte {offset}.")
+            if offset + _BLOCK.size + row_size * rows > len(data):
+                break
+            offset += _BLOCK.size
+            for (name, _), typecode in zip(columns, typecodes):
+                values = array.array(typecode)
+                size = values.itemsize * rows
+                values.frombytes(data[offset:offset + size])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                result[name].extend(values)
+                offset += size
+    return result
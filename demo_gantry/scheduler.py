@@ -0,0 +1,111 @@
+import time
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from clear_core.metrics import LatencyHistogram
+
+class OverrunPolicy(Enum):
+    """What the scheduler does when a tick runs past one or more deadlines."""
+    SKIP = "skip"          # Drop the missed ticks and resume on the next future deadline.
+    CATCH_UP = "catch_up"  # Run the missed ticks back to back, up to a limit.
+
+class TickStats:
+    """Tick duration and start-time jitter statistics for a FixedRateScheduler."""
+    def __init__(self):
+        self.ticks = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.durations = LatencyHistogram()
+        # How late each tick started relative to its deadline.
+        self.jitter = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, object]:
+        """Returns a JSON-serializable copy of the statistics."""
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "duration": self.durations.snapshot(),
+            "jitter": self.jitter.snapshot(),
+        }
+
+class FixedRateScheduler:
+    """
+    Runs a tick function at a fixed rate against absolute deadlines.
+
+    Deadlines are computed from the start time (start + n * period) rather
+    than by sleeping a fixed amount after each tick, so variable tick
+    durations do not make the loop rate drift. If a tick overruns, the
+    overrun policy decides whether missed ticks are skipped or caught up.
+    """
+    def __init__(self, rate_hz: float, policy: OverrunPolicy = OverrunPolicy.SKIP,
+                 max_catch_up: int = 5):
+        """
+        Initializes the FixedRateScheduler class.
+
+        Args:
+            rate_hz: Target number of ticks per second.
+            policy: How to handle ticks that run past their deadline.
+            max_catch_up: With CATCH_UP, the most missed ticks run back to back
+                          before the remaining ones are skipped.
+        """
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive.")
+        self.period_ns = int(1e9 / rate_hz)
+        self.policy = policy
+        self.max_catch_up = max_catch_up
+        self.stats = TickStats()
+        self._running = False
+
+    def stop(self) -> None:
+        """Makes run() return after the current tick. Safe to call from the tick itself."""
+        self._running = False
+
+    def run(self, tick: Callable[[], Optional[bool]], max_ticks: Optional[int] = None) -> None:
+        """
+        Calls `tick` once per period until stop() is called, `tick` returns
+        False, or `max_ticks` ticks have run. Exceptions from `tick` propagate.
+        """
+        clock = time.perf_counter_ns
+        period = self.period_ns
+        stats = self.stats
+        self._running = True
+        deadline = clock()
+        behind = 0  # Consecutive ticks run without waiting, under CATCH_UP.
+
+        while self._running and (max_ticks is None or stats.ticks < max_ticks):
+            started = clock()
+            stats.jitter.record(max(started - deadline, 0))
+            result = tick()
+            finished = clock()
+            stats.durations.record(finished - started)
+            stats.ticks += 1
+            if result is False:
+                break
+
+            deadline += period
+            if finished <= deadline:
+                behind = 0
+                self._sleep_until(deadline)
+                continue
+
+            stats.overruns += 1
+            missed = (finished - deadline) // period
+            if self.policy is OverrunPolicy.CATCH_UP and behind < self.max_catch_up:
+                # Run the next tick right away; its deadline has already passed.
+                behind += 1
+                continue
+
+            # Skip every deadline that has already passed and wait for the next one.
+            behind = 0
+            stats.skipped += missed + 1
+            deadline += (missed + 1) * period
+            self._sleep_until(deadline)
+
+        self._running = False
+
+    @staticmethod
+    def _sleep_until(deadline_ns: int) -> None:
+        remaining = deadline_ns - time.perf_counter_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
@@ -7,21 +7,33 @@ controller HID device. The main entry point is the GameCubeController class.
 
 # Import the main controller class to make it directly accessible from the package root.
 from .controller import GameCubeController
+from .manager import ControllerManager
 
 # Import data and enum classes that users of the library may want to access
 # for type hinting or state checking.
 from .buttons import Button, ButtonsState
 from .joystick import JoystickAnalog
 from .dpad import DpadDirection
+from .reader import PacketSample
+from .events import EventKind, InputEvent
+from .backends import HidBackend, HidapiBackend, HidrawBackend, HidrawDevice
 
 # Define the public API for the package. This controls `from gc_controller import *`
 # and helps linters understand the package structure, preventing "unused import" warnings.
 __all__ = [
     "GameCubeController",
+    "ControllerManager",
     "Button",
     "ButtonsState",
     "JoystickAnalog",
     "DpadDirection",
+    "PacketSample",
+    "EventKind",
+    "InputEvent",
+    "HidBackend",
+    "HidapiBackend",
+    "HidrawBackend",
+    "HidrawDevice",
 ]
 
 __version__ = "2.0.0"
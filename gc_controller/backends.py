@@ -0,0 +1,207 @@
+"""
+Device backends that find and open GameCube controller adapters.
+
+GameCubeController reads packets through a small hidapi-style device
+interface: `read(size, timeout_ms)` returns one report (empty if none arrived
+in time) and `close()` releases the device. A backend enumerates matching
+devices and opens them:
+
+- HidapiBackend uses the `hidapi` package, which is imported only when the
+  backend is first used, so importing gc_controller does not load it.
+- HidrawBackend (Linux only) reads /dev/hidraw* directly with os.read into a
+  reusable buffer and waits with selectors. It needs no extra packages, and
+  its devices expose fileno() so several of them can be waited on together.
+"""
+import os
+import selectors
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Protocol, Sequence
+
+DeviceInfo = Dict[str, Any]
+
+class HidDevice(Protocol):
+    """An open controller device."""
+    def read(self, size: int, timeout_ms: int = 0) -> Sequence[int]: ...
+    def close(self) -> None: ...
+
+class HidBackend(ABC):
+    """Finds and opens HID devices. Subclasses implement both methods."""
+    @abstractmethod
+    def enumerate(self, vendor_id: int, product_id: int) -> List[DeviceInfo]:
+        """
+        Returns a description of every connected device with the given IDs.
+
+        Each entry has at least 'path', 'vendor_id', 'product_id' and
+        'product_string' keys, like hidapi's enumerate().
+        """
+
+    @abstractmethod
+    def open(self, info: DeviceInfo) -> HidDevice:
+        """
+        Opens a device returned by enumerate().
+
+        Raises:
+            OSError: If the device could not be opened.
+        """
+
+def _hid():
+    """Imports hidapi on first use."""
+    try:
+        import hid
+    except ImportError as e:
+        raise ImportError("The hidapi backend needs the hidapi package: pip install hidapi") from e
+    return hid
+
+class HidapiBackend(HidBackend):
+    """Cross-platform backend built on the hidapi package."""
+    def enumerate(self, vendor_id: int, product_id: int) -> List[DeviceInfo]:
+        return [device for device in _hid().enumerate()
+                if device['vendor_id'] == vendor_id and device['product_id'] == product_id]
+
+    def open(self, info: DeviceInfo) -> HidDevice:
+        device = _hid().device()
+        try:
+            device.open_path(info['path'])
+            device.set_nonblocking(1)
+        except (IOError, ValueError):
+            device.close()
+            raise
+        return device
+
+class HidrawDevice:
+    """
+    A hidraw character device read with plain file descriptor I/O.
+
+    Each `read` fills the same preallocated buffer and returns a memoryview
+    of it, so reading a report does not allocate; the returned data is only
+    valid until the next read. Any file descriptor that delivers one report
+    per read works, which makes it possible to test against the read end of a
+    pipe or a SOCK_SEQPACKET socket pair instead of real hardware.
+    """
+    def __init__(self, path: Optional[str] = None, fd: Optional[int] = None, report_size: int = 64):
+        """
+        Initializes the HidrawDevice class.
+
+        Args:
+            path: The device node to open, e.g. "/dev/hidraw0".
+            fd: An already open file descriptor to read from instead. It is
+                closed by close().
+            report_size: Size of the reusable read buffer in bytes.
+        """
+        if fd is None:
+            if path is None:
+                raise ValueError("Either path or fd is required.")
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        else:
+            os.set_blocking(fd, False)
+        self.path = path
+        self._fd = fd
+        self._buffer = bytearray(report_size)
+        self._view = memoryview(self._buffer)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def read(self, size: int, timeout_ms: int = 0) -> Sequence[int]:
+        """
+        Returns the next report, waiting up to `timeout_ms` for one to arrive.
+
+        Returns an empty bytes object if nothing arrived in time.
+
+        Raises:
+            OSError: If the device was unplugged or the stream ended.
+        """
+        view = self._view[:size]
+        received = self._read_into(view)
+        if received is None:
+            if timeout_ms <= 0 or not self._selector.select(timeout_ms / 1000):
+                return b""
+            received = self._read_into(view)
+            if received is None:
+                return b""
+        return view[:received]
+
+    def _read_into(self, view: memoryview) -> Optional[int]:
+        """Reads one report without waiting. Returns None if none is available."""
+        try:
+            received = os.readv(self._fd, (view,))
+        except BlockingIOError:
+            return None
+        if received == 0:
+            raise OSError("HID device stream ended.")
+        return received
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            self._selector.close()
+            os.close(self._fd)
+            self._fd = -1
+
+_SYSFS_HIDRAW = "/sys/class/hidraw"
+
+class HidrawBackend(HidBackend):
+    """Linux backend that reads /dev/hidraw* directly."""
+    def __init__(self, report_size: int = 64):
+        """
+        Initializes the HidrawBackend class.
+
+        Args:
+            report_size: Size of each device's reusable read buffer in bytes.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("The hidraw backend is only available on Linux.")
+        self.report_size = report_size
+
+    def enumerate(self, vendor_id: int, product_id: int) -> List[DeviceInfo]:
+        devices: List[DeviceInfo] = []
+        try:
+            nodes = sorted(os.listdir(_SYSFS_HIDRAW))
+        except FileNotFoundError:
+            return devices
+        for node in nodes:
+            info = self._read_uevent(os.path.join(_SYSFS_HIDRAW, node, "device", "uevent"))
+            # HID_ID is "<bus>:<vendor>:<product>" in hex, e.g. "0003:00000079:00000006".
+            parts = info.get("HID_ID", "").split(":")
+            if len(parts) != 3:
+                continue
+            if int(parts[1], 16) == vendor_id and int(parts[2], 16) == product_id:
+                devices.append({
+                    "path": f"/dev/{node}",
+                    "vendor_id": vendor_id,
+                    "product_id": product_id,
+                    "product_string": info.get("HID_NAME", ""),
+                    "serial_number": info.get("HID_UNIQ", ""),
+                    "interface_number": self._interface_number(info.get("HID_PHYS", "")),
+                })
+        return devices
+
+    def open(self, info: DeviceInfo) -> HidrawDevice:
+        path = info['path']
+        return HidrawDevice(path.decode() if isinstance(path, bytes) else path, report_size=self.report_size)
+
+    @staticmethod
+    def _read_uevent(path: str) -> Dict[str, str]:
+        try:
+            with open(path) as f:
+                return dict(line.rstrip("\n").split("=", 1) for line in f if "=" in line)
+        except OSError:
+            return {}
+
+    @staticmethod
+    def _interface_number(phys: str) -> int:
+        # HID_PHYS looks like "usb-0000:00:14.0-1/input0".
+        _, _, interface = phys.rpartition("/input")
+        return int(interface) if interface.isdigit() else -1
+
+def default_backend() -> HidBackend:
+    """Returns the hidapi backend if hidapi is installed, else hidraw on Linux."""
+    try:
+        _hid()
+    except ImportError:
+        if sys.platform.startswith("linux"):
+            return HidrawBackend()
+        raise
+    return HidapiBackend()
@@ -0,0 +1,151 @@
+"""
+Vectorized decoding of recorded controller packets with NumPy.
+
+Decoding a long capture one packet at a time through GameCubeController is
+slow; these functions decode a whole array of packets at once into a NumPy
+structured array. Direction codes are computed with lookup tables built from
+Joystick.direction and Dpad.direction themselves, so the deadzone handling
+and the D-Pad quirk mapping are identical to live decoding.
+
+NumPy is an optional dependency and is only imported when these functions
+are called:
+
+    pip install numpy
+"""
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Tuple
+
+from .buttons import BUTTON_MASK
+from .dpad import Dpad, DpadDirection
+from .joystick import Joystick, JoystickDirection
+from .recording import HEADER_SIZE, PACKET_SIZE, _check_header
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The direction codes stored in decoded arrays index into these tuples, e.g.
+# JOYSTICK_DIRECTIONS[row["main_direction"]].
+JOYSTICK_DIRECTIONS: Tuple[JoystickDirection, ...] = tuple(JoystickDirection)
+DPAD_DIRECTIONS: Tuple[DpadDirection, ...] = tuple(DpadDirection)
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("gc_controller.bulk requires NumPy. Install it with 'pip install numpy'.") from e
+    return numpy
+
+def decoded_dtype() -> "np.dtype":
+    """Returns the structured dtype produced by decode_packets()."""
+    np = _numpy()
+    return np.dtype([
+        ("main_x", np.uint8),
+        ("main_y", np.uint8),
+        ("c_x", np.uint8),
+        ("c_y", np.uint8),
+        ("l_trigger", np.uint8),
+        ("r_trigger", np.uint8),
+        ("buttons", np.uint16),
+        ("dpad", np.uint8),
+        ("main_direction", np.uint8),
+        ("c_direction", np.uint8),
+    ])
+
+@lru_cache(maxsize=None)
+def joystick_direction_table(deadzone: int = 30) -> "np.ndarray":
+    """
+    Returns a 256x256 table of joystick direction codes indexed by [x, y].
+
+    The table is filled by Joystick.direction, so it matches live decoding.
+    """
+    np = _numpy()
+    codes = {direction: code for code, direction in enumerate(JOYSTICK_DIRECTIONS)}
+    table = np.empty((256, 256), dtype=np.uint8)
+    stick = Joystick(deadzone=deadzone)
+    for x in range(256):
+        for y in range(256):
+            stick.update(x, y)
+            table[x, y] = codes[stick.direction]
+    table.setflags(write=False)
+    return table
+
+@lru_cache(maxsize=None)
+def dpad_direction_table() -> "np.ndarray":
+    """Returns the 16-entry table of D-Pad direction codes indexed by the low nibble."""
+    np = _numpy()
+    codes = {direction: code for code, direction in enumerate(DPAD_DIRECTIONS)}
+    table = np.empty(16, dtype=np.uint8)
+    dpad = Dpad()
+    for value in range(16):
+        dpad.update(value)
+        table[value] = codes[dpad.direction]
+    table.setflags(write=False)
+    return table
+
+def decode_packets(packets: Any, deadzone: int = 30) -> "np.ndarray":
+    """
+    Decodes many raw controller packets at once.
+
+    Args:
+        packets: An (N, 8+) array of packet bytes, or a flat bytes-like
+                 object of N consecutive 8-byte packets.
+        deadzone: The joystick deadzone, as passed to Joystick.
+
+    Returns:
+        A structured array of length N with the dtype from decoded_dtype().
+    """
+    np = _numpy()
+    raw = np.asarray(packets, dtype=np.uint8) if not isinstance(packets, (bytes, bytearray, memoryview)) \
+        else np.frombuffer(packets, dtype=np.uint8)
+    if raw.ndim == 1:
+        if raw.size % PACKET_SIZE:
+            raise ValueError(f"Flat packet data must be a multiple of {PACKET_SIZE} bytes.")
+        raw = raw.reshape(-1, PACKET_SIZE)
+    if raw.ndim != 2 or raw.shape[1] < PACKET_SIZE:
+        raise ValueError(f"Packets must have shape (N, {PACKET_SIZE}) or wider.")
+
+    # Same byte layout as GameCubeController._apply_packet.
+    main_x, main_y = raw[:, 0], raw[:, 1]
+    c_y, c_x = raw[:, 2], raw[:, 3]
+    byte5 = raw[:, 5]
+
+    out = np.empty(len(raw), dtype=decoded_dtype())
+    out["main_x"] = main_x
+    out["main_y"] = main_y
+    out["c_x"] = c_x
+    out["c_y"] = c_y
+    out["l_trigger"] = raw[:, 4]
+    out["r_trigger"] = raw[:, 7]
+    out["buttons"] = ((raw[:, 6].astype(np.uint16) << 8) | byte5) & BUTTON_MASK
+    out["dpad"] = dpad_direction_table()[byte5 & 0x0F]
+    directions = joystick_direction_table(deadzone)
+    out["main_direction"] = directions[main_x, main_y]
+    out["c_direction"] = directions[c_x, c_y]
+    return out
+
+def decode_recording(path: str, deadzone: int = 30) -> "np.ndarray":
+    """
+    Memory-maps a recording made with GameCubeController.start_recording()
+    and decodes every packet in it.
+
+    Returns:
+        A structured array like decode_packets(), with an extra leading
+        `timestamp_ns` field.
+    """
+    np = _numpy()
+    _check_header(path)
+    record = np.dtype([("timestamp_ns", "<u8"), ("packet", np.uint8, (PACKET_SIZE,))])
+    # A record still being written when the file was opened is ignored.
+    count = (os.path.getsize(path) - HEADER_SIZE) // record.itemsize
+    if count == 0:
+        records = np.empty(0, dtype=record)
+    else:
+        records = np.memmap(path, dtype=record, mode="r", offset=HEADER_SIZE, shape=(count,))
+    decoded = decode_packets(records["packet"], deadzone)
+
+    out = np.empty(len(decoded), dtype=[("timestamp_ns", "<u8")] + decoded_dtype().descr)
+    out["timestamp_ns"] = records["timestamp_ns"]
+    for name in decoded.dtype.names:
+        out[name] = decoded[name]
+    return out
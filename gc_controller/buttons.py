@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import IntFlag
+from typing import Dict
 
 class Button(IntFlag):
     """
@@ -20,9 +21,19 @@ class Button(IntFlag):
     Z = 1 << 10
     START = 1 << 13
 
+# Bits of the combined button word that belong to real buttons (the low
+# nibble of byte 5 carries the D-Pad instead).
+BUTTON_MASK = int(sum(b for b in Button.__members__.values()))
+
+# Plain int copies of the flags, so testing a bit does not create enum objects.
+_A, _B, _X, _Y = int(Button.A), int(Button.B), int(Button.X), int(Button.Y)
+_L, _R, _Z, _START = int(Button.L), int(Button.R), int(Button.Z), int(Button.START)
+
 @dataclass(frozen=True, repr=False)
 class ButtonsState:
     """An immutable snapshot of the state of all buttons."""
+    __slots__ = ("A", "B", "X", "Y", "L", "R", "Z", "Start")
+
     A: bool
     B: bool
     X: bool
@@ -34,9 +45,22 @@ class ButtonsState:
 
     def __repr__(self) -> str:
         """Provides a compact representation of pressed buttons."""
-        pressed = [name for name, is_pressed in self.__dict__.items() if is_pressed]
+        pressed = [name for name in self.__slots__ if getattr(self, name)]
         return f"ButtonsState({', '.join(pressed) or 'None'})"
 
+# Snapshots are immutable, so one instance per button combination is shared.
+_STATES: Dict[int, ButtonsState] = {}
+
+def _state_for(value: int) -> ButtonsState:
+    state = _STATES.get(value)
+    if state is None:
+        state = _STATES[value] = ButtonsState(
+            A=bool(value & _A), B=bool(value & _B), X=bool(value & _X), Y=bool(value & _Y),
+            L=bool(value & _L), R=bool(value & _R), Z=bool(value & _Z),
+            Start=bool(value & _START)
+        )
+    return state
+
 class Buttons:
     """
     Parses and holds the state for all digital buttons on the controller.
@@ -44,65 +68,67 @@ class Buttons:
     This class is stateful and is designed to be updated with new data
     from the main controller on each read cycle.
     """
+    __slots__ = ("_value",)
+
     def __init__(self):
-        self._flags = Button.NONE
+        self._value = 0
 
     def update(self, byte5: int, byte6: int):
         """Updates the internal button state from the raw controller data bytes."""
         # Combine the two bytes into a single 16-bit integer for easy flag processing.
-        combined_value = (byte6 << 8) | byte5
-        self._flags = Button(combined_value)
+        self._value = (byte6 << 8) | byte5
 
     @property
     def a(self) -> bool:
         """Returns True if the A button is pressed."""
-        return Button.A in self._flags
+        return bool(self._value & _A)
 
     @property
     def b(self) -> bool:
         """Returns True if the B button is pressed."""
-        return Button.B in self._flags
+        return bool(self._value & _B)
 
     @property
     def x(self) -> bool:
         """Returns True if the X button is pressed."""
-        return Button.X in self._flags
+        return bool(self._value & _X)
 
     @property
     def y(self) -> bool:
         """Returns True if the Y button is pressed."""
-        return Button.Y in self._flags
+        return bool(self._value & _Y)
 
     @property
     def l(self) -> bool:
         """Returns True if the L trigger is pressed."""
-        return Button.L in self._flags
+        return bool(self._value & _L)
 
     @property
     def r(self) -> bool:
         """Returns True if the R trigger is pressed."""
-        return Button.R in self._flags
+        return bool(self._value & _R)
 
     @property
     def z(self) -> bool:
         """Returns True if the Z button is pressed."""
-        return Button.Z in self._flags
+        return bool(self._value & _Z)
 
     @property
     def start(self) -> bool:
         """Returns True if the Start button is pressed."""
-        return Button.START in self._flags
+        return bool(self._value & _START)
+
+    @property
+    def value(self) -> int:
+        """Returns the combined button bits as a plain int (button bits only)."""
+        return self._value & BUTTON_MASK
 
     @property
     def flags(self) -> Button:
         """Returns the raw IntFlag object representing the current state."""
-        return self._flags
+        return Button(self._value)
 
     @property
     def state(self) -> ButtonsState:
         """Returns an immutable dataclass snapshot of the current button states."""
-        return ButtonsState(
-            A=self.a, B=self.b, X=self.x, Y=self.y,
-            L=self.l, R=self.r, Z=self.z,
-            Start=self.start
-        )
+        return _state_for(self._value & BUTTON_MASK)
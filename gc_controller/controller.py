@@ -1,9 +1,13 @@
-import hid
-from typing import Optional
+import time
+from typing import List, Optional, Sequence
 
 from .buttons import Buttons
 from .joystick import Joystick
 from .dpad import Dpad
+from .reader import BackgroundReader, PacketRingBuffer, PacketSample
+from .events import InputEvents
+from .recording import PacketRecorder, ReplayDevice
+from .backends import HidBackend, HidDevice, default_backend
 
 class GameCubeController:
     """
@@ -16,18 +20,26 @@ class GameCubeController:
     It is designed to be used as a context manager with a 'with' statement
     to ensure that network resources are properly managed.
     """
-    def __init__(self, vendor_id: int = 0x0079, product_id: int = 0x0006):
+    def __init__(self, vendor_id: int = 0x0079, product_id: int = 0x0006,
+                 backend: Optional[HidBackend] = None):
         """
         Initializes the controller.
 
         Args:
             vendor_id: The USB vendor ID of the controller/adapter.
             product_id: The USB product ID of the controller/adapter.
+            backend: How devices are found and opened, e.g. HidrawBackend().
+                     Defaults to hidapi if it is installed, else hidraw on Linux.
         """
         self._vendor_id = vendor_id
         self._product_id = product_id
+        self._backend = backend
         self._device_info: Optional[dict] = None
-        self._hid_device: Optional[hid.device] = None
+        self._hid_device: Optional[HidDevice] = None
+        self._reader: Optional[BackgroundReader] = None
+        self._recorder: Optional[PacketRecorder] = None
+        # Set by replay(): connect() opens this recording instead of a HID device.
+        self._replay_source: Optional[dict] = None
 
         # --- Hybrid Pattern Implementation ---
         # Expose specialized controllers as properties.
@@ -39,6 +51,9 @@ class GameCubeController:
         self.r_trigger_analog: int = 0
         # -----------------------------------
 
+        # Press/release and direction-change events, updated on every packet.
+        self.events = InputEvents()
+
     def connect(self) -> None:
         """
         Finds and connects to the specified GameCube controller device.
@@ -48,36 +63,80 @@ class GameCubeController:
             print("Controller is already connected.")
             return
 
+        if self._replay_source is not None:
+            try:
+                self._hid_device = ReplayDevice(**self._replay_source)
+            except (OSError, ValueError) as e:
+                raise ConnectionError(f"Failed to open recording: {e}") from e
+            return
+
+        if self._backend is None:
+            try:
+                self._backend = default_backend()
+            except ImportError as e:
+                raise ConnectionError(str(e)) from e
+
         print(f"Searching for device with VID={self._vendor_id:04x} PID={self._product_id:04x}...")
-        for device in hid.enumerate():
-            if device['vendor_id'] == self._vendor_id and device['product_id'] == self._product_id:
-                self._device_info = device
-                break
+        devices = self._backend.enumerate(self._vendor_id, self._product_id)
+        if devices:
+            self._device_info = devices[0]
 
         if not self._device_info:
             raise ConnectionError("GameCube controller not found.")
 
-        device = None
         try:
             print(f"Found: {self._device_info.get('product_string', 'Unknown')}. Connecting...")
-            device = hid.device()
-            device.open_path(self._device_info['path'])
-            device.set_nonblocking(1)
-
             # Only assign to the instance attribute on full success
-            self._hid_device = device
+            self._hid_device = self._backend.open(self._device_info)
 
             print("Connection successful.")
         except (IOError, ValueError) as e:
-            # If `device` was successfully created, close it on failure.
-            if device:
-                device.close()
-
             self._hid_device = None # Ensure state is clean
             raise ConnectionError(f"Failed to open HID device: {e}") from e
 
+    @classmethod
+    def replay(cls, path: str, realtime: bool = True, loop: bool = False) -> "GameCubeController":
+        """
+        Creates a controller that plays back a recording instead of reading hardware.
+
+        The recorded packets go through the same `read()` decoding path as
+        live input. Use it like a live controller:
+
+            with GameCubeController.replay("session.gcrec", realtime=False) as gc:
+                while gc.read():
+                    ...
+
+        Args:
+            path: A recording made with start_recording().
+            realtime: Reproduce the original packet timing instead of
+                      returning packets as fast as they are read.
+            loop: Restart at the end of the recording.
+        """
+        controller = cls()
+        controller._replay_source = {"path": path, "realtime": realtime, "loop": loop}
+        return controller
+
+    def start_recording(self, path: str) -> None:
+        """
+        Records every packet this controller decodes to a binary file.
+
+        Packets are written by a background thread; see gc_controller.recording
+        for the format. An existing recording at `path` is appended to.
+        """
+        if self._recorder is not None:
+            self.stop_recording()
+        self._recorder = PacketRecorder(path)
+
+    def stop_recording(self) -> None:
+        """Flushes and closes the current recording, if any."""
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
     def close(self) -> None:
         """Closes the connection to the device."""
+        self.stop_reader()
+        self.stop_recording()
         if self._hid_device:
             self._hid_device.close()
             self._hid_device = None
@@ -88,11 +147,45 @@ class GameCubeController:
         """Returns True if the controller is connected, False otherwise."""
         return self._hid_device is not None
 
+    @property
+    def is_reading(self) -> bool:
+        """Returns True if a background reader is capturing packets."""
+        return self._reader is not None
+
+    def start_reader(self, capacity: int = 1024, timeout_ms: int = 100) -> None:
+        """
+        Starts capturing packets on a background thread.
+
+        While the reader runs, packets are timestamped and stored in a ring
+        buffer as soon as they arrive. `read()` then returns the newest packet
+        without blocking, and `drain()` returns every packet since its last call.
+
+        Args:
+            capacity: Number of packets the ring buffer holds.
+            timeout_ms: How long each blocking device read waits; bounds how
+                        quickly stop_reader() returns.
+        """
+        if not self.is_connected:
+            raise ConnectionError("Controller is not connected. Call connect() or use a 'with' statement.")
+        if self._reader is not None:
+            return
+        assert self._hid_device is not None
+        self._reader = BackgroundReader(self._hid_device, PacketRingBuffer(capacity), timeout_ms)
+        self._reader.start()
+
+    def stop_reader(self) -> None:
+        """Stops the background reader, if one is running."""
+        if self._reader is not None:
+            self._reader.stop()
+            self._reader = None
+
     def read(self, timeout_ms: int = 100) -> bool:
         """
         Reads the latest data packet from the controller and updates its state.
 
         This method should be called repeatedly in a loop to get live updates.
+        If a background reader is running it never blocks; every packet captured
+        since the last call is applied in order, so no input events are missed.
 
         Args:
             timeout_ms: The time in milliseconds to wait for a packet.
@@ -103,6 +196,9 @@ class GameCubeController:
         if not self.is_connected:
             return False
 
+        if self._reader is not None:
+            return bool(self.drain())
+
         try:
             assert self._hid_device is not None
             data = self._hid_device.read(64, timeout_ms=timeout_ms)
@@ -114,15 +210,52 @@ class GameCubeController:
         if not data:
             return False # Read timed out, no new data
 
+        return self._apply_packet(data)
+
+    def drain(self) -> List[PacketSample]:
+        """
+        Returns every packet captured by the background reader since the last
+        call, oldest first, and applies each of them to the state in turn.
+
+        Returns an empty list if no background reader is running.
+        """
+        if self._reader is None or not self._check_reader():
+            return []
+        samples = self._reader.buffer.drain()
+        for sample in samples:
+            self._apply_packet(sample.data, sample.timestamp_ns)
+        return samples
+
+    @property
+    def dropped_packets(self) -> int:
+        """Packets the background reader overwrote before drain() collected them."""
+        return self._reader.buffer.dropped if self._reader is not None else 0
+
+    def _check_reader(self) -> bool:
+        """Disconnects if the background reader stopped on a device error."""
+        assert self._reader is not None
+        if self._reader.error is None:
+            return True
+        print(f"Error reading from device, disconnecting: {self._reader.error}")
+        self.close()
+        return False
+
+    def _apply_packet(self, data: Sequence[int], timestamp_ns: int = 0) -> bool:
+        """Decodes a raw packet into the sub-controllers. Returns False if it is too short."""
         # Based on a common controller data format.
         # This may need adjustment depending on the specific adapter.
         if len(data) >= 8:
+            timestamp_ns = timestamp_ns or time.monotonic_ns()
+            if self._recorder is not None:
+                self._recorder.write(timestamp_ns, data)
             self.main_stick.update(x_val=data[0], y_val=data[1])
             self.c_stick.update(x_val=data[3], y_val=data[2])
             self.l_trigger_analog = data[4]
             self.buttons.update(byte5=data[5], byte6=data[6])
             self.dpad.update(byte_val=data[5])
             self.r_trigger_analog = data[7]
+            self.events.update(self.buttons.value, self.main_stick.direction,
+                               self.c_stick.direction, self.dpad.direction, timestamp_ns)
             return True
 
         return False # Data packet was too short
@@ -138,7 +271,6 @@ class GameCubeController:
 
 
 if __name__ == '__main__':
-    import time
     import sys
 
     print("--- GameCube Controller Test ---")
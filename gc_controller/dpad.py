@@ -8,6 +8,32 @@ class DpadDirection(Enum):
     LEFT = "Left"
     RIGHT = "Right"
 
+def _compute_direction(value: int) -> DpadDirection:
+    """Maps a D-Pad nibble to a direction. Used to build the lookup table."""
+    # This mapping handles a specific hardware quirk where "Up" and "Down"
+    # incorrectly report a "Left" component. We explicitly map these
+    # quirky values (7 and 5) to their intended cardinal directions.
+    if value == 7:
+        return DpadDirection.UP
+    elif value == 5:
+        return DpadDirection.DOWN
+    elif value == 6:
+        return DpadDirection.LEFT
+    elif value == 2:
+        return DpadDirection.RIGHT
+    # The cardinal directions for UP (0) and DOWN (4) are added as a fallback
+    # in case the hardware behaves correctly under some circumstances.
+    elif value == 0:
+        return DpadDirection.UP
+    elif value == 4:
+        return DpadDirection.DOWN
+    else:
+        # Any other value is treated as center.
+        return DpadDirection.CENTER
+
+# Direction for each of the 16 possible nibble values.
+DIRECTION_TABLE = tuple(_compute_direction(value) for value in range(16))
+
 class Dpad:
     """
     Parses and holds the state of the 4-way digital D-Pad.
@@ -17,6 +43,8 @@ class Dpad:
     from the numerical value of the lower 4 bits of a data byte,
     and includes logic to handle specific hardware quirks.
     """
+    __slots__ = ("_value",)
+
     def __init__(self):
         # A value of 8 or higher is typically used for the released/centered state.
         self._value = 8
@@ -36,23 +64,4 @@ class Dpad:
         """
         Returns the current direction of the D-Pad, correcting for hardware quirks.
         """
-        # This mapping handles a specific hardware quirk where "Up" and "Down"
-        # incorrectly report a "Left" component. We explicitly map these
-        # quirky values (7 and 5) to their intended cardinal directions.
-        if self._value == 7:
-            return DpadDirection.UP
-        elif self._value == 5:
-            return DpadDirection.DOWN
-        elif self._value == 6:
-            return DpadDirection.LEFT
-        elif self._value == 2:
-            return DpadDirection.RIGHT
-        # The cardinal directions for UP (0) and DOWN (4) are added as a fallback
-        # in case the hardware behaves correctly under some circumstances.
-        elif self._value == 0:
-            return DpadDirection.UP
-        elif self._value == 4:
-            return DpadDirection.DOWN
-        else:
-            # Any other value is treated as center.
-            return DpadDirection.CENTER
+        return DIRECTION_TABLE[self._value]
@@ -0,0 +1,122 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Iterator, List, Optional, Sequence, Tuple
+
+from .buttons import Button
+from .joystick import JoystickDirection
+from .dpad import DpadDirection
+
+# Every real button, in bit order. Iterating the flag class is avoided because
+# whether NONE is included differs between Python versions.
+# Each entry pairs the plain int bit (cheap to test) with its Button.
+_BUTTONS: Tuple[Tuple[int, Button], ...] = tuple((int(b), b) for b in Button.__members__.values() if b)
+
+class EventKind(Enum):
+    """The kinds of change an InputEvent can describe."""
+    PRESSED = "Pressed"
+    RELEASED = "Released"
+    MAIN_STICK = "MainStick"
+    C_STICK = "CStick"
+    DPAD = "Dpad"
+
+@dataclass(frozen=True)
+class InputEvent:
+    """
+    A single change in controller input.
+
+    Button events carry the `button`; stick and D-Pad events carry the new
+    `direction` and the `previous` one.
+    """
+    kind: EventKind
+    button: Button = Button.NONE
+    direction: Optional[Enum] = None
+    previous: Optional[Enum] = None
+    timestamp_ns: int = 0
+
+    def __repr__(self) -> str:
+        if self.kind in (EventKind.PRESSED, EventKind.RELEASED):
+            return f"InputEvent({self.kind.value} {self.button.name})"
+        return f"InputEvent({self.kind.value} {self.previous.name} -> {self.direction.name})"
+
+EventCallback = Callable[[InputEvent], None]
+
+class InputEvents:
+    """
+    Turns successive controller states into a stream of change events.
+
+    Button edges are found by XORing the previous and current button flags;
+    stick and D-Pad events fire when their computed direction changes. Events
+    are queued for iteration (`for event in controller.events`) and also
+    passed to any subscribed callbacks as soon as they are detected.
+    """
+    def __init__(self, max_pending: int = 256):
+        """
+        Initializes the InputEvents class.
+
+        Args:
+            max_pending: Maximum number of queued events. When full, the
+                         oldest events are discarded.
+        """
+        self._pending: Deque[InputEvent] = deque(maxlen=max_pending)
+        self._subscribers: List[Tuple[EventCallback, Optional[frozenset]]] = []
+        self._flags = 0
+        self._main = JoystickDirection.CENTER
+        self._c = JoystickDirection.CENTER
+        self._dpad = DpadDirection.CENTER
+
+    def subscribe(self, callback: EventCallback, kinds: Optional[Sequence[EventKind]] = None) -> EventCallback:
+        """
+        Registers a callback for events, optionally only of the given kinds.
+
+        Returns the callback so this can be used as a decorator.
+        """
+        self._subscribers.append((callback, frozenset(kinds) if kinds else None))
+        return callback
+
+    def unsubscribe(self, callback: EventCallback) -> None:
+        """Removes every registration of a callback."""
+        self._subscribers = [s for s in self._subscribers if s[0] is not callback]
+
+    def clear(self) -> None:
+        """Discards all queued events."""
+        self._pending.clear()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __iter__(self) -> Iterator[InputEvent]:
+        """Yields and removes queued events, oldest first."""
+        pending = self._pending
+        while pending:
+            yield pending.popleft()
+
+    def update(self, flags: int, main_stick: JoystickDirection, c_stick: JoystickDirection,
+               dpad: DpadDirection, timestamp_ns: int = 0) -> None:
+        """Compares a new controller state with the previous one and emits the differences."""
+        changed = flags ^ self._flags
+        if changed:
+            for bit, button in _BUTTONS:
+                if changed & bit:
+                    kind = EventKind.PRESSED if flags & bit else EventKind.RELEASED
+                    self._emit(InputEvent(kind, button, timestamp_ns=timestamp_ns))
+            self._flags = flags
+
+        if main_stick is not self._main:
+            self._emit(InputEvent(EventKind.MAIN_STICK, direction=main_stick, previous=self._main,
+                                  timestamp_ns=timestamp_ns))
+            self._main = main_stick
+        if c_stick is not self._c:
+            self._emit(InputEvent(EventKind.C_STICK, direction=c_stick, previous=self._c,
+                                  timestamp_ns=timestamp_ns))
+            self._c = c_stick
+        if dpad is not self._dpad:
+            self._emit(InputEvent(EventKind.DPAD, direction=dpad, previous=self._dpad,
+                                  timestamp_ns=timestamp_ns))
+            self._dpad = dpad
+
+    def _emit(self, event: InputEvent) -> None:
+        self._pending.append(event)
+        for callback, kinds in self._subscribers:
+            if kinds is None or event.kind in kinds:
+                callback(event)
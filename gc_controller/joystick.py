@@ -1,5 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
+from typing import Dict, Tuple
 
 @dataclass(frozen=True, repr=False)
 class JoystickAnalog:
@@ -25,13 +26,68 @@ class JoystickDirection(Enum):
     DOWN_RIGHT = "DOWN_RIGHT"
     DOWN_LEFT = "DOWN_LEFT"
 
+def _compute_direction(x: int, y: int, deadzone: int) -> JoystickDirection:
+    """Calculates the direction of a stick position. Used to build the lookup tables."""
+    center = 128
+
+    # Note: For many controllers, a higher Y value means the stick is pushed UP.
+    y_dist = y - center
+    x_dist = x - center
+
+    # Check against the deadzone
+    # For this specific controller, a lower Y-value means UP.
+    is_up = y_dist < -deadzone
+    is_down = y_dist > deadzone
+    is_right = x_dist > deadzone
+    is_left = x_dist < -deadzone
+
+    # Determine direction, prioritizing diagonals
+    if is_up:
+        if is_right:
+            return JoystickDirection.UP_RIGHT
+        if is_left:
+            return JoystickDirection.UP_LEFT
+        return JoystickDirection.UP
+
+    if is_down:
+        if is_right:
+            return JoystickDirection.DOWN_RIGHT
+        if is_left:
+            return JoystickDirection.DOWN_LEFT
+        return JoystickDirection.DOWN
+
+    # Handle non-diagonal horizontal movement
+    if is_right:
+        return JoystickDirection.RIGHT
+    if is_left:
+        return JoystickDirection.LEFT
+
+    return JoystickDirection.CENTER
+
+# Direction lookup tables, one per deadzone, indexed by (x << 8) | y.
+_DIRECTION_TABLES: Dict[int, Tuple[JoystickDirection, ...]] = {}
+
+def direction_table(deadzone: int) -> Tuple[JoystickDirection, ...]:
+    """
+    Returns the 256x256 direction lookup table for a deadzone, flattened and
+    indexed by (x << 8) | y. Tables are built once and shared.
+    """
+    table = _DIRECTION_TABLES.get(deadzone)
+    if table is None:
+        table = tuple(_compute_direction(x, y, deadzone) for x in range(256) for y in range(256))
+        _DIRECTION_TABLES[deadzone] = table
+    return table
+
 class Joystick:
     """
     Parses and holds the state for a single analog joystick.
 
     This class is stateful and is designed to be updated with new data
-    from the main controller on each read cycle.
+    from the main controller on each read cycle. Directions are looked up
+    in a precomputed table, so reading them does no work per frame.
     """
+    __slots__ = ("_x", "_y", "_deadzone", "_directions")
+
     def __init__(self, deadzone: int = 30):
         """
         Initializes the Joystick state.
@@ -43,6 +99,7 @@ class Joystick:
         self._x = 128
         self._y = 128
         self._deadzone = deadzone
+        self._directions = direction_table(deadzone)
 
     def update(self, x_val: int, y_val: int):
         """Updates the internal state of the joystick from new byte values."""
@@ -70,38 +127,7 @@ class Joystick:
         Returns the calculated cardinal or diagonal direction based on
         the current analog values and deadzone.
         """
-        center = 128
-
-        # Note: For many controllers, a higher Y value means the stick is pushed UP.
-        y_dist = self._y - center
-        x_dist = self._x - center
-
-        # Check against the deadzone
-        # For this specific controller, a lower Y-value means UP.
-        is_up = y_dist < -self._deadzone
-        is_down = y_dist > self._deadzone
-        is_right = x_dist > self._deadzone
-        is_left = x_dist < -self._deadzone
-
-        # Determine direction, prioritizing diagonals
-        if is_up:
-            if is_right:
-                return JoystickDirection.UP_RIGHT
-            if is_left:
-                return JoystickDirection.UP_LEFT
-            return JoystickDirection.UP
-
-        if is_down:
-            if is_right:
-                return JoystickDirection.DOWN_RIGHT
-            if is_left:
-                return JoystickDirection.DOWN_LEFT
-            return JoystickDirection.DOWN
-
-        # Handle non-diagonal horizontal movement
-        if is_right:
-            return JoystickDirection.RIGHT
-        if is_left:
-            return JoystickDirection.LEFT
-
-        return JoystickDirection.CENTER
+        x, y = self._x, self._y
+        if 0 <= x <= 255 and 0 <= y <= 255:
+            return self._directions[(x << 8) | y]
+        return _compute_direction(x, y, self._deadzone)
@@ -0,0 +1,205 @@
+import selectors
+import time
+from typing import Iterator, List, Optional
+
+from .backends import HidBackend, HidDevice, default_backend
+from .controller import GameCubeController
+from .reader import DeviceFeed, MultiDeviceReader, PacketRingBuffer
+
+class ControllerManager:
+    """
+    Serves every matching adapter and controller port from one process.
+
+    The adapter exposes each of its controller ports as its own HID
+    interface, so every matching device that is found becomes one port.
+    Each port is decoded into its own GameCubeController, which offers the
+    usual `main_stick`, `buttons`, `dpad` and `events` state. All ports are
+    read by a single loop instead of one thread per device.
+
+    It is designed to be used as a context manager with a 'with' statement:
+
+        with ControllerManager() as manager:
+            manager.start_reader()
+            while True:
+                for port in manager.read():
+                    print(port.main_stick.direction)
+    """
+    def __init__(self, vendor_id: int = 0x0079, product_id: int = 0x0006,
+                 backend: Optional[HidBackend] = None):
+        """
+        Initializes the ControllerManager class.
+
+        Args:
+            vendor_id: The USB vendor ID of the adapters.
+            product_id: The USB product ID of the adapters.
+            backend: How devices are found and opened. HidrawBackend devices
+                     can all be waited on at once; hidapi devices are polled.
+                     Defaults to hidapi if it is installed, else hidraw on Linux.
+        """
+        self._vendor_id = vendor_id
+        self._product_id = product_id
+        self._backend = backend
+        self.ports: List[GameCubeController] = []
+        self._reader: Optional[MultiDeviceReader] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+
+    def connect(self) -> None:
+        """
+        Opens every matching device as a port.
+        Raises ConnectionError if none can be found or opened.
+        """
+        if self.ports:
+            return
+        if self._backend is None:
+            try:
+                self._backend = default_backend()
+            except ImportError as e:
+                raise ConnectionError(str(e)) from e
+
+        devices = self._backend.enumerate(self._vendor_id, self._product_id)
+        if not devices:
+            raise ConnectionError("No GameCube controller adapters found.")
+        try:
+            for info in devices:
+                self.add_port(self._backend.open(info), info)
+        except (IOError, ValueError) as e:
+            self.close()
+            raise ConnectionError(f"Failed to open HID device: {e}") from e
+
+    def add_port(self, device: HidDevice, info: Optional[dict] = None) -> GameCubeController:
+        """
+        Adds an already open device as a port, e.g. a HidrawDevice on a test pipe.
+
+        Returns:
+            The port's decoded state.
+        """
+        if self._reader is not None:
+            raise RuntimeError("Stop the reader before adding ports.")
+        port = GameCubeController(self._vendor_id, self._product_id, self._backend)
+        port._device_info = info
+        port._hid_device = device
+        self.ports.append(port)
+        self._reset_selector()
+        return port
+
+    def close(self) -> None:
+        """Stops reading and closes every port."""
+        self.stop_reader()
+        for port in self.ports:
+            port.close()
+        self.ports.clear()
+        self._reset_selector()
+
+    def _reset_selector(self) -> None:
+        """Drops the polling selector so the next read() registers the open ports again."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    @property
+    def is_reading(self) -> bool:
+        """Returns True if the background reader is capturing packets."""
+        return self._reader is not None
+
+    def start_reader(self, capacity: int = 1024, timeout_ms: int = 100) -> None:
+        """
+        Starts capturing packets from every port on one background thread.
+
+        While it runs, `read()` never blocks and each port's `drain()` returns
+        every packet it received since the last call.
+
+        Args:
+            capacity: Number of packets each port's ring buffer holds.
+            timeout_ms: How long each wait blocks; bounds how quickly stop_reader() returns.
+        """
+        if not self.ports:
+            raise ConnectionError("No ports are connected. Call connect() or use a 'with' statement.")
+        if self._reader is not None:
+            return
+        ports = [port for port in self.ports if port.is_connected]
+        self._reader = MultiDeviceReader([port._hid_device for port in ports],
+                                         [PacketRingBuffer(capacity) for _ in ports], timeout_ms)
+        for index, port in enumerate(ports):
+            port._reader = DeviceFeed(self._reader, index)
+        self._reader.start()
+
+    def stop_reader(self) -> None:
+        """Stops the background reader, if one is running."""
+        if self._reader is not None:
+            self._reader.stop()
+            self._reader = None
+            for port in self.ports:
+                port._reader = None
+            # Ports may have been closed while the reader ran.
+            self._reset_selector()
+
+    def read(self, timeout_ms: int = 0) -> List[GameCubeController]:
+        """
+        Applies new packets to every port.
+
+        Without the background reader, waits up to `timeout_ms` for any port
+        to have data and then reads everything that is ready (hidapi ports
+        are checked without waiting). With it, drains each port's buffer
+        without blocking.
+
+        Returns:
+            The ports whose state changed, in port order.
+        """
+        if self._reader is not None:
+            return [port for port in self.ports if port.is_connected and port.drain()]
+        return self._poll(timeout_ms)
+
+    def _poll(self, timeout_ms: int) -> List[GameCubeController]:
+        selector = self._selector
+        if selector is None:
+            selector = self._selector = selectors.DefaultSelector()
+            for port in self.ports:
+                if port.is_connected and hasattr(port._hid_device, "fileno"):
+                    selector.register(port._hid_device.fileno(), selectors.EVENT_READ, port)
+        polled = [port for port in self.ports
+                  if port.is_connected and not hasattr(port._hid_device, "fileno")]
+
+        # Devices without a descriptor cannot be waited on; they are checked once per call.
+        ready = [key.data for key, _ in selector.select(0 if polled else timeout_ms / 1000)] + polled
+
+        updated = []
+        for port in self.ports:
+            if port in ready and port.is_connected and self._apply_ready(port, selector):
+                updated.append(port)
+        return updated
+
+    @staticmethod
+    def _apply_ready(port: GameCubeController, selector: selectors.BaseSelector) -> bool:
+        """Applies every packet the port has ready. Closes the port if its device failed."""
+        device = port._hid_device
+        assert device is not None
+        applied = False
+        try:
+            data = device.read(64, 0)
+            while data:
+                applied = port._apply_packet(data, time.monotonic_ns()) or applied
+                data = device.read(64, 0)
+        except (IOError, ValueError) as e:
+            print(f"Error reading from device, disconnecting: {e}")
+            if hasattr(device, "fileno"):
+                selector.unregister(device.fileno())
+            port.close()
+        return applied
+
+    def __getitem__(self, index: int) -> GameCubeController:
+        return self.ports[index]
+
+    def __iter__(self) -> Iterator[GameCubeController]:
+        return iter(self.ports)
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    def __enter__(self):
+        """Context manager entry: opens every port."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: closes every port."""
+        self.close()
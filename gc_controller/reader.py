@@ -0,0 +1,235 @@
+import selectors
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, List, NamedTuple, Optional, Sequence
+
+class PacketSample(NamedTuple):
+    """A raw controller packet and the time it was received."""
+    timestamp_ns: int  # time.monotonic_ns() when the packet was read.
+    data: bytes
+
+class PacketRingBuffer:
+    """
+    Bounded, thread-safe buffer of the most recent controller packets.
+
+    One thread appends samples while a consumer either takes only the newest
+    one or drains everything it has not seen yet. When the buffer is full the
+    oldest sample is overwritten; samples overwritten before they could be
+    drained are counted in `dropped`.
+    """
+    def __init__(self, capacity: int = 1024):
+        """
+        Initializes the PacketRingBuffer class.
+
+        Args:
+            capacity: Maximum number of samples kept.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self._samples: Deque[PacketSample] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._written = 0  # Total samples appended.
+        self._consumed = 0  # Value of _written when the consumer last looked.
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def unread(self) -> int:
+        """Number of samples appended since the consumer last looked."""
+        return self._written - self._consumed
+
+    def append(self, sample: PacketSample) -> None:
+        with self._lock:
+            self._samples.append(sample)
+            self._written += 1
+
+    def latest(self) -> Optional[PacketSample]:
+        """
+        Returns the newest sample if one arrived since the last call, else None.
+
+        Older unread samples are skipped, not counted as dropped.
+        """
+        with self._lock:
+            if self._written == self._consumed:
+                return None
+            self._consumed = self._written
+            return self._samples[-1]
+
+    def drain(self) -> List[PacketSample]:
+        """Returns every sample appended since the last call, oldest first."""
+        with self._lock:
+            unread = self._written - self._consumed
+            self._consumed = self._written
+            available = min(unread, len(self._samples))
+            self.dropped += unread - available
+            if available == 0:
+                return []
+            samples = list(self._samples)
+            return samples[len(samples) - available:]
+
+class BackgroundReader:
+    """
+    Reads packets from an open HID device on a background thread.
+
+    The thread blocks in the device's read call and stores every packet,
+    timestamped on arrival, in a PacketRingBuffer. Input is therefore
+    captured as soon as the adapter sends it, independent of how often the
+    application loop runs.
+    """
+    def __init__(self, device: Any, buffer: PacketRingBuffer, timeout_ms: int = 100):
+        """
+        Initializes the BackgroundReader class.
+
+        Args:
+            device: An open device with a hidapi-style `read(size, timeout_ms)` method.
+            buffer: The ring buffer packets are written to.
+            timeout_ms: How long one read blocks. It bounds how quickly stop() returns.
+        """
+        self._device = device
+        self.buffer = buffer
+        self._timeout_ms = timeout_ms
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True while the reader thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="gc-controller-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the reader thread and waits for its current read to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        read = self._device.read
+        append = self.buffer.append
+        clock = time.monotonic_ns
+        while not self._stop_event.is_set():
+            try:
+                data = read(64, timeout_ms=self._timeout_ms)
+            except (IOError, ValueError) as e:
+                self.error = e
+                return
+            if data:
+                append(PacketSample(clock(), bytes(data)))
+
+class MultiDeviceReader:
+    """
+    Reads packets from several open devices on one background thread.
+
+    Devices with a `fileno()` (such as HidrawDevice) are waited on together
+    with selectors, so an idle thread costs nothing and a packet is picked up
+    as soon as any device has one. Devices without one (hidapi) are polled
+    without blocking on every pass instead, which bounds their latency by
+    `poll_interval_ms`. Each device's packets go to its own ring buffer.
+    """
+    def __init__(self, devices: Sequence[Any], buffers: Sequence[PacketRingBuffer],
+                 timeout_ms: int = 100, poll_interval_ms: int = 1):
+        """
+        Initializes the MultiDeviceReader class.
+
+        Args:
+            devices: Open devices with a hidapi-style `read(size, timeout_ms)` method.
+            buffers: One ring buffer per device.
+            timeout_ms: How long one wait blocks. It bounds how quickly stop() returns.
+            poll_interval_ms: How long one wait blocks when some devices have to be polled.
+        """
+        if len(devices) != len(buffers):
+            raise ValueError("Every device needs its own buffer.")
+        self._devices = list(devices)
+        self.buffers = list(buffers)
+        self._timeout_ms = timeout_ms
+        self._poll_interval_ms = poll_interval_ms
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # The error that stopped reading each device, by device index.
+        self.errors: List[Optional[Exception]] = [None] * len(self._devices)
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True while the reader thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.errors = [None] * len(self._devices)
+        self._thread = threading.Thread(target=self._run, name="gc-controller-multi-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the reader thread and waits for its current wait to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        selector = selectors.DefaultSelector()
+        polled: List[int] = []
+        for index, device in enumerate(self._devices):
+            if hasattr(device, "fileno"):
+                selector.register(device.fileno(), selectors.EVENT_READ, index)
+            else:
+                polled.append(index)
+        timeout = (self._poll_interval_ms if polled else self._timeout_ms) / 1000
+        try:
+            while not self._stop_event.is_set() and (polled or selector.get_map()):
+                for key, _ in selector.select(timeout):
+                    if not self._read_all(key.data):
+                        selector.unregister(key.fd)
+                for index in list(polled):
+                    if not self._read_all(index):
+                        polled.remove(index)
+        finally:
+            selector.close()
+
+    def _read_all(self, index: int) -> bool:
+        """Stores every packet the device has ready. Returns False if the device failed."""
+        read = self._devices[index].read
+        append = self.buffers[index].append
+        clock = time.monotonic_ns
+        try:
+            data = read(64, 0)
+            while data:
+                append(PacketSample(clock(), bytes(data)))
+                data = read(64, 0)
+        except (IOError, ValueError) as e:
+            self.errors[index] = e
+            return False
+        return True
+
+class DeviceFeed:
+    """
+    One device's share of a MultiDeviceReader.
+
+    Offers the `buffer`, `error` and `stop()` members of a BackgroundReader,
+    so a GameCubeController can consume it in place of its own reader thread.
+    """
+    def __init__(self, reader: MultiDeviceReader, index: int):
+        self._reader = reader
+        self._index = index
+        self.buffer = reader.buffers[index]
+
+    @property
+    def error(self) -> Optional[Exception]:
+        return self._reader.errors[self._index]
+
+    def stop(self) -> None:
+        """Does nothing; the shared reader is stopped by its owner."""
@@ -0,0 +1,220 @@
+"""
+Binary recording and replay of raw controller packets.
+
+A recording is a 16-byte header followed by fixed-size 16-byte records, each
+holding the time.monotonic_ns() timestamp of a packet and its first 8 bytes
+(all that the decoder uses). Fixed-size records keep the file append-only
+and let a reader index any packet directly through mmap.
+"""
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Iterator, List, Optional, Sequence
+
+from .reader import PacketSample
+
+MAGIC = b"GCPKTS"
+VERSION = 1
+PACKET_SIZE = 8
+
+_HEADER = struct.Struct("<6sH8x")  # magic, version, reserved
+_RECORD = struct.Struct(f"<Q{PACKET_SIZE}s")  # timestamp_ns, packet
+
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+class PacketRecorder:
+    """
+    Appends packets to a recording file from a background writer thread.
+
+    `write()` only queues the packet, so recording never blocks the thread
+    that reads the controller on disk I/O.
+
+    It is designed to be used as a context manager with a 'with' statement.
+    """
+    def __init__(self, path: str):
+        """
+        Initializes the PacketRecorder class and starts its writer thread.
+
+        Args:
+            path: The recording file. An existing recording is appended to.
+
+        Raises:
+            ValueError: If the file exists but is not a packet recording.
+        """
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(MAGIC, VERSION))
+        else:
+            _check_header(path)
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self.records_written = 0
+        self._thread = threading.Thread(target=self._run, name="gc-controller-recorder", daemon=True)
+        self._thread.start()
+
+    def write(self, timestamp_ns: int, data: Sequence[int]) -> None:
+        """Queues one packet for writing."""
+        self._queue.put(_RECORD.pack(timestamp_ns, bytes(data[:PACKET_SIZE])))
+
+    def close(self) -> None:
+        """Writes all queued packets and closes the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._file.close()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            # Collect whatever else is already queued to write it in one call.
+            records: List[bytes] = []
+            while record is not None:
+                records.append(record)
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if records:
+                self._file.write(b"".join(records))
+                self._file.flush()
+                self.records_written += len(records)
+            if record is None:
+                return
+
+    def __enter__(self):
+        """Context manager entry: returns the recorder."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: writes the queued packets and closes the file."""
+        self.close()
+
+def _check_header(path: str) -> None:
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path} is too short to be a packet recording.")
+    magic, version = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} packet recording.")
+
+class PacketLog:
+    """
+    Read-only, memory-mapped view of a recording.
+
+    Packets are decoded on access, so opening even a very large recording is
+    instant. Supports len(), indexing and iteration.
+    """
+    def __init__(self, path: str):
+        """
+        Opens a recording.
+
+        Args:
+            path: The recording file.
+
+        Raises:
+            ValueError: If the file is not a packet recording.
+        """
+        _check_header(path)
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # A record still being written when the file was opened is ignored.
+        self._count = (size - HEADER_SIZE) // RECORD_SIZE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._count else None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> PacketSample:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("packet index out of range")
+        assert self._map is not None
+        timestamp_ns, data = _RECORD.unpack_from(self._map, HEADER_SIZE + index * RECORD_SIZE)
+        return PacketSample(timestamp_ns, data)
+
+    def __iter__(self) -> Iterator[PacketSample]:
+        unpack_from = _RECORD.unpack_from
+        for index in range(self._count):
+            assert self._map is not None
+            timestamp_ns, data = unpack_from(self._map, HEADER_SIZE + index * RECORD_SIZE)
+            yield PacketSample(timestamp_ns, data)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        """Context manager entry: returns the open log."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: unmaps and closes the file."""
+        self.close()
+
+class ReplayDevice:
+    """
+    Plays a recording back through the hidapi device interface.
+
+    GameCubeController reads from it exactly as from real hardware, so
+    replayed input goes through the same decoding path. In real-time mode
+    each packet is returned at its original offset from the start of the
+    replay; otherwise packets are returned as fast as they are read.
+    """
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False):
+        """
+        Initializes the ReplayDevice class.
+
+        Args:
+            path: The recording file.
+            realtime: Reproduce the original packet timing.
+            loop: Start over at the end of the recording instead of returning
+                  no data.
+        """
+        self._log = PacketLog(path)
+        self._realtime = realtime
+        self._loop = loop
+        self._index = 0
+        self._started_ns: Optional[int] = None
+
+    @property
+    def finished(self) -> bool:
+        """Returns True once every packet has been returned (never when looping)."""
+        return not self._loop and self._index >= len(self._log)
+
+    def read(self, size: int, timeout_ms: int = 0) -> List[int]:
+        """Returns the next packet, or an empty list if none is due within the timeout."""
+        if self._index >= len(self._log):
+            if not self._loop or len(self._log) == 0:
+                if timeout_ms > 0:
+                    time.sleep(timeout_ms / 1000)
+                return []
+            self._index = 0
+            self._started_ns = None
+
+        sample = self._log[self._index]
+        if self._realtime:
+            now = time.monotonic_ns()
+            if self._started_ns is None:
+                # Anchor the recording's first timestamp to the start of the replay.
+                self._started_ns = now - sample.timestamp_ns + self._log[0].timestamp_ns
+            wait_ns = sample.timestamp_ns - self._log[0].timestamp_ns + self._started_ns - now
+            if wait_ns > 0:
+                if wait_ns > timeout_ms * 1_000_000:
+                    time.sleep(max(timeout_ms, 0) / 1000)
+                    return []
+                time.sleep(wait_ns / 1e9)
+
+        self._index += 1
+        return list(sample.data[:size])
+
+    def close(self) -> None:
+        self._log.close()
@@ -1,6 +1,6 @@
-import time
 from clear_core import ClearCoreController
-from demo_gantry.hatch import HATCH_MOTOR_ID, update_hatch
+from demo_gantry.hatch import HATCH_MOTOR_ID, HatchController
+from demo_gantry.scheduler import FixedRateScheduler
 
 
 if __name__=="__main__":
@@ -10,9 +10,8 @@ if __name__=="__main__":
     with controller as cc:
         try:
             cc.motors.enable(HATCH_MOTOR_ID)
-            while True:
-                update_hatch(cc)
-                time.sleep(0.1)
+            hatch = HatchController(cc)
+            FixedRateScheduler(10).run(hatch.update)
         except ConnectionError as e:
             print(f"\n[ERROR] A connection error occurred: {e}")
         except KeyboardInterrupt:
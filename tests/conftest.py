@@ -0,0 +1,69 @@
+import queue
+import socket
+from typing import Iterator, List, Optional, Union
+
+import pytest
+
+from clear_core import ClearCoreController, LoopbackTransport
+from clear_core.motors import Status
+from clear_core.simulator import ClearCoreSimulator
+from gc_controller import HidrawDevice
+
+# Raw 8-byte controller packets: stick centred and nothing pressed; A held with
+# the main stick pushed left.
+IDLE_PACKET = bytes([128, 128, 128, 128, 0, 0x08, 0x00, 0])
+A_LEFT_PACKET = bytes([0, 128, 128, 128, 0, 0x48, 0x00, 0])
+# B and START held, D-Pad up, C-stick pushed down-right, both triggers part-way.
+BUSY_PACKET = bytes([128, 20, 250, 250, 60, 0x80 | 0x07, 0x20, 90])
+
+class FakeDevice:
+    """A hidapi-style device whose reports are queued by the test."""
+    def __init__(self):
+        self._reports: "queue.Queue[Union[bytes, OSError]]" = queue.Queue()
+        self.closed = False
+
+    def send(self, report: bytes) -> None:
+        """Queues a report for the next read."""
+        self._reports.put(report)
+
+    def fail(self, error: Optional[OSError] = None) -> None:
+        """Makes the read after the queued reports raise `error`."""
+        self._reports.put(error or OSError("Device unplugged."))
+
+    def read(self, size: int, timeout_ms: int = 0) -> bytes:
+        try:
+            report = self._reports.get(timeout=timeout_ms / 1000) if timeout_ms else self._reports.get_nowait()
+        except queue.Empty:
+            return b""
+        if isinstance(report, OSError):
+            raise report
+        return report[:size]
+
+    def close(self) -> None:
+        self.closed = True
+
+@pytest.fixture
+def simulator() -> ClearCoreSimulator:
+    """A simulator with every motor already enabled, driven in-process."""
+    sim = ClearCoreSimulator()
+    for motor in sim.motors:
+        motor.status = Status.READY
+    return sim
+
+@pytest.fixture
+def controller(simulator: ClearCoreSimulator) -> Iterator[ClearCoreController]:
+    """A controller connected to `simulator` through a loopback transport."""
+    with ClearCoreController(transport=LoopbackTransport(simulator.handle)) as cc:
+        yield cc
+
+@pytest.fixture
+def hid_pair() -> Iterator[List]:
+    """
+    Returns [device, peer]: a HidrawDevice reading one end of a SOCK_SEQPACKET
+    pair, and the socket that sends reports into it.
+    """
+    device_end, peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    device = HidrawDevice(fd=device_end.detach())
+    yield [device, peer]
+    device.close()
+    peer.close()
@@ -0,0 +1,64 @@
+import asyncio
+import socket
+
+import pytest
+
+from clear_core import AsyncClearCoreController, Status
+from clear_core.simulator import ClearCoreSimulator
+
+def test_pipelined_requests_resolve_in_order():
+    async def scenario():
+        with ClearCoreSimulator(fragment_size=3, seed=2) as sim:
+            sim.motors[1].status = Status.READY
+            sim.motors[1].position = -20
+            async with AsyncClearCoreController(*sim.address) as cc:
+                position, status, pins = await asyncio.gather(
+                    cc.motors.get_position(1), cc.motors.get_status(1), cc.io.read_input_pins([0, 1]))
+                positions = await asyncio.gather(*[cc.motors.get_position(1) for _ in range(50)])
+                assert cc.in_flight == 0
+        return position, status, pins.mask, set(positions)
+
+    assert asyncio.run(scenario()) == (-20, Status.READY, 0, {-20})
+
+def test_unanswered_commands_time_out():
+    async def scenario():
+        # A server that accepts the connection but never answers.
+        server = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        cc = AsyncClearCoreController("127.0.0.1", port, read_timeout=0.1)
+        await cc.connect()
+        results = await asyncio.wait_for(
+            asyncio.gather(cc.motors.get_position(1), cc.motors.get_status(1), return_exceptions=True), 5)
+        with pytest.raises(ConnectionError):
+            cc.motors.get_position(1)
+        await cc.close()
+        server.close()
+        await server.wait_closed()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ConnectionAbortedError) for result in results)
+
+def test_full_send_buffer_applies_backpressure():
+    async def scenario():
+        server = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        cc = AsyncClearCoreController("127.0.0.1", port, read_timeout=0.5)
+        await cc.connect()
+        cc._stream_writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        awaitables = [cc.motors.get_position(1) for _ in range(50000)]
+        waiting = sum(isinstance(awaitable, asyncio.Task) for awaitable in awaitables)
+        await asyncio.gather(*awaitables, return_exceptions=True)
+        await cc.close()
+        server.close()
+        await server.wait_closed()
+        return waiting
+
+    assert asyncio.run(scenario()) > 0
+
+def test_request_without_connection_raises():
+    async def scenario():
+        AsyncClearCoreController("127.0.0.1", 1).motors.get_position(0)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(scenario())
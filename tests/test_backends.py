@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from gc_controller import HidrawDevice
+from gc_controller.backends import HidapiBackend, HidBackend, HidrawBackend
+
+from .conftest import A_LEFT_PACKET, IDLE_PACKET
+
+def test_backend_without_both_methods_cannot_be_created():
+    class EnumerateOnly(HidBackend):
+        def enumerate(self, vendor_id, product_id):
+            return []
+
+    with pytest.raises(TypeError):
+        EnumerateOnly()
+
+def test_hidapi_is_imported_only_when_used(monkeypatch):
+    code = "import sys, gc_controller; print('hid' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.check_output([sys.executable, "-c", code], cwd=root).strip() == b"False"
+
+    monkeypatch.setitem(sys.modules, "hid", None)
+    with pytest.raises(ImportError):
+        HidapiBackend().enumerate(0x0079, 0x0006)
+
+def test_hidraw_device_reads_one_report_per_read(hid_pair):
+    device, peer = hid_pair
+    assert device.read(64, 0) == b""
+    assert device.read(64, 10) == b""
+    peer.send(A_LEFT_PACKET)
+    peer.send(IDLE_PACKET)
+    assert bytes(device.read(64, 100)) == A_LEFT_PACKET
+    assert bytes(device.read(64, 0)) == IDLE_PACKET
+    peer.close()
+    with pytest.raises(OSError):
+        device.read(64, 100)
+
+def test_hidraw_device_needs_a_path_or_descriptor():
+    with pytest.raises(ValueError):
+        HidrawDevice()
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="hidraw is Linux only")
+def test_hidraw_interface_number():
+    assert HidrawBackend._interface_number("usb-0000:00:14.0-1/input2") == 2
+    assert HidrawBackend._interface_number("") == -1
@@ -0,0 +1,80 @@
+from typing import Callable
+
+import pytest
+
+from clear_core import ClearCoreController, LoopbackTransport, Status
+
+def corrupting(handler: Callable[[str], str], command: str) -> Callable[[str], str]:
+    """Wraps a handler so that `command` gets a response that is not a number."""
+    def corrupted(body: str) -> str:
+        return body[:2] + " OK" if body == command else handler(body)
+    return corrupted
+
+def test_requests_and_groups(simulator, controller):
+    simulator.motors[1].position = -1500
+    simulator.set_input(1, True)
+    assert controller.motors.get_position(1) == -1500
+    assert controller.motors.get_status(1) is Status.READY
+    assert controller.io.read_input_pins([0, 1]).mask == 0b10
+
+def test_batch_resolves_every_placeholder_in_order(simulator, controller):
+    simulator.motors[0].position = 12
+    simulator.set_input(2, True)
+    with controller.batch() as batch:
+        position = batch.motors.get_position(0)
+        status = batch.motors.get_status(0)
+        pins = batch.io.read_input_pins([1, 2])
+        pin = batch.io.read_input_pin(2)
+        assert len(batch) == 5
+    assert position.result() == 12
+    assert status.result() is Status.READY
+    assert pins.result().mask == 0b100
+    assert pin.result() is True
+    assert controller.metrics.exchanges == 1
+
+def test_unflushed_placeholder_raises(controller):
+    batch = controller.batch()
+    pending = batch.motors.get_position(0)
+    with pytest.raises(RuntimeError):
+        pending.result()
+
+def test_batch_parse_error_only_fails_its_own_placeholder(simulator):
+    transport = LoopbackTransport(corrupting(simulator.handle, "M1GP"))
+    with ClearCoreController(transport=transport) as cc:
+        batch = cc.batch()
+        status = batch.motors.get_status(1)
+        bad = batch.motors.get_position(1)
+        pin = batch.io.read_input_pin(0)
+        group = batch.io.read_input_pins([0, 1])
+        with pytest.raises(ValueError):
+            batch.flush()
+        assert status.result() is Status.READY
+        assert pin.result() is False
+        assert group.result().mask == 0
+        with pytest.raises(ValueError):
+            bad.result()
+        # The connection is still in step with its commands.
+        assert cc.motors.get_position(0) == 0
+
+def test_failed_group_part_fails_the_group(simulator):
+    def truncating(body: str) -> str:
+        # Too short to hold a pin state.
+        return "I1" if body == "I1" else simulator.handle(body)
+
+    with ClearCoreController(transport=LoopbackTransport(truncating)) as cc:
+        batch = cc.batch()
+        group = batch.io.read_input_pins([0, 1])
+        with pytest.raises(IndexError):
+            batch.flush()
+        with pytest.raises(IndexError):
+            group.result()
+
+def test_connection_error_fails_every_placeholder(simulator):
+    cc = ClearCoreController(transport=LoopbackTransport(simulator.handle))
+    batch = cc.batch()
+    placeholders = [batch.motors.get_status(0), batch.io.read_input_pins([0, 1])]
+    with pytest.raises(ConnectionError):
+        batch.flush()
+    for pending in placeholders:
+        with pytest.raises(ConnectionError):
+            pending.result()
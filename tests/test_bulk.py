@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from gc_controller import GameCubeController
+
+from .conftest import A_LEFT_PACKET, BUSY_PACKET, IDLE_PACKET
+
+pytest.importorskip("numpy")
+from gc_controller.bulk import DPAD_DIRECTIONS, JOYSTICK_DIRECTIONS, decode_packets, decode_recording
+
+def test_bulk_decode_matches_the_live_decoder(tmp_path):
+
+    packets = [IDLE_PACKET, A_LEFT_PACKET, BUSY_PACKET]
+    decoded = decode_packets(b"".join(packets))
+    gc = GameCubeController()
+    for row, packet in zip(decoded, packets):
+        gc._apply_packet(packet)
+        assert row["buttons"] == gc.buttons.value
+        assert (row["main_x"], row["c_y"], row["r_trigger"]) == (gc.main_stick.x, gc.c_stick.y, gc.r_trigger_analog)
+        assert JOYSTICK_DIRECTIONS[row["main_direction"]] is gc.main_stick.direction
+        assert JOYSTICK_DIRECTIONS[row["c_direction"]] is gc.c_stick.direction
+        assert DPAD_DIRECTIONS[row["dpad"]] is gc.dpad.direction
+
+    path = os.path.join(str(tmp_path), "session.gcrec")
+    gc.start_recording(path)
+    for index, packet in enumerate(packets):
+        gc._apply_packet(packet, timestamp_ns=10 + index)
+    gc.stop_recording()
+    recorded = decode_recording(path)
+    assert list(recorded["timestamp_ns"]) == [10, 11, 12]
+    assert list(recorded["buttons"]) == list(decoded["buttons"])
+
+    with pytest.raises(ValueError):
+        decode_packets(b"\x00" * 12)
@@ -0,0 +1,96 @@
+from typing import Iterator
+
+import pytest
+
+from clear_core import ClearCoreController, CoalescingMotorControl, LoopbackTransport, Setpoint, Status
+
+@pytest.fixture
+def cc(simulator) -> Iterator[ClearCoreController]:
+    with ClearCoreController(transport=LoopbackTransport(simulator.handle), coalesce=True) as controller:
+        yield controller
+
+def sent(cc: ClearCoreController, command: str) -> int:
+    """Counts how often `command` reached the controller, using the latency histograms."""
+    return cc.metrics.histograms[command[-2:]].count if command[-2:] in cc.metrics.histograms else 0
+
+def test_repeated_settings_are_skipped(cc):
+    assert isinstance(cc.motors, CoalescingMotorControl)
+    assert cc.motors.set_velocity(1, 5000) == "M1 OK"
+    assert cc.motors.set_velocity(1, 5000) == "M1 OK"
+    assert sent(cc, "SV") == 1
+    assert cc.motors.suppressed == {"SV": 1}
+
+    cc.motors.set_velocity(1, 6000)
+    cc.motors.set_velocity(2, 6000)
+    cc.motors.set_velocity(1, 6000, force=True)
+    assert sent(cc, "SV") == 4
+    assert cc.motors.suppressed_total == 1
+
+def test_rejected_setting_is_not_skipped(simulator, cc):
+    cc.motors.set_acceleration(9, 100)
+    cc.motors.set_acceleration(9, 100)
+    assert sent(cc, "SA") == 2
+    assert cc.motors.suppressed == {}
+
+def test_setting_rejected_in_a_batch_is_not_skipped_later(simulator):
+    rejecting = [False]
+
+    def handler(body: str) -> str:
+        return body[:2] + " ERR" if rejecting[0] and body[2:4] == "SV" else simulator.handle(body)
+
+    with ClearCoreController(transport=LoopbackTransport(handler), coalesce=True) as cc:
+        cc.motors.set_velocity(1, 5000)
+        rejecting[0] = True
+        with cc.batch() as batch:
+            rejected = batch.motors.set_velocity(1, 5000)
+        assert rejected.result() == "M1 ERR"
+        rejecting[0] = False
+        assert cc.motors.set_velocity(1, 5000) == "M1 OK"
+        assert sent(cc, "SV") == 3
+        assert cc.motors.suppressed == {}
+
+def test_setting_changed_by_another_sender_is_sent_again(simulator, cc):
+    cc.motors.set_velocity(1, 5000)
+    with cc.batch() as batch:
+        batch.motors.set_velocity(1, 7000)
+    cc.motors.set_velocity(1, 5000)
+    assert sent(cc, "SV") == 3
+    assert simulator.motors[1].max_velocity == 5000
+
+def test_stop_is_skipped_only_while_the_motor_is_known_to_be_idle(simulator, cc):
+    cc.motors.abrupt_stop(0)
+    cc.motors.abrupt_stop(0)
+    assert cc.motors.suppressed == {"AS": 1}
+
+    cc.motors.absolute_move(0, 1_000_000)
+    cc.motors.abrupt_stop(0)
+    assert sent(cc, "AS") == 2
+    assert simulator.motors[0].status is Status.READY
+
+def test_stop_is_sent_while_a_streamed_move_is_in_flight(simulator, cc):
+    cc.motors.abrupt_stop(2)
+    with cc.motors.stream(2, rate_hz=1000, max_in_flight=4) as jog:
+        jog.step(Setpoint.now(-10000))
+        jog.flush()
+        jog.step(Setpoint.now(-10000))
+        assert cc.in_flight > 0
+        cc.motors.abrupt_stop(2)
+        assert cc.motors.suppressed == {}
+    assert simulator.motors[2].status is Status.READY
+
+def test_status_reads_update_the_model(simulator, cc):
+    cc.motors.abrupt_stop(1)
+    simulator.motors[1].move_to(1_000_000)
+    assert cc.motors.get_status(1) is Status.MOVING
+    cc.motors.abrupt_stop(1)
+    assert cc.motors.suppressed == {}
+    assert cc.motors.get_status(1) is Status.READY
+    cc.motors.abrupt_stop(1)
+    assert cc.motors.suppressed == {"AS": 1}
+
+def test_model_is_reset_on_reconnect(cc):
+    cc.motors.set_deceleration(0, 1000)
+    cc.close()
+    cc.connect()
+    cc.motors.set_deceleration(0, 1000)
+    assert sent(cc, "SD") == 2
@@ -0,0 +1,82 @@
+import socket
+from typing import Callable
+
+import pytest
+
+from clear_core import ClearCoreController, Status
+from clear_core.transport import LoopbackConnection, Transport
+
+class DroppingConnection(LoopbackConnection):
+    """A loopback connection that resets before its first response is read."""
+    def recv_into(self, buffer: memoryview) -> int:
+        raise ConnectionResetError("Connection reset by peer.")
+
+class FlakyTransport(Transport):
+    """Loopback transport whose first `drops` connections fail on their first read."""
+    def __init__(self, handler: Callable[[str], str], drops: int = 1):
+        self.handler = handler
+        self.drops = drops
+        self.opened = 0
+
+    def open(self) -> LoopbackConnection:
+        self.opened += 1
+        if self.opened <= self.drops:
+            return DroppingConnection(self.handler)
+        return LoopbackConnection(self.handler)
+
+def test_read_only_exchange_is_replayed_after_a_reconnect(simulator):
+    simulator.motors[0].position = 42
+    transport = FlakyTransport(simulator.handle)
+    with ClearCoreController(transport=transport, backoff=0) as cc:
+        assert cc.motors.get_position(0) == 42
+        assert cc.metrics.replays == 1
+        assert cc.metrics.reconnects == 1
+
+def test_write_is_not_replayed_after_a_reconnect(simulator):
+    transport = FlakyTransport(simulator.handle)
+    with ClearCoreController(transport=transport, backoff=0) as cc:
+        with pytest.raises(ConnectionAbortedError):
+            cc.motors.absolute_move(0, 100)
+        assert cc.metrics.replays == 0
+        # The connection was reopened for the next command.
+        assert cc.is_connected
+        assert cc.motors.get_status(0) is Status.MOVING
+
+def test_in_flight_commands_fail_when_the_connection_drops(simulator):
+    transport = FlakyTransport(simulator.handle)
+    with ClearCoreController(transport=transport, backoff=0) as cc:
+        pending = cc._submit(["M0GP"])[0]
+        with pytest.raises(ConnectionAbortedError):
+            cc._collect(pending)
+        with pytest.raises(OSError):
+            pending.result()
+
+def test_without_reconnecting_the_connection_is_closed(simulator):
+    transport = FlakyTransport(simulator.handle)
+    cc = ClearCoreController(transport=transport, reconnect_attempts=0)
+    cc.connect()
+    with pytest.raises(ConnectionAbortedError):
+        cc.motors.get_position(0)
+    assert not cc.is_connected
+    with pytest.raises(ConnectionError):
+        cc.motors.get_position(0)
+
+def test_failed_reconnect_raises(simulator):
+    class Unreachable(FlakyTransport):
+        def open(self):
+            if self.opened:
+                raise ConnectionRefusedError("refused")
+            return super().open()
+
+    with ClearCoreController(transport=Unreachable(simulator.handle), reconnect_attempts=2, backoff=0) as cc:
+        with pytest.raises(ConnectionError):
+            cc.motors.get_position(0)
+        assert not cc.is_connected
+        assert cc.metrics.errors >= 2
+
+def test_tcp_connect_failure_raises_connection_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with pytest.raises(ConnectionError):
+        ClearCoreController("127.0.0.1", port, connect_timeout=1).connect()
@@ -0,0 +1,38 @@
+import pytest
+
+from gc_controller import Button, DpadDirection, GameCubeController
+from gc_controller.buttons import Buttons
+from gc_controller.joystick import Joystick, JoystickDirection, _compute_direction, direction_table
+
+from .conftest import BUSY_PACKET
+
+def test_packet_decoding():
+    gc = GameCubeController()
+    assert gc._apply_packet(BUSY_PACKET)
+    assert (gc.main_stick.x, gc.main_stick.y) == (128, 20)
+    assert gc.main_stick.direction is JoystickDirection.UP
+    assert gc.c_stick.direction is JoystickDirection.DOWN_RIGHT
+    assert gc.buttons.value == Button.B | Button.START
+    assert gc.buttons.state.Start and not gc.buttons.state.A
+    assert gc.dpad.direction is DpadDirection.UP
+    assert (gc.l_trigger_analog, gc.r_trigger_analog) == (60, 90)
+    assert not gc._apply_packet(BUSY_PACKET[:4])
+
+@pytest.mark.parametrize("deadzone", [0, 30, 127])
+def test_direction_table_matches_the_branch_logic(deadzone):
+    table = direction_table(deadzone)
+    assert direction_table(deadzone) is table
+    assert all(table[(x << 8) | y] is _compute_direction(x, y, deadzone)
+               for x in range(0, 256, 5) for y in range(0, 256, 5))
+
+def test_out_of_range_stick_values_fall_back_to_the_branch_logic():
+    stick = Joystick()
+    stick.update(-10, 400)
+    assert stick.direction is JoystickDirection.DOWN_LEFT
+
+def test_button_snapshots_are_shared():
+    first, second = Buttons(), Buttons()
+    first.update(0x40 | 0x07, 0x00)
+    second.update(0x40, 0x00)
+    assert first.state is second.state
+    assert first.state.A and not first.state.B
@@ -0,0 +1,48 @@
+import io
+import time
+
+import pytest
+
+from demo_gantry.display import TerminalRenderer
+
+def test_only_changed_lines_are_redrawn():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+    renderer.render()
+    assert stream.getvalue() == ""
+
+    renderer.submit(["Hatch: Open", "Gantry: idle"])
+    renderer.render()
+    assert stream.getvalue() == "\033[2J\033[H\033[1;1HHatch: Open\033[K\033[2;1HGantry: idle\033[K"
+
+    # An unchanged frame writes nothing at all.
+    stream.seek(0)
+    stream.truncate()
+    renderer.submit(["Hatch: Open", "Gantry: idle"])
+    renderer.render()
+    assert stream.getvalue() == ""
+    assert renderer.redraws == 1
+
+    renderer.submit(["Hatch: Closing"])
+    renderer.render()
+    assert stream.getvalue() == "\033[1;1HHatch: Closing\033[K\033[2;1H\033[K"
+    assert renderer.redraws == 2
+
+def test_redraws_are_rate_limited():
+    stream = io.StringIO()
+    with TerminalRenderer(refresh_hz=20, stream=stream) as renderer:
+        started = time.monotonic()
+        frame = 0
+        while time.monotonic() - started < 0.25:
+            renderer.submit([f"tick {frame}"])
+            frame += 1
+            time.sleep(0.001)
+    elapsed = time.monotonic() - started
+    assert frame > 50
+    # One redraw per 50 ms interval, plus the final frame drawn on stop().
+    assert 2 <= renderer.redraws <= elapsed * 20 + 2
+    assert stream.getvalue().endswith(f"\033[1;1Htick {frame - 1}\033[K\033[2;1H")
+
+def test_refresh_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TerminalRenderer(refresh_hz=0)
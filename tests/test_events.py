@@ -0,0 +1,34 @@
+from gc_controller import Button, DpadDirection, EventKind, GameCubeController
+from gc_controller.events import InputEvents
+from gc_controller.joystick import JoystickDirection
+
+from .conftest import A_LEFT_PACKET, IDLE_PACKET
+
+def test_events_report_edges_only():
+    gc = GameCubeController()
+    seen = []
+    gc.events.subscribe(seen.append, kinds=[EventKind.PRESSED])
+    for packet in (IDLE_PACKET, A_LEFT_PACKET, A_LEFT_PACKET, IDLE_PACKET):
+        gc._apply_packet(packet, timestamp_ns=1)
+    events = list(gc.events)
+    assert [(e.kind, e.button) for e in events if e.button] == [
+        (EventKind.PRESSED, Button.A), (EventKind.RELEASED, Button.A)]
+    sticks = [(e.previous, e.direction) for e in events if e.kind is EventKind.MAIN_STICK]
+    assert sticks == [(JoystickDirection.CENTER, JoystickDirection.LEFT),
+                      (JoystickDirection.LEFT, JoystickDirection.CENTER)]
+    assert [e.button for e in seen] == [Button.A]
+    assert len(gc.events) == 0
+
+def test_pending_events_are_bounded_and_subscribers_can_leave():
+    events = InputEvents(max_pending=2)
+    seen = []
+    callback = events.subscribe(seen.append)
+    for direction in (DpadDirection.UP, DpadDirection.CENTER, DpadDirection.DOWN):
+        events.update(0, JoystickDirection.CENTER, JoystickDirection.CENTER, direction)
+    assert [e.direction for e in events] == [DpadDirection.CENTER, DpadDirection.DOWN]
+    assert len(seen) == 3
+
+    events.unsubscribe(callback)
+    events.update(int(Button.Z), JoystickDirection.CENTER, JoystickDirection.CENTER, DpadDirection.DOWN)
+    assert len(seen) == 3
+    assert [(e.kind, e.button) for e in events] == [(EventKind.PRESSED, Button.Z)]
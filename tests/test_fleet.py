@@ -0,0 +1,51 @@
+import socket
+from contextlib import ExitStack
+
+import pytest
+
+from clear_core import ClearCoreFleet, FleetResult, Status
+from clear_core.simulator import ClearCoreSimulator
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def test_fleet_fans_out_and_reports_unreachable_controllers():
+    with ExitStack() as stack:
+        simulators = [stack.enter_context(ClearCoreSimulator(latency=0.01)) for _ in range(3)]
+        endpoints = {f"cell{index}": sim.address for index, sim in enumerate(simulators)}
+        endpoints["offline"] = ("127.0.0.1", unused_port())
+        for index, sim in enumerate(simulators):
+            sim.motors[1].status = Status.READY
+            sim.motors[1].position = 100 * index
+
+        with ClearCoreFleet(endpoints) as fleet:
+            assert set(fleet.connect_errors) == {"offline"}
+            assert isinstance(fleet.connect_errors["offline"], ConnectionError)
+            assert not fleet["offline"].is_connected
+
+            results = fleet.run(lambda cc: cc.motors.get_position(1))
+            assert {name: result.value for name, result in results.items() if result.ok} == {
+                "cell0": 0, "cell1": 100, "cell2": 200}
+            with pytest.raises(ConnectionError):
+                results["offline"].result()
+
+        assert not any(fleet[name].is_connected for name in fleet)
+
+def test_reconnecting_clears_recovered_controllers():
+    port = unused_port()
+    fleet = ClearCoreFleet({"late": ("127.0.0.1", port)})
+    fleet.connect()
+    assert set(fleet.connect_errors) == {"late"}
+    with ClearCoreSimulator(port=port):
+        assert fleet.connect()["late"].ok
+        assert fleet.connect_errors == {}
+        fleet.close()
+
+def test_fleet_result():
+    assert FleetResult("a", 5).result() == 5
+    failed = FleetResult("b", error=ValueError("bad"))
+    assert not failed.ok
+    with pytest.raises(ValueError):
+        failed.result()
@@ -0,0 +1,118 @@
+import time
+from typing import Callable, List
+
+import pytest
+
+from clear_core import ClearCoreController, LoopbackTransport
+from clear_core.simulator import ClearCoreSimulator
+from demo_gantry.hatch import (
+    CLOSE_SENSOR_ID, HATCH_MOTOR_ID, OPEN_SENSOR_ID, PE_SENSOR_ID, HatchController, HatchState,
+)
+
+# Motor positions at which the simulated end sensors trip.
+OPEN_AT = -300
+CLOSED_AT = 300
+
+@pytest.fixture
+def hatch_sim(simulator: ClearCoreSimulator) -> ClearCoreSimulator:
+    """The simulator with the hatch's end sensors driven by the hatch motor's position."""
+    simulator.set_input(OPEN_SENSOR_ID, lambda sim: sim.motors[HATCH_MOTOR_ID].position <= OPEN_AT)
+    simulator.set_input(CLOSE_SENSOR_ID, lambda sim: sim.motors[HATCH_MOTOR_ID].position >= CLOSED_AT)
+    simulator.set_input(PE_SENSOR_ID, True)
+    return simulator
+
+def motion_log(controller: ClearCoreController) -> List[str]:
+    """Records every move and stop command the controller sends."""
+    commands: List[str] = []
+    controller.add_trace_hook(
+        lambda trace: commands.append(trace.command) if trace.opcode in ("RM", "AM", "AS") else None)
+    return commands
+
+def run_until(hatch: HatchController, condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, f"stuck in {hatch.state}"
+        hatch.update()
+        time.sleep(0.002)
+
+def idle_ticks(hatch: HatchController, ticks: int = 5) -> None:
+    for _ in range(ticks):
+        hatch.update()
+        time.sleep(0.002)
+
+def test_hatch_stops_once_in_position_and_stays_quiet(hatch_sim, controller):
+    commands = motion_log(controller)
+    hatch = HatchController(controller)
+    assert hatch.update() is HatchState.OPENING
+    run_until(hatch, lambda: hatch.state is HatchState.OPEN)
+    assert commands == ["M1RM-100000", "M1AS"]
+    assert hatch_sim.motors[HATCH_MOTOR_ID].position <= OPEN_AT
+
+    # Nothing changes, so nothing is sent.
+    idle_ticks(hatch)
+    assert commands == ["M1RM-100000", "M1AS"]
+    assert hatch.commands_sent == 2
+    assert [(t.previous, t.state) for t in hatch.transitions] == [
+        (HatchState.UNKNOWN, HatchState.OPENING), (HatchState.OPENING, HatchState.OPEN)]
+
+def test_hatch_at_rest_on_start_sends_nothing_while_idle(hatch_sim, controller):
+    hatch_sim.motors[HATCH_MOTOR_ID].position = CLOSED_AT
+    hatch_sim.set_input(PE_SENSOR_ID, False)
+    commands = motion_log(controller)
+    hatch = HatchController(controller)
+    # The state was unknown, so the motor is stopped once to be sure.
+    assert hatch.update() is HatchState.CLOSED
+    idle_ticks(hatch)
+    assert commands == ["M1AS"]
+
+def test_reversing_mid_travel_stops_before_moving_back(hatch_sim, controller):
+    commands = motion_log(controller)
+    hatch = HatchController(controller)
+    motor = hatch_sim.motors[HATCH_MOTOR_ID]
+    run_until(hatch, lambda: motor.position < OPEN_AT / 3)
+    assert hatch.state is HatchState.OPENING
+
+    hatch_sim.set_input(PE_SENSOR_ID, False)
+    assert hatch.update() is HatchState.STOPPING
+    assert commands == ["M1RM-100000", "M1AS"]
+    assert hatch.update() is HatchState.CLOSING
+    run_until(hatch, lambda: hatch.state is HatchState.CLOSED)
+    idle_ticks(hatch)
+    assert commands == ["M1RM-100000", "M1AS", "M1RM100000", "M1AS"]
+    assert [t.state for t in hatch.transitions] == [
+        HatchState.OPENING, HatchState.STOPPING, HatchState.CLOSING, HatchState.CLOSED]
+
+def test_faulted_motor_is_left_alone_until_it_recovers(hatch_sim, controller):
+    commands = motion_log(controller)
+    hatch = HatchController(controller)
+    motor = hatch_sim.motors[HATCH_MOTOR_ID]
+    run_until(hatch, lambda: motor.position < OPEN_AT / 3)
+
+    motor.fault()
+    assert hatch.update() is HatchState.FAULTED
+    idle_ticks(hatch)
+    assert hatch.state is HatchState.FAULTED
+    assert commands == ["M1RM-100000"]
+
+    # Cleared and re-enabled: travel resumes with a new move.
+    controller.motors.clear_alerts(HATCH_MOTOR_ID)
+    controller.motors.enable(HATCH_MOTOR_ID)
+    run_until(hatch, lambda: hatch.state is HatchState.OPEN)
+    assert commands == ["M1RM-100000", "M1RM-100000", "M1AS"]
+
+def test_move_is_resent_only_after_the_motion_timeout(hatch_sim):
+    def ignoring_moves(body: str) -> str:
+        # Acknowledges moves without starting them, so the motor never reports MOVING.
+        return "M1 OK" if body.startswith("M1RM") else hatch_sim.handle(body)
+
+    with ClearCoreController(transport=LoopbackTransport(ignoring_moves)) as cc:
+        commands = motion_log(cc)
+        hatch = HatchController(cc, motion_timeout=0.05)
+        assert hatch.update() is HatchState.OPENING
+        idle_ticks(hatch, 3)
+        assert commands == ["M1RM-100000"]
+
+        time.sleep(0.06)
+        hatch.update()
+        assert commands == ["M1RM-100000", "M1RM-100000"]
+        assert hatch.state is HatchState.OPENING
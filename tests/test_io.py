@@ -0,0 +1,40 @@
+import pytest
+
+from clear_core.io import INPUT_PORT_PINS, InputPins
+
+def test_set_output_pins_writes_every_pin_in_one_exchange(simulator, controller):
+    exchanges = controller.metrics.exchanges
+    responses = controller.io.set_output_pins({0: True, 3: False, 5: True})
+    assert responses == ["O0 OK", "O3 OK", "O5 OK"]
+    assert simulator.outputs == {0: True, 3: False, 5: True}
+    assert controller.metrics.exchanges == exchanges + 1
+
+    controller.io.set_output_pins({0: False})
+    assert simulator.outputs[0] is False
+
+def test_read_input_port_decodes_every_input(simulator, controller):
+    for pin in (0, 6, 12):
+        simulator.set_input(pin, True)
+    pins = controller.io.read_input_port()
+    assert pins.pins == INPUT_PORT_PINS
+    assert pins.mask == 1 << 0 | 1 << 6 | 1 << 12
+    assert pins[6] and not pins[7]
+    assert [pin for pin, high in pins if high] == [0, 6, 12]
+    assert len(pins) == 13
+    assert controller.metrics.exchanges == 1
+
+def test_bulk_io_in_a_batch(simulator, controller):
+    simulator.set_input(2, True)
+    with controller.batch() as batch:
+        written = batch.io.set_output_pins({1: True, 2: True})
+        port = batch.io.read_input_port()
+    assert written.result() == ["O1 OK", "O2 OK"]
+    assert simulator.outputs == {1: True, 2: True}
+    assert port.result().mask == 1 << 2
+
+def test_input_pins():
+    pins = InputPins([3, 1], [True, False])
+    assert repr(pins) == "InputPins(high={3}, mask=0b1000)"
+    assert list(pins) == [(3, True), (1, False)]
+    with pytest.raises(KeyError):
+        pins[2]
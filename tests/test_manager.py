@@ -0,0 +1,113 @@
+import socket
+import threading
+import time
+from typing import List
+
+import pytest
+
+from gc_controller import ControllerManager, HidrawDevice
+from gc_controller.backends import HidBackend
+from gc_controller.joystick import JoystickDirection
+
+from .conftest import A_LEFT_PACKET, IDLE_PACKET, FakeDevice
+
+class FakeBackend(HidBackend):
+    """Enumerates one adapter port per fake device."""
+    def __init__(self, devices: List[FakeDevice]):
+        self.devices = devices
+
+    def enumerate(self, vendor_id, product_id):
+        return [{"path": index, "vendor_id": vendor_id, "product_id": product_id,
+                 "product_string": "fake"} for index in range(len(self.devices))]
+
+    def open(self, info):
+        return self.devices[info["path"]]
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition never became true"
+        time.sleep(0.005)
+
+def test_threaded_reader_serves_every_port():
+    devices = [FakeDevice(), FakeDevice(), FakeDevice()]
+    with ControllerManager(backend=FakeBackend(devices)) as manager:
+        assert len(manager) == 3
+        manager.start_reader(timeout_ms=10)
+        reader = manager._reader
+        assert manager.is_reading and reader.is_running
+        with pytest.raises(RuntimeError):
+            manager.add_port(FakeDevice())
+
+        devices[2].send(A_LEFT_PACKET)
+        devices[0].send(IDLE_PACKET)
+        devices[2].send(IDLE_PACKET)
+        updated = []
+        wait_until(lambda: updated.extend(manager.read()) or len(updated) >= 2)
+        assert updated == [manager[0], manager[2]]
+        # Both packets of port 2 were applied, in order.
+        assert [e.direction for e in manager[2].events if e.direction is not None] == [
+            JoystickDirection.LEFT, JoystickDirection.CENTER]
+
+        # A failing device only takes its own port down.
+        devices[1].fail()
+        wait_until(lambda: reader.errors[1] is not None)
+        assert manager.read() == []
+        assert not manager[1].is_connected and devices[1].closed
+        assert manager[0].is_connected and manager[2].is_connected
+
+        manager.stop_reader()
+        assert not reader.is_running and not manager.is_reading
+        assert not any(t.name == "gc-controller-multi-reader" for t in threading.enumerate())
+
+        # Without the reader the ports are polled again.
+        devices[0].send(A_LEFT_PACKET)
+        assert manager.read() == [manager[0]]
+    assert all(device.closed for device in devices)
+
+def test_connect_reports_missing_or_broken_adapters():
+    with pytest.raises(ConnectionError):
+        ControllerManager(backend=FakeBackend([])).connect()
+
+    class Broken(FakeBackend):
+        def open(self, info):
+            if info["path"] == 1:
+                raise OSError("busy")
+            return super().open(info)
+
+    devices = [FakeDevice(), FakeDevice()]
+    manager = ControllerManager(backend=Broken(devices))
+    with pytest.raises(ConnectionError):
+        manager.connect()
+    assert len(manager) == 0 and devices[0].closed
+
+def test_manager_polls_every_port(hid_pair):
+    device_end, other_peer = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    other_device = HidrawDevice(fd=device_end.detach())
+    device, peer = hid_pair
+    manager = ControllerManager()
+    first = manager.add_port(device)
+    second = manager.add_port(other_device)
+    try:
+        assert len(manager) == 2 and manager[1] is second
+        assert manager.read(timeout_ms=0) == []
+        other_peer.send(A_LEFT_PACKET)
+        assert manager.read(timeout_ms=100) == [second]
+        assert second.buttons.state.A and not first.buttons.state.A
+
+        manager.start_reader(timeout_ms=10)
+        peer.send(A_LEFT_PACKET)
+        updated = []
+        wait_until(lambda: updated.extend(manager.read()) or first in updated)
+        assert first.main_stick.direction is JoystickDirection.LEFT
+        manager.stop_reader()
+
+        # A port whose device fails is closed; the others keep working.
+        other_peer.close()
+        assert manager.read(timeout_ms=100) == []
+        assert not second.is_connected and first.is_connected
+        peer.send(IDLE_PACKET)
+        assert manager.read(timeout_ms=100) == [first]
+    finally:
+        first._hid_device = None  # Closed by the fixture.
+        manager.close()
@@ -0,0 +1,40 @@
+from clear_core import Status
+from clear_core.metrics import LatencyHistogram
+
+def test_trace_hooks_and_metrics(controller):
+    traces = []
+    controller.add_trace_hook(traces.append)
+    controller.motors.get_position(0)
+    controller.io.read_input_pins([0, 1])
+    controller.remove_trace_hook(traces.append)
+    assert [(t.command, t.opcode) for t in traces] == [("M0GP", "GP"), ("I0", "I"), ("I1", "I")]
+    snapshot = controller.metrics.snapshot()
+    assert snapshot["commands"] == 3
+    assert snapshot["exchanges"] == 2
+    assert set(snapshot["latency"]) == {"GP", "I"}
+
+def test_raising_trace_hook_does_not_desynchronize_responses(simulator, controller):
+    simulator.motors[0].position = 5
+
+    def broken(trace):
+        raise RuntimeError("hook failed")
+
+    controller.add_trace_hook(broken)
+    with controller.batch() as batch:
+        status = batch.motors.get_status(0)
+        position = batch.motors.get_position(0)
+    controller.remove_trace_hook(broken)
+    assert (status.result(), position.result()) == (Status.READY, 5)
+    assert controller.motors.get_position(0) == 5
+    assert controller.metrics.hook_errors == 2
+    assert isinstance(controller.metrics.last_hook_error, RuntimeError)
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    for duration_ns in range(1000, 101000, 1000):
+        histogram.record(duration_ns)
+    assert (histogram.count, histogram.min_ns, histogram.max_ns) == (100, 1000, 100000)
+    assert 0.75 * 50000 <= histogram.percentile(50) <= 1.25 * 50000
+    assert histogram.percentile(100) == 100000
+    assert histogram.snapshot()["mean_us"] == 50.5
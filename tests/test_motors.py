@@ -0,0 +1,32 @@
+from clear_core import AxisMove, Status
+
+def test_move_axes_sends_settings_then_every_move_in_one_exchange(simulator, controller):
+    simulator.motors[2].position = 100
+    ack = controller.motors.move_axes([
+        AxisMove(0, 5000, velocity=20000, acceleration=50000),
+        AxisMove(2, -400, relative=True, deceleration=80000),
+    ])
+    assert ack.commands == ("M0SV20000", "M0SA50000", "M2SD80000", "M0AM5000", "M2RM-400")
+    assert ack.responses == ("M0 OK", "M0 OK", "M2 OK", "M0 OK", "M2 OK")
+    assert ack.ok
+    assert controller.metrics.exchanges == 1
+
+    first, third = simulator.motors[0], simulator.motors[2]
+    assert (first.status, first.target, first.max_velocity, first.acceleration) == (
+        Status.MOVING, 5000, 20000, 50000)
+    assert (third.status, third.target, third.deceleration) == (Status.MOVING, -300, 80000)
+
+def test_move_axes_reports_a_rejected_axis(simulator, controller):
+    simulator.motors[1].status = Status.DISABLED
+    ack = controller.motors.move_axes([AxisMove(0, 100), AxisMove(1, 100)])
+    assert ack.responses == ("M0 OK", "M1 ERR")
+    assert not ack.ok
+    # The other axis still moves.
+    assert simulator.motors[0].status is Status.MOVING
+    assert simulator.motors[1].status is Status.DISABLED
+
+def test_move_axes_in_a_batch(simulator, controller):
+    with controller.batch() as batch:
+        pending = batch.motors.move_axes([AxisMove(3, 10), AxisMove(9, 10)])
+    assert pending.result().responses == ("M3 OK", "M9 ERR")
+    assert not pending.result().ok
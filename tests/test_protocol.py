@@ -0,0 +1,72 @@
+import pytest
+
+from clear_core.protocol import FrameReader, encode_command, is_rejected, parse_int
+
+def chunked(data: bytes, size: int):
+    """Returns a recv_into function that delivers `data` at most `size` bytes at a time."""
+    offset = 0
+
+    def recv_into(buffer: memoryview) -> int:
+        nonlocal offset
+        chunk = data[offset:offset + min(size, len(buffer))]
+        buffer[:len(chunk)] = chunk
+        offset += len(chunk)
+        return len(chunk)
+
+    return recv_into
+
+def test_encode_command():
+    assert encode_command("M1GP") == b"\x02M1GP\x13"
+
+@pytest.mark.parametrize("frame, offset, expected", [
+    (b"M1 1500", 3, 1500),
+    (b"M1 -1500", 3, -1500),
+    (b"M1 +7", 3, 7),
+    (b"M1   42 ", 3, 42),
+    (b"0", 0, 0),
+])
+def test_parse_int(frame, offset, expected):
+    assert parse_int(memoryview(frame), offset) == expected
+
+@pytest.mark.parametrize("frame", [b"M1 OK", b"M1 ", b"M1 -", b"M1 12x"])
+def test_parse_int_rejects_non_integers(frame):
+    with pytest.raises(ValueError):
+        parse_int(frame, 3)
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 4096])
+def test_frames_are_reassembled_from_any_fragmentation(size):
+    stream = b"\x02M1 1500\x13" + b"M2 OK\r\n" + b"\x02I0 1\x13\r\n" + b"M3 -2\x13"
+    reader = FrameReader(size=16)
+    recv_into = chunked(stream, size)
+    frames = [bytes(reader.read_frame(recv_into)) for _ in range(4)]
+    assert frames == [b"M1 1500", b"M2 OK", b"I0 1", b"M3 -2"]
+    assert reader.buffered == 0
+
+def test_end_of_stream_raises_connection_error():
+    reader = FrameReader()
+    with pytest.raises(ConnectionError):
+        reader.read_frame(chunked(b"M1 15", 64))
+
+def test_buffer_grows_while_an_earlier_frame_is_still_referenced():
+    long_payload = b"M0 " + b"7" * 100
+    reader = FrameReader(size=8)
+    recv_into = chunked(b"M0 1\x13" + long_payload + b"\x13", 4)
+    first = reader.read_frame(recv_into)
+    assert bytes(first) == b"M0 1"
+    # `first` still holds a view of the buffer while it has to grow.
+    assert bytes(reader.read_frame(recv_into)) == long_payload
+
+def test_feed_and_next_frame():
+    reader = FrameReader(size=4)
+    reader.feed(b"\x02M1 1")
+    assert reader.next_frame() is None
+    reader.feed(b"2\x13M1 OK\x13")
+    assert bytes(reader.next_frame()) == b"M1 12"
+    assert bytes(reader.next_frame()) == b"M1 OK"
+    assert reader.next_frame() is None
+    assert reader.bytes_received == 13
+
+def test_is_rejected():
+    assert is_rejected("M1 ERR")
+    assert not is_rejected("M1 OK")
+    assert not is_rejected("M1 -5")
@@ -0,0 +1,64 @@
+import time
+
+from gc_controller import Button, EventKind, GameCubeController
+from gc_controller.reader import BackgroundReader, PacketRingBuffer, PacketSample
+
+from .conftest import A_LEFT_PACKET, IDLE_PACKET, FakeDevice
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition never became true"
+        time.sleep(0.005)
+
+def test_ring_buffer_counts_dropped_packets():
+    buffer = PacketRingBuffer(capacity=2)
+    for index in range(5):
+        buffer.append(PacketSample(index, IDLE_PACKET))
+    assert [sample.timestamp_ns for sample in buffer.drain()] == [3, 4]
+    assert buffer.dropped == 3
+    assert buffer.drain() == []
+
+def test_ring_buffer_latest_skips_older_samples():
+    buffer = PacketRingBuffer(capacity=4)
+    assert buffer.latest() is None
+    buffer.append(PacketSample(1, IDLE_PACKET))
+    buffer.append(PacketSample(2, A_LEFT_PACKET))
+    assert buffer.latest().timestamp_ns == 2
+    assert buffer.latest() is None
+    assert buffer.dropped == 0
+
+def test_background_reader_captures_every_packet():
+    device = FakeDevice()
+    gc = GameCubeController()
+    gc._hid_device = device
+    gc.start_reader(timeout_ms=10)
+    try:
+        for packet in (IDLE_PACKET, A_LEFT_PACKET, IDLE_PACKET):
+            device.send(packet)
+        samples = []
+        wait_until(lambda: samples.extend(gc.drain()) or len(samples) == 3)
+        assert [sample.data for sample in samples] == [IDLE_PACKET, A_LEFT_PACKET, IDLE_PACKET]
+        pressed = [e for e in gc.events if e.kind is EventKind.PRESSED]
+        assert [e.button for e in pressed] == [Button.A]
+        assert gc.dropped_packets == 0
+    finally:
+        gc.stop_reader()
+    assert not gc.is_reading
+
+def test_device_error_stops_the_reader_and_disconnects():
+    device = FakeDevice()
+    reader = BackgroundReader(device, PacketRingBuffer(), timeout_ms=10)
+    reader.start()
+    device.fail()
+    wait_until(lambda: not reader.is_running)
+    assert isinstance(reader.error, OSError)
+    reader.stop()
+
+    gc = GameCubeController()
+    gc._hid_device = device
+    gc.start_reader(timeout_ms=10)
+    device.fail()
+    wait_until(lambda: not gc._reader.is_running)
+    assert gc.drain() == []
+    assert not gc.is_connected and device.closed
@@ -0,0 +1,138 @@
+import array
+import json
+import os
+import struct
+import threading
+import time
+
+import pytest
+
+from clear_core import Status
+from demo_gantry.recorder import (
+    MAGIC, UNKNOWN_STATUS, VERSION, TelemetryRecorder, _array_typecode, read_telemetry,
+)
+from gc_controller import Button, GameCubeController
+
+from .conftest import A_LEFT_PACKET
+
+def test_batched_capture_round_trip(tmp_path, simulator, controller):
+    prefix = os.path.join(str(tmp_path), "run")
+    simulator.motors[1].position = -40
+    simulator.set_input(3, True)
+    gc = GameCubeController()
+    gc._apply_packet(A_LEFT_PACKET)
+    with TelemetryRecorder(prefix, motors=[0, 1], pins=[2, 3], block_rows=2) as recorder:
+        for tick in range(5):
+            recorder.capture(controller, gc, timestamp_ns=100 + tick)
+    assert recorder.rows_recorded == 5 and recorder.rows_dropped == 0
+    assert recorder.files == [prefix + "-0000.gctl"]
+
+    columns = read_telemetry(recorder.files)
+    assert list(columns["timestamp_ns"]) == [100, 101, 102, 103, 104]
+    assert set(columns["m1_position"]) == {-40}
+    assert set(columns["m0_status"]) == {int(Status.READY)}
+    assert set(columns["pins"]) == {1 << 3}
+    assert set(columns["buttons"]) == {int(Button.A)}
+    assert set(columns["main_x"]) == {0}
+
+def test_telemetry_capture_uses_the_cache(tmp_path, simulator, controller):
+    prefix = os.path.join(str(tmp_path), "run")
+    simulator.motors[0].position = 8
+    telemetry = controller.start_telemetry(motors=[0], pins=[0], rate_hz=200)
+    deadline = time.monotonic() + 2
+    while telemetry.poll_count == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    with TelemetryRecorder(prefix, motors=[0], pins=[0]) as recorder:
+        recorder.capture(controller)
+        recorder.append(1, [3], [None], 0)
+    controller.stop_telemetry()
+
+    columns = read_telemetry(recorder.files)
+    assert list(columns["m0_position"]) == [8, 3]
+    assert list(columns["m0_status"]) == [int(Status.READY), UNKNOWN_STATUS]
+    assert set(columns["buttons"]) == {0}
+
+def test_a_timestamp_of_zero_is_kept(tmp_path, controller):
+    with TelemetryRecorder(os.path.join(str(tmp_path), "run"), motors=[0]) as recorder:
+        recorder.capture(controller, timestamp_ns=0)
+        recorder.capture(controller)
+    timestamps = list(read_telemetry(recorder.files)["timestamp_ns"])
+    assert timestamps[0] == 0 and timestamps[1] > 0
+
+def test_columns_have_a_fixed_width_on_disk(tmp_path):
+    with TelemetryRecorder(os.path.join(str(tmp_path), "run"), motors=[0], pins=[1]) as recorder:
+        for tick in range(3):
+            recorder.append(tick, [-tick], [Status.READY], 0b10)
+    assert recorder.columns[:4] == [("timestamp_ns", "Q"), ("m0_position", "q"), ("m0_status", "B"), ("pins", "I")]
+    with open(recorder.files[0], "rb") as f:
+        data = f.read()
+    magic, version, schema_size = struct.unpack_from("<6sHI", data)
+    assert (magic, version) == (MAGIC, VERSION)
+    assert json.loads(data[12:12 + schema_size])["columns"] == [list(column) for column in recorder.columns]
+
+    # One block: its header, then each column's three values at their standard sizes.
+    offset = 12 + schema_size
+    assert struct.unpack_from("<4sI", data, offset) == (b"BLCK", 3)
+    offset += 8
+    assert struct.unpack_from("<3Q", data, offset) == (0, 1, 2)
+    assert struct.unpack_from("<3q", data, offset + 24) == (0, -1, -2)
+    row_size = sum(struct.calcsize("<" + column_type) for _, column_type in recorder.columns)
+    assert len(data) == offset + 3 * row_size
+
+@pytest.mark.parametrize("column_type", ["b", "B", "h", "H", "i", "I", "q", "Q"])
+def test_column_types_map_to_arrays_of_the_same_size(column_type):
+    assert array.array(_array_typecode(column_type)).itemsize == struct.calcsize("<" + column_type)
+    with pytest.raises(ValueError):
+        _array_typecode("d")
+
+def test_files_are_rotated_and_numbering_continues(tmp_path):
+    prefix = os.path.join(str(tmp_path), "run")
+    with TelemetryRecorder(prefix, motors=[0], block_rows=4, max_file_bytes=512) as recorder:
+        for tick in range(40):
+            recorder.append(tick, [tick], [Status.READY], 0)
+    assert len(recorder.files) > 1
+    assert all(os.path.getsize(path) <= 512 for path in recorder.files)
+    assert list(read_telemetry(recorder.files)["m0_position"]) == list(range(40))
+
+    with TelemetryRecorder(prefix, motors=[0]) as later:
+        later.append(0, [0], [None], 0)
+    assert later.files == [f"{prefix}-{len(recorder.files):04d}.gctl"]
+
+def test_blocks_are_dropped_when_the_writer_falls_behind(tmp_path):
+    prefix = os.path.join(str(tmp_path), "run")
+    release = threading.Event()
+    recorder = TelemetryRecorder(prefix, motors=[0], block_rows=1, max_pending_blocks=1)
+    write_block = recorder._write_block
+
+    def slow_write(columns):
+        release.wait(2)
+        write_block(columns)
+
+    recorder._write_block = slow_write
+    for tick in range(10):
+        recorder.append(tick, [tick], [None], 0)
+    release.set()
+    recorder.close()
+    assert recorder.rows_dropped > 0
+    assert recorder.rows_recorded + recorder.rows_dropped == 10
+    assert len(read_telemetry(recorder.files)["timestamp_ns"]) == recorder.rows_recorded
+
+def test_truncated_trailing_block_is_ignored(tmp_path):
+    prefix = os.path.join(str(tmp_path), "run")
+    with TelemetryRecorder(prefix, motors=[0], block_rows=2) as recorder:
+        for tick in range(4):
+            recorder.append(tick, [tick], [None], 0)
+    path = recorder.files[0]
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 1)
+    assert list(read_telemetry([path])["timestamp_ns"]) == [0, 1]
+
+def test_foreign_files_are_rejected(tmp_path):
+    path = os.path.join(str(tmp_path), "run-0000.gctl")
+    with open(path, "wb") as f:
+        f.write(b"x" * 64)
+    with pytest.raises(ValueError):
+        read_telemetry([path])
+    with pytest.raises(ValueError):
+        TelemetryRecorder(os.path.join(str(tmp_path), "bad"), pins=[32])
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from gc_controller import Button, GameCubeController
+from gc_controller.joystick import JoystickDirection
+from gc_controller.recording import HEADER_SIZE, RECORD_SIZE, PacketLog, PacketRecorder, ReplayDevice
+
+from .conftest import A_LEFT_PACKET, BUSY_PACKET, IDLE_PACKET
+
+def test_record_and_replay_round_trip(tmp_path):
+    path = os.path.join(str(tmp_path), "session.gcrec")
+    packets = [IDLE_PACKET, A_LEFT_PACKET, BUSY_PACKET]
+    gc = GameCubeController()
+    gc.start_recording(path)
+    for index, packet in enumerate(packets):
+        gc._apply_packet(packet, timestamp_ns=1000 + index)
+    gc.stop_recording()
+
+    with PacketLog(path) as log:
+        assert len(log) == 3
+        assert [bytes(sample.data) for sample in log] == packets
+        assert log[-1].timestamp_ns == 1002
+        with pytest.raises(IndexError):
+            log[3]
+
+    with GameCubeController.replay(path, realtime=False) as replay:
+        directions = []
+        while replay.read(timeout_ms=0):
+            directions.append(replay.main_stick.direction)
+        assert directions == [JoystickDirection.CENTER, JoystickDirection.LEFT, JoystickDirection.UP]
+        assert replay.buttons.value == Button.B | Button.START
+
+def test_recording_appends_and_ignores_a_partial_record(tmp_path):
+    path = os.path.join(str(tmp_path), "session.gcrec")
+    for timestamp_ns in (1, 2):
+        with PacketRecorder(path) as recorder:
+            recorder.write(timestamp_ns, IDLE_PACKET)
+        assert recorder.records_written == 1
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD_SIZE - 1))
+    assert os.path.getsize(path) == HEADER_SIZE + 3 * RECORD_SIZE - 1
+    with PacketLog(path) as log:
+        assert [sample.timestamp_ns for sample in log] == [1, 2]
+
+def test_looping_replay(tmp_path):
+    path = os.path.join(str(tmp_path), "session.gcrec")
+    with PacketRecorder(path) as recorder:
+        recorder.write(0, A_LEFT_PACKET)
+    device = ReplayDevice(path, realtime=False, loop=True)
+    assert [bytes(device.read(64)) for _ in range(3)] == [A_LEFT_PACKET] * 3
+    assert not device.finished
+    device.close()
+
+def test_recording_rejects_foreign_files(tmp_path):
+    path = os.path.join(str(tmp_path), "not-a-recording")
+    with open(path, "wb") as f:
+        f.write(b"x" * 32)
+    with pytest.raises(ValueError):
+        PacketLog(path)
+    with pytest.raises(ValueError):
+        PacketRecorder(path)
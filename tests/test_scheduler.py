@@ -0,0 +1,83 @@
+from typing import List, Sequence
+
+import pytest
+
+from demo_gantry import scheduler
+from demo_gantry.scheduler import FixedRateScheduler, OverrunPolicy
+
+MS = 1_000_000
+
+class FakeClock:
+    """Stands in for the scheduler's clock; time only moves when ticks or sleeps advance it."""
+    def __init__(self):
+        self.now = 0
+
+    def perf_counter_ns(self) -> int:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += round(seconds * 1e9)
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler, "time", fake)
+    return fake
+
+def run_ticks(clock: FakeClock, loop: FixedRateScheduler, durations_ms: Sequence[int]) -> List[float]:
+    """Runs one tick per duration, each taking that long; returns the tick start times in ms."""
+    starts: List[float] = []
+
+    def tick() -> None:
+        starts.append(clock.now / MS)
+        clock.now += durations_ms[len(starts) - 1] * MS
+
+    loop.run(tick, max_ticks=len(durations_ms))
+    return starts
+
+@pytest.mark.parametrize("overrun_ms, resume_ms, skipped", [(25, 30, 2), (45, 50, 4), (11, 20, 1)])
+def test_skip_drops_missed_deadlines_and_stays_on_the_grid(clock, overrun_ms, resume_ms, skipped):
+    loop = FixedRateScheduler(rate_hz=100)
+    starts = run_ticks(clock, loop, [overrun_ms, 1, 1])
+    # Ticks resume on start + n * period, not one period after the slow tick ended.
+    assert starts == [0, resume_ms, resume_ms + 10]
+    assert loop.stats.ticks == 3
+    assert loop.stats.overruns == 1
+    assert loop.stats.skipped == skipped
+    assert loop.stats.durations.max_ns == overrun_ms * MS
+
+def test_catch_up_runs_missed_ticks_back_to_back(clock):
+    loop = FixedRateScheduler(rate_hz=100, policy=OverrunPolicy.CATCH_UP)
+    starts = run_ticks(clock, loop, [25, 1, 1, 1, 1])
+    # Two late ticks run immediately, then the loop is back on its deadlines.
+    assert starts == [0, 25, 26, 30, 40]
+    assert loop.stats.overruns == 2
+    assert loop.stats.skipped == 0
+    assert loop.stats.jitter.max_ns == 15 * MS
+
+def test_catch_up_is_capped(clock):
+    loop = FixedRateScheduler(rate_hz=100, policy=OverrunPolicy.CATCH_UP, max_catch_up=2)
+    starts = run_ticks(clock, loop, [35, 1, 1, 1, 1])
+    # After two catch-up ticks the rest of the backlog is skipped.
+    assert starts == [0, 35, 36, 40, 50]
+    assert loop.stats.overruns == 3
+    assert loop.stats.skipped == 1
+
+def test_run_stops_on_false_or_stop(clock):
+    loop = FixedRateScheduler(rate_hz=1000)
+    results = iter([None, True, False, True])
+    loop.run(lambda: next(results))
+    assert loop.stats.ticks == 3
+
+    loop.run(loop.stop)
+    assert loop.stats.ticks == 4
+    assert loop.stats.snapshot()["ticks"] == 4
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        FixedRateScheduler(rate_hz=0)
+
+def test_a_tick_that_ends_on_its_deadline_is_not_an_overrun(clock):
+    loop = FixedRateScheduler(rate_hz=100)
+    assert run_ticks(clock, loop, [10, 10, 1]) == [0, 10, 20]
+    assert loop.stats.overruns == 0
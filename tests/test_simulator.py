@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from clear_core import ClearCoreController
+from clear_core.motors import Status
+from clear_core.simulator import ClearCoreSimulator
+
+def wait_for_status(cc: ClearCoreController, motor: int, status: Status, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while cc.motors.get_status(motor) is not status:
+        assert time.monotonic() < deadline, f"motor {motor} never became {status.name}"
+        time.sleep(0.01)
+
+def test_motor_lifecycle_over_fragmented_tcp():
+    with ClearCoreSimulator(fragment_size=1, latency=0.001, jitter=0.001, seed=1) as sim, \
+            ClearCoreController(*sim.address) as cc:
+        assert cc.motors.get_status(1) is Status.DISABLED
+        assert cc.motors.absolute_move(1, 100) == "M1 ERR"
+
+        cc.motors.enable(1)
+        wait_for_status(cc, 1, Status.READY)
+        cc.motors.set_velocity(1, 50000)
+        assert cc.motors.absolute_move(1, 500) == "M1 OK"
+        assert cc.motors.get_status(1) is Status.MOVING
+        wait_for_status(cc, 1, Status.READY)
+        assert cc.motors.get_position(1) == 500
+
+        cc.motors.relative_move(1, -200)
+        wait_for_status(cc, 1, Status.READY)
+        assert cc.motors.get_position(1) == 300
+
+def test_abrupt_stop_halts_a_move(simulator, controller):
+    controller.motors.absolute_move(0, 1_000_000)
+    controller.motors.abrupt_stop(0)
+    assert controller.motors.get_status(0) is Status.READY
+    position = controller.motors.get_position(0)
+    time.sleep(0.02)
+    assert controller.motors.get_position(0) == position
+
+def test_inputs_and_outputs(simulator, controller):
+    simulator.set_input(3, True)
+    simulator.set_input(4, lambda sim: sim.motors[0].position > 0)
+    pins = controller.io.read_input_pins([2, 3, 4])
+    assert (pins[2], pins[3], pins[4]) == (False, True, False)
+
+    simulator.motors[0].position = 10
+    assert controller.io.read_input_pin(4) is True
+    controller.io.set_output_pin(5, True)
+    assert simulator.outputs[5] is True
+
+def test_unknown_commands_are_rejected(simulator):
+    assert simulator.handle("M9EN") == "M9 ERR"
+    assert simulator.handle("XX") == "XX ERR"
+
+def test_address_requires_a_running_server():
+    with pytest.raises(RuntimeError):
+        ClearCoreSimulator().address
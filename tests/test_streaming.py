@@ -0,0 +1,73 @@
+import pytest
+
+from clear_core import Setpoint, Status, StreamMode
+
+def command_log(controller):
+    commands = []
+    controller.add_trace_hook(lambda trace: commands.append(trace.command))
+    return commands
+
+def test_velocity_stream_targets_ahead_of_the_motor_and_stops_on_exit(simulator, controller):
+    simulator.motors[1].position = 1000
+    commands = command_log(controller)
+    with controller.motors.stream(1, rate_hz=100, max_in_flight=2, horizon=0.1,
+                                  limits=(-500, 1500)) as jog:
+        jog.step(Setpoint.now(2000))
+        jog.flush()
+        assert (jog.position, jog.status) == (1000, Status.READY)
+        jog.step(Setpoint.now(2000))
+        jog.flush()
+        assert commands[-4:] == ["M1SV2000", "M1AM1200", "M1GS", "M1GP"]
+
+        # Targets are clamped to the limits.
+        jog.step(Setpoint.now(20000))
+        jog.flush()
+        assert "M1AM1500" in commands
+    assert commands[-3:] == ["M1AS", "M1GS", "M1GP"]
+    assert jog.stats.ticks == 3
+
+def test_position_stream_skips_unchanged_targets(controller):
+    with controller.motors.stream(0, mode=StreamMode.POSITION, rate_hz=100) as stream:
+        for _ in range(3):
+            stream.step(Setpoint.now(250))
+        stream.flush()
+    assert stream.stats.sent == 1
+    assert stream.stats.skipped == 2
+
+def test_stale_setpoints_are_dropped(controller):
+    with controller.motors.stream(0, mode=StreamMode.POSITION, rate_hz=100, max_age=0.01) as stream:
+        stream.step(Setpoint(250, 0.0))
+    assert stream.stats.dropped == 1
+    assert stream.stats.sent == 0
+
+def test_setpoints_are_blocked_while_the_motor_is_not_ready(simulator, controller):
+    simulator.motors[0].status = Status.DISABLED
+    with controller.motors.stream(0, mode=StreamMode.POSITION, rate_hz=100) as stream:
+        stream.step(Setpoint.now(1))
+        stream.flush()
+        stream.step(Setpoint.now(2))
+    assert stream.stats.blocked == 1
+    assert stream.stats.sent == 1
+
+def test_run_streams_an_iterable(controller):
+    stream = controller.motors.stream(0, mode=StreamMode.POSITION, rate_hz=1000)
+    stats = stream.run(Setpoint.now(value) for value in range(10, 60, 10))
+    assert stats.ticks == 5
+    assert stats.sent == 5
+    assert controller.in_flight == 0
+
+def test_stream_needs_a_controller(controller):
+    with pytest.raises(TypeError):
+        controller.batch().motors.stream(0)
+
+def test_submitted_commands_resolve_before_the_next_exchange(simulator, controller):
+    simulator.motors[3].position = 77
+    pending = controller._submit(["M3GP", "M3GS"])
+    assert controller.in_flight == 2
+    assert controller.motors.get_position(3) == 77
+    assert controller.in_flight == 0
+    assert [p.result() for p in pending] == ["M3 77", "M3 3"]
+
+    later = controller._submit(["M3GP"])[0]
+    controller._collect(later)
+    assert later.result() == "M3 77"
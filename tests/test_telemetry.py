@@ -0,0 +1,45 @@
+import time
+from typing import List
+
+from clear_core import ClearCoreController, LoopbackTransport
+
+def test_telemetry_serves_reads_from_its_cache(simulator, controller):
+    simulator.motors[1].position = 9
+    telemetry = controller.start_telemetry(motors=[1], pins=[0], rate_hz=200)
+    deadline = time.monotonic() + 2
+    while telemetry.poll_count == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    commands = controller.metrics.commands
+    assert telemetry.get_position(1, max_staleness=60) == 9
+    assert telemetry.read_input_pin(0, max_staleness=60) is False
+    assert telemetry.refresh_count == 0
+    controller.stop_telemetry()
+    assert controller.telemetry is None
+    assert controller.metrics.commands >= commands
+
+def test_telemetry_keeps_polling_after_a_malformed_response(simulator):
+    corrupt: List[bool] = [True]
+
+    def handler(body: str) -> str:
+        if corrupt[0] and body == "M1GP":
+            return "M1 OK"
+        return simulator.handle(body)
+
+    with ClearCoreController(transport=LoopbackTransport(handler)) as cc:
+        telemetry = cc.start_telemetry(motors=[0, 1], rate_hz=200)
+        deadline = time.monotonic() + 2
+        while telemetry.poll_count < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        assert telemetry.is_running
+        assert isinstance(telemetry.last_error, ValueError)
+        # Every other value is still refreshed.
+        assert telemetry.age("M0GP") < 1
+        assert telemetry.age("M1GP") == float("inf")
+
+        corrupt[0] = False
+        while telemetry.age("M1GP") == float("inf"):
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        assert telemetry.get_position(1, max_staleness=60) == 0
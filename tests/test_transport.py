@@ -0,0 +1,50 @@
+import os
+import socket
+
+import pytest
+
+from clear_core import ClearCoreController, LoopbackTransport, TcpTransport, UnixTransport
+from clear_core.protocol import encode_command
+from clear_core.simulator import ClearCoreSimulator
+from clear_core.transport import Transport
+
+def test_transport_without_open_cannot_be_created():
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_loopback_connection_answers_on_write(simulator):
+    connection = LoopbackTransport(simulator.handle).open()
+    buffer = memoryview(bytearray(64))
+    with pytest.raises(socket.timeout):
+        connection.recv_into(buffer)
+    # One command split across two writes is executed once it is complete.
+    connection.sendall(encode_command("M0GP")[:3])
+    connection.sendall(encode_command("M0GP")[3:] + encode_command("I1"))
+    size = connection.recv_into(buffer)
+    assert bytes(buffer[:size]) == b"M0 0\x13I1 0\x13"
+    connection.close()
+    with pytest.raises(ConnectionError):
+        connection.sendall(encode_command("M0GP"))
+
+def test_tcp_transport_tunes_the_socket():
+    with ClearCoreSimulator() as sim:
+        transport = TcpTransport(*sim.address, read_timeout=0.5)
+        sock = transport.open()
+        try:
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            assert sock.gettimeout() == 0.5
+        finally:
+            sock.close()
+        assert str(transport) == "{}:{}".format(*sim.address)
+
+def test_unix_socket(tmp_path):
+    path = os.path.join(str(tmp_path), "clearcore.sock")
+    with ClearCoreSimulator(unix_path=path) as sim, \
+            ClearCoreController(transport=UnixTransport(path)) as cc:
+        sim.motors[2].position = -1500
+        assert cc.motors.get_position(2) == -1500
+    assert not os.path.exists(path)